@@ -0,0 +1,70 @@
+"""Benchmark time sliced background map evaluation.
+
+Compares `~gammapy.cube.make_map_background_irf` at the mean observation
+time with the evaluation averaged over time slices, for the first call
+(FOV coordinates not cached) and for repeated calls, and prints the
+run times and the relative difference of the total background::
+
+    python background_time_slices.py
+"""
+from time import time
+import numpy as np
+from astropy.coordinates import SkyCoord
+from gammapy.data import DataStore
+from gammapy.maps import WcsGeom, MapAxis
+from gammapy.cube import make_map_background_irf
+from gammapy.cube import background
+
+
+def make_geom():
+    axis = MapAxis.from_edges(np.logspace(-1, 2, 21), unit="TeV", name="energy", interp="log")
+    return WcsGeom.create(
+        skydir=SkyCoord(0, -1, unit="deg", frame="galactic"),
+        binsz=0.02,
+        width=(6, 6),
+        coordsys="GAL",
+        axes=[axis],
+    )
+
+
+def run(obs, geom, n_time_slices, repeat=3):
+    kwargs = dict(
+        pointing=obs.fixed_pointing_info,
+        ontime=obs.observation_time_duration,
+        bkg=obs.bkg,
+        geom=geom,
+        n_time_slices=n_time_slices,
+    )
+    del background._fov_cache[:]
+
+    t_start = time()
+    bkg = make_map_background_irf(**kwargs)
+    t_first = time() - t_start
+
+    times = []
+    for _ in range(repeat):
+        t_start = time()
+        make_map_background_irf(**kwargs)
+        times.append(time() - t_start)
+
+    return bkg, t_first, min(times)
+
+
+def main():
+    data_store = DataStore.from_dir("$GAMMAPY_DATA/cta-1dc/index/gps/")
+    obs = data_store.obs(110380)
+    geom = make_geom()
+
+    reference, _, _ = run(obs, geom, None)
+    for n_time_slices in [None, 1, 4, 16]:
+        bkg, t_first, t_repeat = run(obs, geom, n_time_slices)
+        diff = bkg.data.sum() / reference.data.sum() - 1
+        print(
+            "n_time_slices={:4s} first {:8.3f} s repeated {:8.3f} s diff {:10.3g}".format(
+                str(n_time_slices), t_first, t_repeat, diff
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
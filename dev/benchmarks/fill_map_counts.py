@@ -0,0 +1,66 @@
+"""Benchmark counts map filling from event lists.
+
+Compares the direct-binning path of `~gammapy.cube.fill_map_counts` for
+regular WCS geometries with the generic ``Map.fill_by_coord`` path and
+prints the event rate of both::
+
+    python fill_map_counts.py
+"""
+from time import time
+import numpy as np
+import astropy.units as u
+from astropy.table import Table
+from gammapy.data import EventList
+from gammapy.maps import Map, MapAxis
+from gammapy.cube import fill_map_counts
+
+
+def make_events(n_events, random_state=0):
+    rng = np.random.RandomState(random_state)
+    table = Table()
+    table["RA"] = rng.normal(266.4, 2, n_events) * u.deg
+    table["DEC"] = rng.normal(-28.9, 2, n_events) * u.deg
+    table["ENERGY"] = 10 ** rng.uniform(-1, 2, n_events) * u.TeV
+    return EventList(table)
+
+
+def make_map(coordsys):
+    axis = MapAxis.from_bounds(0.1, 100, nbin=20, interp="log", name="energy", unit="TeV")
+    return Map.create(
+        skydir=(266.4, -28.9) if coordsys == "CEL" else (0, 0),
+        binsz=0.02,
+        width=10,
+        coordsys=coordsys,
+        axes=[axis],
+    )
+
+
+def fill_by_coord(counts, events):
+    counts.fill_by_coord(events._get_coord_from_geom(counts.geom))
+
+
+def run(func, counts, events, repeat=3):
+    times = []
+    for _ in range(repeat):
+        counts.data[...] = 0
+        t_start = time()
+        func(counts, events)
+        times.append(time() - t_start)
+    return min(times)
+
+
+def main(n_events=int(1e7)):
+    events = make_events(n_events)
+    for coordsys in ["CEL", "GAL"]:
+        counts = make_map(coordsys)
+        for name, func in [("fill_map_counts", fill_map_counts), ("fill_by_coord", fill_by_coord)]:
+            duration = run(func, counts, events)
+            print(
+                "{:4s} {:16s} {:8.3f} s {:10.3g} events / s".format(
+                    coordsys, name, duration, n_events / duration
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
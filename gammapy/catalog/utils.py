@@ -297,6 +297,15 @@ def select_sky_box(table, lon_lim, lat_lim, frame="icrs", inverted=False):
     ...                                     frame='icrs')
     """
     skycoord = skycoord_from_table(table)
+    mask = _sky_box_mask(skycoord, lon_lim, lat_lim, frame)
+    if inverted:
+        mask = np.invert(mask)
+
+    return table[mask]
+
+
+def _sky_box_mask(skycoord, lon_lim, lat_lim, frame="icrs"):
+    """Mask of sky positions inside a lon / lat box (see `select_sky_box`)."""
     skycoord = skycoord.transform_to(frame)
     lon = skycoord.data.lon
     lat = skycoord.data.lat
@@ -308,11 +317,7 @@ def select_sky_box(table, lon_lim, lat_lim, frame="icrs", inverted=False):
 
     lon_mask = (lon_lim[0] <= lon) & (lon < lon_lim[1])
     lat_mask = (lat_lim[0] <= lat) & (lat < lat_lim[1])
-    mask = lon_mask & lat_mask
-    if inverted:
-        mask = np.invert(mask)
-
-    return table[mask]
+    return lon_mask & lat_mask
 
 
 def select_sky_circle(table, lon_cen, lat_cen, radius, frame="icrs", inverted=False):
@@ -353,14 +358,18 @@ def select_sky_circle(table, lon_cen, lat_cen, radius, frame="icrs", inverted=Fa
     ...                                        frame='galactic')
     """
     skycoord = skycoord_from_table(table)
+    mask = _sky_circle_mask(skycoord, lon_cen, lat_cen, radius, frame)
+    if inverted:
+        mask = np.invert(mask)
+
+    return table[mask]
+
+
+def _sky_circle_mask(skycoord, lon_cen, lat_cen, radius, frame="icrs"):
+    """Mask of sky positions inside a circle (see `select_sky_circle`)."""
     skycoord = skycoord.transform_to(frame)
     # no need to wrap lon angleshere, since the SkyCoord separation
     # method takes care of it
     center = SkyCoord(lon_cen, lat_cen, frame=frame)
     ang_distance = skycoord.separation(center)
-
-    mask = ang_distance < radius
-    if inverted:
-        mask = np.invert(mask)
-
-    return table[mask]
+    return ang_distance < radius
@@ -1,6 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from astropy.coordinates import SkyOffsetFrame
+from astropy.coordinates import SkyOffsetFrame, AltAz, Angle
 from ..data import FixedPointingInfo
 from ..maps import WcsNDMap
 from ..utils.coordinates import sky_to_fov
@@ -8,7 +8,9 @@ from ..utils.coordinates import sky_to_fov
 __all__ = ["make_map_background_irf"]
 
 
-def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None):
+def make_map_background_irf(
+    pointing, ontime, bkg, geom, oversampling=None, n_time_slices=None
+):
     """Compute background map from background IRFs.
 
     Parameters
@@ -27,6 +29,11 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None):
         Reference geometry
     oversampling: int
         Oversampling factor in energy, used for the background model evaluation.
+    n_time_slices : int, optional
+        If given, the observation is split into this number of equal time
+        slices and the background is averaged over the FOV coordinates at
+        the slice centers, which takes the rotation of the FOV during the
+        observation into account. Requires a ``FixedPointingInfo``.
 
     Returns
     -------
@@ -34,11 +41,7 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None):
         Background predicted counts sky cube in reco energy
     """
     # TODO:
-    #  This implementation can be improved in two ways:
-    #  1. Create equal time intervals between TSTART and TSTOP and sum up the
-    #  background IRF for each interval. This is instead of multiplying by
-    #  the total ontime. This then handles the rotation of the FoV.
-    #  2. Use the pointing table (does not currently exist in CTA files) to
+    #  Use the pointing table (does not currently exist in CTA files) to
     #  obtain the RA DEC and time for each interval. This then considers that
     #  the pointing might change slightly over the observation duration
 
@@ -46,8 +49,44 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None):
     if oversampling is not None:
         geom = geom.upsample(factor=oversampling, axis="energy")
 
-    map_coord = geom.to_image().get_coord()
-    sky_coord = map_coord.skycoord
+    energies = geom.get_axis_by_name("energy").edges
+
+    if n_time_slices is not None:
+        if not isinstance(pointing, FixedPointingInfo):
+            raise ValueError("Time slices require a FixedPointingInfo pointing.")
+
+        fov_lon, fov_lat = _get_fov_coords_time_sliced(
+            pointing, geom.to_image(), n_time_slices
+        )
+
+        # evaluate all slices at once, with axes (energy, slice, lat, lon)
+        bkg_de = bkg.evaluate_integrate(
+            fov_lon=fov_lon,
+            fov_lat=fov_lat,
+            energy_reco=energies[:, np.newaxis, np.newaxis, np.newaxis],
+        )
+        bkg_de = bkg_de.mean(axis=1)
+    else:
+        fov_lon, fov_lat = _get_fov_coords(pointing, geom.to_image())
+        bkg_de = bkg.evaluate_integrate(
+            fov_lon=fov_lon,
+            fov_lat=fov_lat,
+            energy_reco=energies[:, np.newaxis, np.newaxis],
+        )
+
+    d_omega = geom.solid_angle()
+    data = (bkg_de * d_omega * ontime).to_value("")
+    bkg_map = WcsNDMap(geom, data=data)
+
+    if oversampling is not None:
+        bkg_map = bkg_map.downsample(factor=oversampling, axis="energy")
+
+    return bkg_map
+
+
+def _get_fov_coords(pointing, geom):
+    """FOV coordinates of the map pixels, at the mean observation time."""
+    sky_coord = geom.get_coord().skycoord
 
     if isinstance(pointing, FixedPointingInfo):
         altaz_coord = sky_coord.transform_to(pointing.altaz_frame)
@@ -63,22 +102,55 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None):
         fov_lon = pseudo_fov_coord.lon
         fov_lat = pseudo_fov_coord.lat
 
-    energies = geom.get_axis_by_name("energy").edges
+    return fov_lon, fov_lat
+
 
-    bkg_de = bkg.evaluate_integrate(
-        fov_lon=fov_lon,
-        fov_lat=fov_lat,
-        energy_reco=energies[:, np.newaxis, np.newaxis],
+def _get_fov_coords_time_sliced(pointing, geom, n_time_slices):
+    """FOV coordinates of the map pixels at the centers of equal time slices.
+
+    The map coordinates are transformed to AltAz for all slices in one
+    batched transformation. The results have the axes (slice, lat, lon).
+    """
+    fraction = (np.arange(n_time_slices) + 0.5) / n_time_slices
+    obstime = pointing.time_start + pointing.duration * fraction
+    frame = AltAz(obstime=obstime[:, np.newaxis, np.newaxis], location=pointing.location)
+
+    sky_coord = geom.get_coord().skycoord
+    altaz_coord = sky_coord[np.newaxis].transform_to(frame)
+
+    frame_pointing = AltAz(obstime=obstime, location=pointing.location)
+    altaz_pointing = pointing.radec.transform_to(frame_pointing)
+
+    fov_lon, fov_lat = _sky_to_fov_broadcast(
+        altaz_coord.az,
+        altaz_coord.alt,
+        altaz_pointing.az[:, np.newaxis, np.newaxis],
+        altaz_pointing.alt[:, np.newaxis, np.newaxis],
     )
+    return fov_lon, fov_lat
 
-    d_omega = geom.solid_angle()
-    data = (bkg_de * d_omega * ontime).to_value("")
-    bkg_map = WcsNDMap(geom, data=data)
 
-    if oversampling is not None:
-        bkg_map = bkg_map.downsample(factor=oversampling, axis="energy")
+def _sky_to_fov_broadcast(lon, lat, lon_pnt, lat_pnt):
+    """Same as `~gammapy.utils.coordinates.sky_to_fov`, for array valued pointings.
 
-    return bkg_map
+    The rotation to the frame centered on the pointing position is computed
+    directly, since `~astropy.coordinates.SkyOffsetFrame` requires a scalar
+    origin.
+    """
+    dlon = lon - lon_pnt
+    x = np.cos(lat) * np.cos(dlon)
+    y = np.cos(lat) * np.sin(dlon)
+    z = np.sin(lat)
+
+    x_fov = x * np.cos(lat_pnt) + z * np.sin(lat_pnt)
+    z_fov = -x * np.sin(lat_pnt) + z * np.cos(lat_pnt)
+
+    fov_lon = Angle(np.arctan2(y, x_fov)).wrap_at("180d")
+    fov_lat = Angle(np.arcsin(np.clip(z_fov, -1, 1)))
+
+    # Switch sign of longitude angle since this axis is
+    # reversed in our definition of the FoV-system
+    return -fov_lon, fov_lat
 
 
 def _fov_background_norm(acceptance_map, counts_map, exclusion_mask=None):
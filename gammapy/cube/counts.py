@@ -1,4 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from functools import lru_cache
+import numpy as np
+from astropy.units import Quantity
+from astropy.coordinates import SkyCoord
+from ..data import EventListBase
+from ..maps import WcsGeom
+from ..maps.geom import pix_tuple_to_idx
 
 __all__ = ["fill_map_counts"]
 
@@ -10,15 +17,19 @@ def fill_map_counts(counts_map, events):
     For all other map axes, an event list table column with the same name
     has to be present (case-insensitive compare), or a KeyError will be raised.
 
-    Note that this function is just a thin wrapper around the sky map
+    For regular WCS geometries the events are binned directly from the
+    event list table columns with a single `~numpy.bincount`. For all other
+    geometries this function is just a thin wrapper around the sky map
     ``fill_by_coord`` method. For more complex scenarios, use that directly.
 
     Parameters
     ----------
     counts_map : `~gammapy.maps.Map`
         Map object, will be filled by this function.
-    events : `~gammapy.data.EventList`
-        Event list
+    events : `~gammapy.data.EventList` or iterable of `~gammapy.data.EventList`
+        Event list. If an iterable of event lists is given, e.g. the blocks
+        returned by `~gammapy.data.EventListBase.read_chunks`, the counts
+        are accumulated over all of them.
 
     Examples
     --------
@@ -48,5 +59,74 @@ def fill_map_counts(counts_map, events):
     It works for IACT and Fermi-LAT events, for WCS or HEALPix map geometries,
     and also for extra axes. Especially energy axes are automatically handled correctly.
     """
-    coord = events._get_coord_from_geom(counts_map.geom)
-    counts_map.fill_by_coord(coord)
+    if isinstance(events, EventListBase):
+        events = [events]
+
+    geom = counts_map.geom
+    for chunk in events:
+        if isinstance(geom, WcsGeom) and geom.is_regular:
+            _fill_map_counts_wcs(counts_map, chunk.table)
+        else:
+            coord = chunk._get_coord_from_geom(geom)
+            counts_map.fill_by_coord(coord)
+
+
+def _fill_map_counts_wcs(counts_map, table):
+    """Fill events table into a map with regular WCS geometry.
+
+    The sky coordinates are projected once with the WCS of the map, the
+    non-spatial axes are binned from the table columns and all events are
+    accumulated with a single `~numpy.bincount` on the flat data index.
+    Binning is identical to ``counts_map.fill_by_coord``.
+    """
+    geom = counts_map.geom
+    lon, lat = _table_lonlat(table, geom.coordsys)
+    pix = list(geom.wcs.wcs_world2pix(lon, lat, 0))
+
+    cols = {k.upper(): v for k, v in table.columns.items()}
+    for axis in geom.axes:
+        try:
+            col = cols[axis.name.upper()]
+        except KeyError:
+            raise KeyError("Column not found in event list: {!r}".format(axis.name))
+        pix.append(axis.coord_to_pix(Quantity(col).to(axis.unit)))
+
+    idx = pix_tuple_to_idx(pix)
+    shape = geom._shape
+    valid = np.ones(len(table), dtype=bool)
+    for idx_dim, n in zip(idx, shape):
+        valid &= (idx_dim >= 0) & (idx_dim < n)
+
+    idx_flat = np.ravel_multi_index([_[valid] for _ in idx[::-1]], geom.data_shape)
+    counts = np.bincount(idx_flat, minlength=counts_map.data.size)
+    counts_map.data += counts.reshape(geom.data_shape).astype(counts_map.data.dtype)
+
+
+def _table_lonlat(table, coordsys):
+    """Event sky coordinates in the given system as arrays in deg.
+
+    For ``coordsys='GAL'`` the ICRS unit vectors are rotated with a
+    precomputed matrix, so no `~astropy.coordinates.SkyCoord` per event
+    is created.
+    """
+    ra = Quantity(table["RA"], "deg", copy=False).to_value("deg")
+    dec = Quantity(table["DEC"], "deg", copy=False).to_value("deg")
+
+    if coordsys == "CEL":
+        return ra, dec
+
+    ra, dec = np.deg2rad(ra), np.deg2rad(dec)
+    cos_dec = np.cos(dec)
+    xyz = np.stack([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)])
+    x, y, z = np.dot(_icrs_to_galactic_matrix(), xyz)
+    lon = np.rad2deg(np.arctan2(y, x)) % 360
+    lat = np.rad2deg(np.arctan2(z, np.hypot(x, y)))
+    return lon, lat
+
+
+@lru_cache(maxsize=None)
+def _icrs_to_galactic_matrix():
+    # ICRS to Galactic is a pure rotation, its matrix columns are the
+    # transformed unit vectors, so it only has to be computed once
+    unit = SkyCoord([0, 90, 0], [0, 0, 90], unit="deg", frame="icrs")
+    return unit.galactic.cartesian.xyz.value
@@ -1,14 +1,24 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from collections import OrderedDict
 import numpy as np
-import astropy.units as u
 import astropy.io.fits as fits
 from ..irf import EnergyDispersion
+from ..irf.energy_dispersion import _integrate_migra
 from ..maps import Map
+from .irf_map import _offset_lookup, _stack_exposure_weighted
 
 __all__ = ["make_edisp_map", "EDispMap"]
 
 
-def make_edisp_map(edisp, pointing, geom, max_offset, exposure_map=None):
+def make_edisp_map(
+    edisp,
+    pointing,
+    geom,
+    max_offset,
+    exposure_map=None,
+    offset_binsz=None,
+    dtype="float64",
+):
     """Make a edisp map for a single observation
 
     Expected axes : migra and true energy in this specific order
@@ -28,6 +38,12 @@ def make_edisp_map(edisp, pointing, geom, max_offset, exposure_map=None):
     exposure_map : `~gammapy.maps.Map`, optional
         the associated exposure map.
         default is None
+    offset_binsz : `~astropy.coordinates.Angle`, optional
+        If given, the energy dispersion is evaluated once per offset bin of
+        this size and the values are assigned to the pixels by their offset,
+        instead of evaluating it at every pixel.
+    dtype : str
+        Data type of the map, e.g. "float32" to halve its memory use.
 
     Returns
     -------
@@ -42,9 +58,14 @@ def make_edisp_map(edisp, pointing, geom, max_offset, exposure_map=None):
     separations = pointing.separation(geom.to_image().get_coord().skycoord)
     valid = np.where(separations < max_offset)
 
+    if offset_binsz is None:
+        offset, idx = separations[valid], slice(None)
+    else:
+        offset, idx = _offset_lookup(separations[valid], offset_binsz)
+
     # Compute EDisp values
     edisp_values = edisp.data.evaluate(
-        offset=separations[valid],
+        offset=offset,
         e_true=energy[:, np.newaxis],
         migra=migra[:, np.newaxis, np.newaxis],
     )
@@ -53,10 +74,16 @@ def make_edisp_map(edisp, pointing, geom, max_offset, exposure_map=None):
     edisp_values = np.transpose(edisp_values, axes=(1, 0, 2))
 
     # Create Map and fill relevant entries
-    edispmap = Map.from_geom(geom, unit="")
-    edispmap.data[:, :, valid[0], valid[1]] += edisp_values.to_value(edispmap.unit)
+    # the EDispMap stores a copy of the input map, fill the copy to not
+    # allocate the map twice (the pages of the zero input are never touched)
+    data = np.zeros(geom.data_shape, dtype=dtype)
+    edispmap = EDispMap(Map.from_geom(geom, data=data, unit=""), exposure_map)
+    edisp_values = edisp_values.to_value(edispmap.edisp_map.unit)
+
+    for data_energy, values in zip(edispmap.edisp_map.data, edisp_values):
+        data_energy[:, valid[0], valid[1]] = values[:, idx]
 
-    return EDispMap(edispmap, exposure_map)
+    return edispmap
 
 
 class EDispMap:
@@ -70,6 +97,8 @@ class EDispMap:
     exposure_map : `~gammapy.maps.Map`, optional
         Associated exposure map. Needs to have a consistent map geometry.
 
+    Copies of both maps are stored, because `stack` modifies them in place.
+
     Examples
     --------
     ::
@@ -108,12 +137,19 @@ class EDispMap:
         # Get an Energy Dispersion (1D) at any position in the image
         pos = SkyCoord(2.0, 2.5, unit="deg")
         e_reco = np.logspace(-1.0, 1.0, 10) * u.TeV
-        edisp = edisp_map.get_energy_dispersion(pos=pos, e_reco=e_reco)
+        edisp = edisp_map.get_energy_dispersion(position=pos, e_reco=e_reco)
+
+        # Get energy dispersion matrices at several positions at once
+        positions = SkyCoord([2.0, 1.0], [2.5, -1.0], unit="deg")
+        matrices = edisp_map.get_energy_dispersion_matrix(positions, e_reco)
 
         # Write map to disk
         edisp_map.write("edisp_map.fits")
     """
 
+    cumulative_cache_size = 1024
+    """Maximum number of pixels with cached cumulative migration integrals."""
+
     def __init__(self, edisp_map, exposure_map):
         if edisp_map.geom.axes[1].name.upper() != "ENERGY":
             raise ValueError("Incorrect energy axis position in input Map")
@@ -121,7 +157,6 @@ class EDispMap:
         if edisp_map.geom.axes[0].name.upper() != "MIGRA":
             raise ValueError("Incorrect migra axis position in input Map")
 
-        self.edisp_map = edisp_map
 
         if exposure_map is not None:
             # First adapt geometry, keep only energy axis
@@ -131,7 +166,14 @@ class EDispMap:
                     "EDispMap and exposure_map have inconsistent geometries"
                 )
 
+        # `stack` modifies the maps in place, so copies are stored
+        self.edisp_map = edisp_map.copy()
+
+        if exposure_map is not None:
+            exposure_map = exposure_map.copy()
+
         self.exposure_map = exposure_map
+        self._cumulative_cache = OrderedDict()
 
     @classmethod
     def from_hdulist(
@@ -225,58 +267,14 @@ class EDispMap:
         edisp : `~gammapy.irf.EnergyDispersion`
             the energy dispersion (i.e. rmf object)
         """
-        # TODO: reduce code duplication with EnergyDispersion2D.get_response
         if position.size != 1:
             raise ValueError(
                 "EnergyDispersion can be extracted at one single position only."
+                " Use get_energy_dispersion_matrix for several positions."
             )
 
-        # axes ordering fixed. Could be changed.
-        pix_ener = np.arange(self.edisp_map.geom.axes[1].nbin)
-
-        # Define a vector of migration with mig_step step
-        mrec_min = self.edisp_map.geom.axes[0].edges[0]
-        mrec_max = self.edisp_map.geom.axes[0].edges[-1]
-        mig_array = np.arange(mrec_min, mrec_max, migra_step)
-        pix_migra = (mig_array - mrec_min) / mrec_max * self.edisp_map.geom.axes[0].nbin
-
-        # Convert position to pixels
-        pix_lon, pix_lat = self.edisp_map.geom.to_image().coord_to_pix(position)
-
-        # Build the pixels tuple
-        pix = np.meshgrid(pix_lon, pix_lat, pix_migra, pix_ener)
-        # Interpolate in the EDisp map. Squeeze to remove dimensions of length 1
-        edisp_values = np.squeeze(
-            self.edisp_map.interp_by_pix(pix)
-            * u.Unit(self.edisp_map.unit)  # * migra_step
-        )
-        e_trues = self.edisp_map.geom.axes[1].center
-        data = []
-
-        for i, e_true in enumerate(e_trues):
-            # We now perform integration over migra
-            # The code is adapted from `~gammapy.EnergyDispersion2D.get_response`
-
-            # migration value of e_reco bounds
-            migra_e_reco = e_reco / e_true
-
-            # Compute normalized cumulative sum to prepare integration
-            tmp = np.nan_to_num(
-                np.cumsum(edisp_values[:, i]) / np.sum(edisp_values[:, i])
-            )
-
-            # Determine positions (bin indices) of e_reco bounds in migration array
-            pos_mig = np.digitize(migra_e_reco, mig_array) - 1
-            # We ensure that no negative values are found
-            pos_mig = np.maximum(pos_mig, 0)
-
-            # We compute the difference between 2 successive bounds in e_reco
-            # to get integral over reco energy bin
-            integral = np.diff(tmp[pos_mig])
-
-            data.append(integral)
+        data = self.get_energy_dispersion_matrix(position, e_reco, migra_step)
 
-        data = np.asarray(data)
         # EnergyDispersion uses edges of true energy bins
         e_true_edges = self.edisp_map.geom.axes[1].edges
 
@@ -288,54 +286,132 @@ class EDispMap:
             e_true_hi=e_hi,
             e_reco_lo=ereco_lo,
             e_reco_hi=ereco_hi,
-            data=data,
+            data=data.reshape(data.shape[-2:]),
         )
 
-    def stack(self, other):
-        """Stack EdispMap with another one.
+    def get_energy_dispersion_matrix(self, position, e_reco, migra_step=5e-3):
+        """Get energy dispersion matrices at an array of positions.
 
-        The current EdispMap is unchanged and a new one is created and returned.
+        All positions and true energy bins are integrated at once. The
+        cumulative migration integrals are computed only for the map pixels
+        next to the positions and cached per pixel and ``migra_step``, for at
+        most ``cumulative_cache_size`` pixels. The map data must therefore not
+        be modified in place afterwards.
 
         Parameters
         ----------
-        other : `~gammapy.cube.EDispMap`
-            the edispmap to be stacked with this one.
+        position : `~astropy.coordinates.SkyCoord`
+            the target positions.
+        e_reco : `~astropy.units.Quantity`
+            Reconstructed energy axis binning
+        migra_step : float
+            Integration step in migration
 
         Returns
         -------
-        new : `~gammapy.cube.EDispMap`
-            the stacked edispmap
+        data : `~numpy.ndarray`
+            Energy dispersion matrices, with the shape of ``position`` plus
+            a true and a reco energy axis.
         """
-        if self.exposure_map is None or other.exposure_map is None:
-            raise ValueError("Missing exposure map for EdispMap.stack")
+        pix_lon, pix_lat = self.edisp_map.geom.to_image().coord_to_pix(position)
+        ny, nx = self.edisp_map.data.shape[-2:]
+        idx_lat, idx_lon, weights = _bilinear_weights(pix_lon, pix_lat, nx, ny)
 
-        # Reproject other exposure
-        exposure_coord = self.exposure_map.geom.get_coord()
-        reproj_exposure = Map.from_geom(
-            self.exposure_map.geom, unit=self.exposure_map.unit
-        )
-        reproj_exposure.fill_by_coord(
-            exposure_coord, other.exposure_map.get_by_coord(exposure_coord)
+        # Only the cumulative integrals of the neighbouring pixels are needed
+        pixels, inverse = np.unique(
+            np.stack([idx_lat.ravel(), idx_lon.ravel()]), axis=1, return_inverse=True
         )
+        migra, cumulative = self._get_cumulative(migra_step, *pixels)
+        cumulative = cumulative[inverse.reshape(idx_lat.shape)]
+        cumulative = np.sum(cumulative * weights[..., np.newaxis, np.newaxis], axis=0)
 
-        # Reproject other psfmap using same geom
-        edispmap_coord = self.edisp_map.geom.get_coord()
-        reproj_edispmap = Map.from_geom(self.edisp_map.geom, unit=self.edisp_map.unit)
-        reproj_edispmap.fill_by_coord(
-            edispmap_coord, other.edisp_map.get_by_coord(edispmap_coord)
-        )
+        # migration value of e_reco bounds, for all true energies
+        e_true = self.edisp_map.geom.axes[1].center[:, np.newaxis]
+        migra_e_reco = (e_reco / e_true).to_value("")
+
+        return _integrate_migra(cumulative, migra, migra_e_reco)
+
+    def _get_cumulative(self, migra_step, idx_lat, idx_lon):
+        """Cumulative sum of the migration pdf over a regular migration grid.
 
-        exposure = self.exposure_map.quantity[:, np.newaxis, :, :]
-        stacked_edisp_quantity = self.edisp_map.quantity * exposure
+        Computed for the given pixels and all true energies at once. The
+        result has the axes (pixel, energy, migra). The results are kept in
+        a least recently used cache of ``cumulative_cache_size`` pixels.
+        """
+        migra_axis, energy_axis = self.edisp_map.geom.axes
+
+        # Define a vector of migration with mig_step step
+        mrec_min, mrec_max = migra_axis.edges[0], migra_axis.edges[-1]
+        migra = np.arange(mrec_min, mrec_max, migra_step)
+
+        cache = self._cumulative_cache
+        keys = [
+            (migra_step, lat, lon) for lat, lon in zip(idx_lat.tolist(), idx_lon.tolist())
+        ]
+        missing = [key for key in keys if key not in cache]
+
+        computed = {}
+        if missing:
+            _, lat, lon = np.array(missing).T
+            pix = (
+                lon.astype(int)[:, np.newaxis, np.newaxis],
+                lat.astype(int)[:, np.newaxis, np.newaxis],
+                migra_axis.coord_to_pix(migra),
+                np.arange(energy_axis.nbin)[:, np.newaxis],
+            )
+            values = np.clip(self.edisp_map.interp_by_pix(pix), 0, None)
+            computed = dict(zip(missing, np.cumsum(values, axis=-1)))
 
-        other_exposure = reproj_exposure.quantity[:, np.newaxis, :, :]
-        stacked_edisp_quantity += reproj_edispmap.quantity * other_exposure
+        cumulative = np.stack([computed.get(key, cache.get(key)) for key in keys])
 
-        total_exposure = exposure + other_exposure
-        stacked_edisp_quantity /= total_exposure
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+        cache.update(computed)
+        while len(cache) > self.cumulative_cache_size:
+            cache.popitem(last=False)
+
+        return migra, cumulative
+
+    def stack(self, other):
+        """Stack EDispMap with another one, in place.
 
-        reproj_edispmap.quantity = stacked_edisp_quantity
-        # We need to remove the extra axis in the total exposure
-        reproj_exposure.quantity = total_exposure[:, 0, :, :]
+        The other EDispMap is projected on the current EDispMap geometry.
+        The maps are averaged weighted with their exposure, and the exposure
+        maps are summed.
 
-        return EDispMap(reproj_edispmap, reproj_exposure)
+        Parameters
+        ----------
+        other : `~gammapy.cube.EDispMap`
+            the edispmap to be stacked with this one.
+        """
+        if self.exposure_map is None or other.exposure_map is None:
+            raise ValueError("Missing exposure map for EDispMap.stack")
+
+        _stack_exposure_weighted(
+            self.edisp_map, self.exposure_map, other.edisp_map, other.exposure_map
+        )
+        self._cumulative_cache.clear()
+
+
+def _bilinear_weights(pix_lon, pix_lat, nx, ny):
+    """Neighbouring pixels and weights for a bilinear interpolation in an image.
+
+    Pixel coordinates outside the image are clipped to the image. The
+    returned arrays have a leading axis of length four for the four
+    neighbouring pixels, followed by the shape of the pixel coordinates.
+    """
+    pix_lon = np.clip(pix_lon, 0, nx - 1)
+    pix_lat = np.clip(pix_lat, 0, ny - 1)
+
+    x0 = np.minimum(np.floor(pix_lon).astype(int), max(nx - 2, 0))
+    y0 = np.minimum(np.floor(pix_lat).astype(int), max(ny - 2, 0))
+    x1, y1 = np.minimum(x0 + 1, nx - 1), np.minimum(y0 + 1, ny - 1)
+    wx, wy = pix_lon - x0, pix_lat - y0
+
+    idx_lat = np.stack([y0, y0, y1, y1])
+    idx_lon = np.stack([x0, x1, x0, x1])
+    weights = np.stack(
+        [(1 - wx) * (1 - wy), wx * (1 - wy), (1 - wx) * wy, wx * wy]
+    )
+    return idx_lat, idx_lon, weights
@@ -1,12 +1,16 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
+from astropy.coordinates import Angle
 from ..spectrum.models import PowerLaw
 from ..maps import WcsNDMap
 
 __all__ = ["make_map_exposure_true_energy"]
 
 
-def make_map_exposure_true_energy(pointing, livetime, aeff, geom):
+def make_map_exposure_true_energy(pointing, livetime, aeff, geom, offset_step=None):
     """Compute exposure map.
 
     This map has a true energy axis, the exposure is not combined
@@ -22,28 +26,96 @@ def make_map_exposure_true_energy(pointing, livetime, aeff, geom):
         Effective area
     geom : `~gammapy.maps.WcsGeom`
         Map geometry (must have an energy axis)
+    offset_step : `~astropy.coordinates.Angle`, optional
+        If given, the effective area is evaluated per energy on a regular
+        offset grid with this step and linearly interpolated to the pixel
+        offsets. The offset grid tables are cached and reused for effective
+        areas with identical data, e.g. for observations sharing an IRF.
 
     Returns
     -------
     map : `~gammapy.maps.WcsNDMap`
         Exposure map
     """
-    offset = geom.separation(pointing)
     energy = geom.get_axis_by_name("energy").center
 
-    exposure = aeff.data.evaluate(
-        offset=offset, energy=energy[:, np.newaxis, np.newaxis]
-    )
-    # TODO: Improve IRF evaluate to preserve energy axis if length 1
-    # For now, we handle that case via this hack:
-    if len(exposure.shape) < 3:
-        exposure = np.expand_dims(exposure.value, 0) * exposure.unit
+    if offset_step is None:
+        offset = geom.separation(pointing)
+        exposure = aeff.data.evaluate(
+            offset=offset, energy=energy[:, np.newaxis, np.newaxis]
+        )
+        # TODO: Improve IRF evaluate to preserve energy axis if length 1
+        # For now, we handle that case via this hack:
+        if len(exposure.shape) < 3:
+            exposure = np.expand_dims(exposure.value, 0) * exposure.unit
+    else:
+        idx, weights = _get_offset_weights(geom, pointing, Angle(offset_step))
+        table = _get_aeff_offset_table(aeff, energy, Angle(offset_step), idx.max() + 2)
+        exposure = table[:, idx] * (1 - weights) + table[:, idx + 1] * weights
 
     exposure = (exposure * livetime).to("m2 s")
 
     return WcsNDMap(geom, exposure.value, unit=exposure.unit)
 
 
+AEFF_TABLE_CACHE_SIZE = 8
+"""Maximum number of cached effective area offset grid tables."""
+
+_aeff_table_cache = OrderedDict()
+_aeff_table_cache_lock = threading.Lock()
+
+
+def _get_offset_weights(geom, pointing, offset_step):
+    """Offset grid indices and interpolation weights of the pixels."""
+    pix = (geom.separation(pointing) / offset_step).to_value("")
+    idx = np.floor(pix).astype(int)
+    weights = pix - idx
+    return idx, weights
+
+
+def _get_aeff_offset_table(aeff, energy, offset_step, n_offset):
+    """Effective area on a regular offset grid, for all energies (cached).
+
+    The returned table has at least ``n_offset`` offset bins. The number of
+    bins is rounded up to a power of two and a cached table with more bins is
+    reused, so the table is shared by observations with different pointings.
+    """
+    data = aeff.data
+    digest = hashlib.sha1(data.data.value.tobytes())
+    for axis in data.axes:
+        digest.update(axis.edges.value.tobytes())
+        digest.update("{} {} {}".format(axis.name, axis.unit, axis.interp).encode())
+    digest.update(repr(sorted(data.interp_kwargs.items())).encode())
+
+    key = (
+        digest.hexdigest(),
+        str(data.data.unit),
+        energy.to_value("TeV").tobytes(),
+        offset_step.deg,
+    )
+
+    with _aeff_table_cache_lock:
+        table = _aeff_table_cache.get(key)
+        if table is not None and table.shape[1] >= n_offset:
+            _aeff_table_cache.move_to_end(key)
+            return table
+
+    n_offset = 2 ** int(np.ceil(np.log2(n_offset)))
+    offset = np.arange(n_offset) * offset_step
+    table = data.evaluate(offset=offset, energy=energy[:, np.newaxis])
+
+    with _aeff_table_cache_lock:
+        cached = _aeff_table_cache.get(key)
+        if cached is not None and cached.shape[1] >= n_offset:
+            table = cached
+        _aeff_table_cache[key] = table
+        _aeff_table_cache.move_to_end(key)
+        while len(_aeff_table_cache) > AEFF_TABLE_CACHE_SIZE:
+            _aeff_table_cache.popitem(last=False)
+
+    return table
+
+
 def _map_spectrum_weight(map, spectrum=None):
     """Weight a map with a spectrum.
 
@@ -5,7 +5,8 @@ from astropy.utils import lazyproperty
 import astropy.units as u
 from astropy.nddata.utils import NoOverlapError
 from ..utils.fitting import Parameters, Dataset
-from ..stats import cash, cstat, cash_sum_cython, cstat_sum_cython
+from ..utils.fitting.instrumentation import record
+from ..stats import cash, cstat, cash_derivative, cash_sum_cython, cstat_sum_cython
 from ..maps import Map, MapAxis
 from .models import SkyModel, SkyModels
 
@@ -63,6 +64,7 @@ class MapDataset(Dataset):
             raise ValueError("mask data must have dtype bool")
 
         self.evaluation_mode = evaluation_mode
+        self._instrumentation = None
         self.model = model
         self.counts = counts
         self.exposure = exposure
@@ -96,10 +98,25 @@ class MapDataset(Dataset):
 
         for component in model.skymodels:
             evaluator = MapEvaluator(component, evaluation_mode=self.evaluation_mode)
+            evaluator.instrumentation = self.instrumentation
             evaluators.append(evaluator)
 
         self._evaluators = evaluators
 
+    @property
+    def instrumentation(self):
+        """Instrumentation (`~gammapy.utils.fitting.Instrumentation`).
+
+        Is passed on to the model evaluators.
+        """
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation):
+        self._instrumentation = instrumentation
+        for evaluator in self._evaluators:
+            evaluator.instrumentation = instrumentation
+
     @property
     def parameters(self):
         """List of parameters (`~gammapy.utils.fitting.Parameters`)"""
@@ -125,28 +142,44 @@ class MapDataset(Dataset):
         return self.counts.data.shape
 
     def npred(self):
-        """Predicted source and background counts (`~gammapy.maps.Map`)."""
-        if self.background_model:
-            npred_total = self.background_model.evaluate()
-        else:
-            npred_total = Map.from_geom(self._geom)
+        """Predicted source and background counts (`~gammapy.maps.Map`).
+
+        The predicted counts of every model component are cached and only
+        re-computed if parameters of the component changed. The cached counts
+        are summed into a new float64 array on every call, so the result does
+        not depend on the history of previous calls.
+        """
+        npred_total = Map.from_geom(self._geom, data=np.zeros(self._geom.data_shape))
 
         for evaluator in self._evaluators:
             # if the model component drifts out of its support the evaluator has
-            # has to be updated
+            # has to be updated, which invalidates its cached npred
             if evaluator.needs_update:
                 evaluator.update(self.exposure, self.psf, self.edisp, self._geom)
 
-            npred = evaluator.compute_npred()
+            npred = evaluator.compute_npred_cached()
 
             # avoid slow fancy indexing, when the shape is equivalent
             if npred.data.shape == npred_total.data.shape:
-                npred_total += npred.data
+                npred_total.data += npred.data
             else:
                 npred_total.data[evaluator.coords_idx] += npred.data
 
+        if self.background_model:
+            with record(self.instrumentation, "background", "MapDataset"):
+                npred_total.data += self.background_model.evaluate().data
+
         return npred_total
 
+    @property
+    def npred_cache_stats(self):
+        """Cache hits and misses of the model component npred, summed over components (dict)."""
+        stats = {"hits": 0, "misses": 0}
+        for evaluator in self._evaluators:
+            for key in stats:
+                stats[key] += evaluator.cache_stats[key]
+        return stats
+
     def likelihood_per_bin(self):
         """Likelihood per bin given the current model parameters"""
         return self._stat(n_on=self.counts.data, mu_on=self.npred().data)
@@ -163,21 +196,73 @@ class MapDataset(Dataset):
         mask : `~numpy.ndarray`
             Mask to be combined with the dataset mask.
         """
+        with record(self.instrumentation, "npred", "MapDataset"):
+            npred = self.npred().data
+
+        if self.mask is not None:
+            mask = self.mask.data if mask is None else mask & self.mask.data
+
+        with record(self.instrumentation, "stat_sum", "MapDataset"):
+            return self._stat_sum(self._counts_data, npred, mask)
+
+    def likelihood_gradient(self, parameters, mask=None):
+        """Derivatives of the total likelihood w.r.t. the parameter values.
+
+        The derivatives of the predicted counts of the model components
+        and the background model are chained with the derivative of the
+        likelihood per bin.
+
+        Parameters
+        ----------
+        mask : `~numpy.ndarray`
+            Mask to be combined with the dataset mask.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives, ordered like ``self.parameters.parameters``.
+            Entries of frozen parameters are zero.
+        """
         counts, npred = self._counts_data, self.npred().data
 
-        # TODO: add mask handling to _stat_sum, so that the temp copy
-        # created by the fancy indexing is avoided
-        if self.mask is None and mask is None:
-            stat = self._stat_sum(counts.ravel(), npred.ravel())
-        elif self.mask is None:
-            stat = self._stat_sum(counts[mask], npred[mask])
-        elif mask is None:
-            stat = self._stat_sum(counts[self.mask.data], npred[self.mask.data])
-        else:
-            mask_joined = mask & self.mask.data
-            stat = self._stat_sum(counts[mask_joined], npred[mask_joined])
+        if self.mask is not None:
+            mask = self.mask.data if mask is None else mask & self.mask.data
+
+        dstat = cash_derivative(counts, npred)
+
+        if mask is not None:
+            dstat = dstat * mask
+
+        gradient = {}
+
+        for evaluator in self._evaluators:
+            npred_gradient = evaluator.compute_npred_gradient()
+            parameters_ = evaluator.model.parameters.parameters
+            dstat_evaluator = None
+
+            for par, grad in zip(parameters_, npred_gradient):
+                if grad is None:
+                    continue
+
+                if dstat_evaluator is None:
+                    # avoid slow fancy indexing, when the shape is equivalent
+                    if grad.shape == dstat.shape:
+                        dstat_evaluator = dstat
+                    else:
+                        dstat_evaluator = dstat[evaluator.coords_idx]
+
+                value = np.sum(dstat_evaluator * grad)
+                gradient[id(par)] = gradient.get(id(par), 0) + value
+
+        if self.background_model:
+            models = getattr(self.background_model, "models", [self.background_model])
+            for model in models:
+                for par, grad in zip(model.parameters.parameters, model.evaluate_gradient()):
+                    if not par.frozen:
+                        value = np.sum(dstat * grad)
+                        gradient[id(par)] = gradient.get(id(par), 0) + value
 
-        return stat
+        return np.array([gradient.get(id(par), 0.0) for par in self.parameters.parameters])
 
 
 class MapEvaluator:
@@ -205,6 +290,10 @@ class MapEvaluator:
         Model evaluation mode.
     """
 
+    instrumentation = None
+    """Instrumentation (`~gammapy.utils.fitting.Instrumentation`), recording
+    the npred computation, PSF convolution and energy dispersion."""
+
     _cached_properties = [
         "lon_lat",
         "solid_angle",
@@ -227,6 +316,10 @@ class MapEvaluator:
             raise ValueError("Invalid evaluation_mode: {!r}".format(evaluation_mode))
 
         self.evaluation_mode = evaluation_mode
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._npred_cached = None
+        self._npred_cached_key = None
+        self._separable_cache = {}
 
     @property
     def geom(self):
@@ -328,16 +421,18 @@ class MapEvaluator:
         ----------
         exposure : `~gammapy.maps.Map`
             Exposure map.
-        psf : `gammapy.cube.PSFMap`
-            PSF map.
-        edisp : `gammapy.cube.EDispMap`
-            Edisp map.
+        psf : `~gammapy.cube.PSFKernel`
+            PSF kernel.
+        edisp : `~gammapy.irf.EnergyDispersion`
+            Energy dispersion.
         geom : `gammapy.maps.MapGeom`
             Reference geometry of the data.
         """
         log.debug("Updating model evaluator")
         # cache current position of the model component
         self._init_position = self.model.position
+        self._npred_cached = None
+        self._separable_cache = {}
 
         # TODO: lookup correct Edisp for this component
         self.edisp = edisp
@@ -396,6 +491,70 @@ class MapEvaluator:
         flux = dnde * volume
         return flux
 
+    @property
+    def is_separable(self):
+        """Whether the model is the product of a spatial and a spectral model (bool)."""
+        return isinstance(self.model, SkyModel)
+
+    def compute_flux_spatial(self):
+        """Compute spatial model integrated over the map pixel solid angles.
+
+        Returns
+        -------
+        flux_spatial : `~astropy.units.Quantity`
+            Image of the spatial model times pixel solid angle.
+        """
+        value = self.model.spatial_model(self.lon, self.lat)
+        return (value * self.solid_angle).to("")
+
+    def compute_flux_spectral(self):
+        """Compute spectral model integrated over the true energy bins.
+
+        For now, we simply multiply dnde at the bin center with the bin width,
+        consistent with `compute_flux`.
+
+        Returns
+        -------
+        flux_spectral : `~astropy.units.Quantity`
+            Flux per energy bin, with shape ``(n_energy, 1, 1)``.
+        """
+        value = self.model.spectral_model(self.energy_center)
+        return value * self.energy_bin_width
+
+    def _compute_npred_separable(self):
+        """Compute npred from separately cached spatial and spectral parts.
+
+        The spatial image times exposure, convolved with the PSF, is only
+        re-computed if a spatial parameter changed. As the convolution is
+        linear and applied per energy plane, it commutes with the multiplication
+        by the spectrum, which is re-computed only if a spectral parameter changed.
+        """
+        cache = self._separable_cache
+        spatial_key = self._model_parameters_key(self.model.spatial_model)
+        spectral_key = self._model_parameters_key(self.model.spectral_model)
+
+        if cache.get("spatial_key") != spatial_key:
+            flux_spatial = self.compute_flux_spatial()
+            exposure = self.exposure.quantity * flux_spatial
+            image = Map.from_geom(self.geom, data=exposure.value, unit=exposure.unit)
+
+            if self.psf is not None:
+                image = self.apply_psf(image)
+
+            cache["exposure_psf"] = image.quantity
+            cache["spatial_key"] = spatial_key
+
+        if cache.get("spectral_key") != spectral_key:
+            cache["flux_spectral"] = self.compute_flux_spectral()
+            cache["spectral_key"] = spectral_key
+
+        npred = (cache["exposure_psf"] * cache["flux_spectral"]).to_value("")
+        return Map.from_geom(self.geom, data=npred, unit="")
+
+    @staticmethod
+    def _model_parameters_key(model):
+        return tuple((id(par), par.value) for par in model.parameters.parameters)
+
     def apply_exposure(self, flux):
         """Compute npred cube
 
@@ -406,7 +565,8 @@ class MapEvaluator:
 
     def apply_psf(self, npred):
         """Convolve npred cube with PSF"""
-        return npred.convolve(self.psf)
+        with record(self.instrumentation, "psf", self.model.name):
+            return npred.convolve(self.psf)
 
     def apply_edisp(self, npred):
         """Convolve map data with energy dispersion.
@@ -421,11 +581,10 @@ class MapEvaluator:
         npred_reco : `~gammapy.maps.Map`
             Predicted counts in reco energy bins
         """
-        loc = npred.geom.get_axis_index_by_name("energy")
-        data = np.rollaxis(npred.data, loc, len(npred.data.shape))
-        data = np.dot(data, self.edisp.pdf_matrix)
-        data = np.rollaxis(data, -1, loc)
-        return Map.from_geom(self.geom_reco, data=data, unit="")
+        with record(self.instrumentation, "edisp", self.model.name):
+            loc = npred.geom.get_axis_index_by_name("energy")
+            data = self.edisp.apply(npred.data, axis=loc).to_value("")
+            return Map.from_geom(self.geom_reco, data=data, unit="")
 
     def compute_npred(self):
         """
@@ -436,11 +595,121 @@ class MapEvaluator:
         npred : `~gammapy.maps.Map`
             Predicted counts on the map (in reco energy bins)
         """
-        flux = self.compute_flux()
-        npred = self.apply_exposure(flux)
-        if self.psf is not None:
-            npred = self.apply_psf(npred)
-        if self.edisp is not None:
-            npred = self.apply_edisp(npred)
+        with record(self.instrumentation, "compute_npred", self.model.name):
+            if self.is_separable:
+                npred = self._compute_npred_separable()
+            else:
+                flux = self.compute_flux()
+                npred = self.apply_exposure(flux)
+                if self.psf is not None:
+                    npred = self.apply_psf(npred)
+
+            if self.edisp is not None:
+                npred = self.apply_edisp(npred)
 
         return npred
+
+    def compute_npred_gradient(self):
+        """Evaluate derivatives of the model predicted counts w.r.t. the parameter values.
+
+        For a `~gammapy.cube.models.SkyModel` the derivatives of the spatial
+        and spectral model are propagated through exposure, PSF and energy
+        dispersion, re-using the cached spectrum and convolved exposure
+        of the separable npred evaluation. For other models the derivatives
+        are computed by finite differences of `compute_npred`.
+
+        Returns
+        -------
+        gradient : list of `~numpy.ndarray`
+            Derivatives of npred (in reco energy bins), ordered like
+            ``model.parameters.parameters``, in units of the inverse parameter
+            units. Entries of frozen parameters are None.
+        """
+        parameters = self.model.parameters.parameters
+
+        if not self.is_separable:
+            gradient = self.model._numerical_gradient(lambda: self.compute_npred().data)
+            return [
+                None if grad is None else grad.to_value(1 / par.unit)
+                for par, grad in zip(parameters, gradient)
+            ]
+
+        # make sure the cached separable parts are up to date
+        self._compute_npred_separable()
+        exposure_psf = self._separable_cache["exposure_psf"]
+        flux_spectral = self._separable_cache["flux_spectral"]
+
+        gradient = {}
+
+        spatial_model = self.model.spatial_model
+        spatial_gradient = spatial_model.gradient(self.lon, self.lat)
+
+        for par, grad in zip(spatial_model.parameters.parameters, spatial_gradient):
+            if par.frozen or grad is None:
+                continue
+            exposure = self.exposure.quantity * (grad * self.solid_angle)
+            image = Map.from_geom(self.geom, data=exposure.value, unit=exposure.unit)
+
+            if self.psf is not None:
+                image = self.apply_psf(image)
+
+            gradient[id(par)] = image.quantity * flux_spectral
+
+        spectral_model = self.model.spectral_model
+        spectral_gradient = spectral_model.gradient(self.energy_center)
+
+        for par, grad in zip(spectral_model.parameters.parameters, spectral_gradient):
+            if par.frozen or grad is None:
+                continue
+            gradient[id(par)] = exposure_psf * (grad * self.energy_bin_width)
+
+        result = []
+        for par in parameters:
+            if id(par) not in gradient:
+                result.append(None)
+                continue
+
+            npred = gradient[id(par)].to_value(1 / par.unit)
+            npred = Map.from_geom(self.geom, data=npred, unit="")
+
+            if self.edisp is not None:
+                npred = self.apply_edisp(npred)
+
+            result.append(npred.data)
+
+        return result
+
+    @property
+    def _parameters_key(self):
+        return self._model_parameters_key(self.model)
+
+    @property
+    def npred_cached(self):
+        """Predicted counts from the last `compute_npred_cached` call (`~gammapy.maps.Map`).
+
+        None if no npred is cached yet, or the evaluator was updated since.
+        """
+        return self._npred_cached
+
+    def compute_npred_cached(self):
+        """Evaluate model predicted counts, re-using the previous result if possible.
+
+        The predicted counts are only re-computed if a parameter value of
+        the model changed since the last call. Cache hits and misses are
+        counted in ``cache_stats``.
+
+        Returns
+        -------
+        npred : `~gammapy.maps.Map`
+            Predicted counts on the map (in reco energy bins)
+        """
+        key = self._parameters_key
+
+        if self._npred_cached is not None and key == self._npred_cached_key:
+            self.cache_stats["hits"] += 1
+        else:
+            self.cache_stats["misses"] += 1
+            self._npred_cached = self.compute_npred()
+            self._npred_cached_key = key
+
+        return self._npred_cached
@@ -0,0 +1,76 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Helper functions shared by `~gammapy.cube.PSFMap` and `~gammapy.cube.EDispMap`."""
+import numpy as np
+from astropy.coordinates import Angle
+
+__all__ = []
+
+
+def _offset_lookup(offset, offset_binsz):
+    """Radial lookup table for IRF values, which only depend on offset.
+
+    The offsets are binned with bin size ``offset_binsz``, so that IRFs can
+    be evaluated once per occupied offset bin and scattered to the pixels.
+
+    Parameters
+    ----------
+    offset : `~astropy.coordinates.Angle`
+        Offsets of the map pixels from the pointing position.
+    offset_binsz : `~astropy.coordinates.Angle`
+        Offset bin size.
+
+    Returns
+    -------
+    offset_nodes : `~astropy.coordinates.Angle`
+        Centers of the occupied offset bins (1D).
+    idx : `~numpy.ndarray`
+        Index into ``offset_nodes`` for every offset, with the shape of ``offset``.
+    """
+    offset_binsz = Angle(offset_binsz)
+    idx_bin = np.floor((offset / offset_binsz).to_value("")).astype(int)
+    idx_bin, idx = np.unique(idx_bin, return_inverse=True)
+    offset_nodes = (idx_bin + 0.5) * offset_binsz
+    return offset_nodes, idx.reshape(offset.shape)
+
+
+def _reproject_data(m, geom, unit):
+    """Data of map ``m`` on ``geom`` in ``unit``, zero outside of ``m``."""
+    if m.geom == geom:
+        data = m.data
+    else:
+        data = np.nan_to_num(m.get_by_coord(geom.get_coord()))
+
+    factor = m.unit.to(unit)
+    if factor != 1:
+        data = data * factor
+    return data
+
+
+def _stack_exposure_weighted(irf_map, exposure_map, other_irf_map, other_exposure_map):
+    """Stack IRF maps in place, weighted with exposure.
+
+    The other maps are projected on the geometries of ``irf_map`` and
+    ``exposure_map``. The last non-spatial axis of the IRF map geometry,
+    i.e. the first axis of the data array, must be the energy axis of the
+    exposure maps. For `~gammapy.cube.PSFMap` the geometry axes are
+    ``(rad, energy)``, for `~gammapy.cube.EDispMap` ``(migra, energy)``.
+    The stacking is done per energy
+    bin, so no temporary arrays of the full IRF map size are needed (except
+    for the reprojection of other maps with a different geometry).
+    """
+    other_exposure = _reproject_data(
+        other_exposure_map, exposure_map.geom, exposure_map.unit
+    )
+    other_data = _reproject_data(other_irf_map, irf_map.geom, irf_map.unit)
+
+    for data, exposure, other, exposure_other in zip(
+        irf_map.data, exposure_map.data, other_data, other_exposure
+    ):
+        total = exposure + exposure_other
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weights = np.where(total > 0, exposure_other / total, 0)
+
+        # exposure weighted mean, where both maps have no exposure the
+        # values of this map are kept
+        data += (other - data) * weights
+        exposure += exposure_other
@@ -1,8 +1,13 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
 import logging
+from collections import deque
+from functools import partial
+from multiprocessing import Pool
 from astropy.nddata.utils import NoOverlapError, PartialOverlapError
 from astropy.coordinates import Angle
 from astropy.utils import lazyproperty
+from ..data import DataStoreObservation
 from ..maps import Map, WcsGeom
 from .counts import fill_map_counts
 from .exposure import make_map_exposure_true_energy, _map_spectrum_weight
@@ -30,9 +35,33 @@ class MapMaker:
         Exclusion mask
     background_oversampling : int
         Background oversampling factor in energy axis.
+    n_jobs : int
+        Number of processes used to make the maps of the individual
+        observations. The results are stacked as they become available.
+    chunk_size : int
+        If given, the events of each observation are read and binned in
+        blocks of ``chunk_size`` rows, see `MapMakerObs`.
+    exposure_offset_step : `~astropy.coordinates.Angle`
+        If given, the exposure is computed from the effective area on a
+        regular offset grid with this step, see
+        `~gammapy.cube.make_map_exposure_true_energy`.
+    background_time_slices : int
+        If given, the background is averaged over this number of time slices
+        of each observation, see `MapMakerObs`.
     """
 
-    def __init__(self, geom, offset_max, geom_true=None, exclusion_mask=None, background_oversampling=None):
+    def __init__(
+        self,
+        geom,
+        offset_max,
+        geom_true=None,
+        exclusion_mask=None,
+        background_oversampling=None,
+        n_jobs=1,
+        chunk_size=None,
+        exposure_offset_step=None,
+        background_time_slices=None,
+    ):
         if not isinstance(geom, WcsGeom):
             raise ValueError("MapMaker only works with WcsGeom")
 
@@ -44,6 +73,10 @@ class MapMaker:
         self.offset_max = Angle(offset_max)
         self.exclusion_mask = exclusion_mask
         self.background_oversampling = background_oversampling
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+        self.exposure_offset_step = exposure_offset_step
+        self.background_time_slices = background_time_slices
 
     def _get_empty_maps(self, selection):
         # Initialise zero-filled maps
@@ -75,26 +108,81 @@ class MapMaker:
         selection = _check_selection(selection)
         maps = self._get_empty_maps(selection)
 
-        for obs in observations:
-            log.info("Processing observation: OBS_ID = {}".format(obs.obs_id))
-
-            try:
-                obs_maker = self._get_obs_maker(obs)
-            except NoOverlapError:
-                log.info("Skipping observation {} (no map overlap)".format(obs.obs_id))
-                continue
-
-            maps_obs = obs_maker.run(selection)
+        func = partial(_run_obs_maker, selection=selection)
 
+        for maps_obs in self._imap_obs(func, observations):
             for name in selection:
-                data = maps_obs[name].quantity.to_value(maps[name].unit)
-                if name == "exposure":
-                    maps[name].fill_by_coord(obs_maker.coords_etrue, data)
-                else:
-                    maps[name].fill_by_coord(obs_maker.coords, data)
+                maps[name].stack(maps_obs[name])
+
         self._maps = maps
         return maps
 
+    def _imap_obs(self, func, observations, mode="trim"):
+        """Apply function to the `MapMakerObs` of all observations.
+
+        Results are yielded in input order as soon as they are available.
+        With ``n_jobs > 1`` the observations are processed in a process pool.
+        The maker settings and the data stores are sent once to every worker
+        process, the tasks for `~gammapy.data.DataStoreObservation` only hold
+        the observation IDs and filters. Their data is read in the workers,
+        so data prefetched or cached in the main process is not pickled.
+        Other observations are sent to the workers as they are. At most
+        ``2 * n_jobs`` observations are processed or waiting to be consumed
+        at any time.
+        """
+        if self.n_jobs == 1:
+            for obs in observations:
+                obs_maker = self._get_obs_maker_or_skip(obs, mode=mode)
+                if obs_maker is not None:
+                    yield func(obs_maker)
+            return
+
+        data_stores, tasks = {}, []
+        for obs in observations:
+            if isinstance(obs, DataStoreObservation):
+                data_stores.setdefault(id(obs.data_store), obs.data_store)
+                tasks.append((id(obs.data_store), (obs.obs_id, obs.obs_filter)))
+            else:
+                tasks.append((None, obs))
+
+        maker = copy.copy(self)
+        maker.__dict__.pop("_maps", None)
+        initargs = (maker, data_stores, func, mode)
+
+        pool = Pool(processes=self.n_jobs, initializer=_init_worker, initargs=initargs)
+        try:
+            log.info("Using {} jobs to make maps.".format(self.n_jobs))
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.apply_async(_run_worker_task, (task,)))
+                if len(pending) >= 2 * self.n_jobs:
+                    result = pending.popleft().get()
+                    if result is not None:
+                        yield result
+
+            while pending:
+                result = pending.popleft().get()
+                if result is not None:
+                    yield result
+        except BaseException:
+            # don't run the queued tasks if a task failed or the caller
+            # stopped consuming the results
+            pool.terminate()
+            raise
+
+        pool.close()
+        pool.join()
+
+    def _get_obs_maker_or_skip(self, obs, mode="trim"):
+        log.info("Processing observation: OBS_ID = {}".format(obs.obs_id))
+
+        try:
+            return self._get_obs_maker(obs, mode=mode)
+        except NoOverlapError:
+            log.info("Skipping observation {} (no map overlap)".format(obs.obs_id))
+        except PartialOverlapError:
+            log.info("Skipping observation {} (partial map overlap)".format(obs.obs_id))
+
     def _get_obs_maker(self, obs, mode="trim"):
         # Compute cutout geometry and slices to stack results back later
         cutout_kwargs = {
@@ -119,6 +207,9 @@ class MapMaker:
             offset_max=self.offset_max,
             exclusion_mask=cutout_exclusion,
             background_oversampling=self.background_oversampling,
+            chunk_size=self.chunk_size,
+            exposure_offset_step=self.exposure_offset_step,
+            background_time_slices=self.background_time_slices,
         )
 
     @staticmethod
@@ -193,11 +284,27 @@ class MapMakerObs:
         If none, the same as geom is assumed
     exclusion_mask : `~gammapy.maps.Map`
         Exclusion mask (used by some background estimators)
+    background_oversampling : int
+        Background oversampling factor in energy axis.
+    chunk_size : int
+        If given, the events are read and binned in blocks of ``chunk_size``
+        rows (see `~gammapy.data.DataStoreObservation.iter_events`), so event
+        lists larger than the available memory can be processed.
+    exposure_offset_step : `~astropy.coordinates.Angle`
+        If given, the exposure is computed from the effective area on a
+        regular offset grid with this step, see
+        `~gammapy.cube.make_map_exposure_true_energy`.
+    background_time_slices : int
+        If given, the background is averaged over this number of equal time
+        slices of the observation, which takes the rotation of the field of
+        view into account, see `~gammapy.cube.make_map_background_irf`.
+        Only used for background models aligned with the AltAz frame.
     """
 
     def __init__(
         self, observation, geom, offset_max, geom_true=None, exclusion_mask=None,
-            background_oversampling=None,
+            background_oversampling=None, chunk_size=None, exposure_offset_step=None,
+            background_time_slices=None,
     ):
         self.observation = observation
         self.geom = geom
@@ -205,6 +312,9 @@ class MapMakerObs:
         self.offset_max = offset_max
         self.exclusion_mask = exclusion_mask
         self.background_oversampling = background_oversampling
+        self.chunk_size = chunk_size
+        self.exposure_offset_step = exposure_offset_step
+        self.background_time_slices = background_time_slices
         self.maps = {}
 
     def _fov_mask(self, coords):
@@ -250,7 +360,12 @@ class MapMakerObs:
 
     def _make_counts(self):
         counts = Map.from_geom(self.geom)
-        fill_map_counts(counts, self.observation.events)
+        if self.chunk_size is None:
+            # Memory-map the events, so only the columns needed for binning are read
+            events = self.observation.get_events(memmap=True)
+        else:
+            events = self.observation.iter_events(chunk_size=self.chunk_size)
+        fill_map_counts(counts, events)
         if self.fov_mask is not None:
             counts.data[..., self.fov_mask] = 0
         self.maps["counts"] = counts
@@ -261,6 +376,7 @@ class MapMakerObs:
             livetime=self.observation.observation_live_time_duration,
             aeff=self.observation.aeff,
             geom=self.geom_true,
+            offset_step=self.exposure_offset_step,
         )
         if self.fov_mask_etrue is not None:
             exposure.data[..., self.fov_mask_etrue] = 0
@@ -268,8 +384,10 @@ class MapMakerObs:
 
     def _make_background(self):
         bkg_coordsys = self.observation.bkg.meta.get("FOVALIGN", "ALTAZ")
+        n_time_slices = None
         if bkg_coordsys == "ALTAZ":
             pnt = self.observation.fixed_pointing_info
+            n_time_slices = self.background_time_slices
         elif bkg_coordsys == "RADEC":
             pnt = self.observation.pointing_radec
         else:
@@ -282,7 +400,8 @@ class MapMakerObs:
             ontime=self.observation.observation_time_duration,
             bkg=self.observation.bkg,
             geom=self.geom,
-            oversampling=self.background_oversampling
+            oversampling=self.background_oversampling,
+            n_time_slices=n_time_slices,
         )
         if self.fov_mask is not None:
             background.data[..., self.fov_mask] = 0
@@ -293,6 +412,34 @@ class MapMakerObs:
         self.maps["background"] = background
 
 
+def _run_obs_maker(obs_maker, selection=None):
+    return obs_maker.run(selection)
+
+
+_worker = {}
+"""Maker settings and data stores of a worker process, see `MapMaker._imap_obs`."""
+
+
+def _init_worker(maker, data_stores, func, mode):
+    _worker.update(maker=maker, data_stores=data_stores, func=func, mode=mode)
+
+
+def _run_worker_task(task):
+    key, obs = task
+    if key is not None:
+        obs_id, obs_filter = obs
+        obs = DataStoreObservation(
+            obs_id=obs_id, data_store=_worker["data_stores"][key], obs_filter=obs_filter
+        )
+
+    obs_maker = _worker["maker"]._get_obs_maker_or_skip(obs, mode=_worker["mode"])
+
+    if obs_maker is None:
+        return None
+
+    return _worker["func"](obs_maker)
+
+
 def _check_selection(selection):
     """Handle default and validation of selection"""
     available = ["counts", "exposure", "background"]
@@ -331,6 +478,9 @@ class MapMakerRing(MapMaker):
     background_estimator : `~gammapy.background.RingBackgroundEstimator`
         or `~gammapy.background.AdaptiveRingBackgroundEstimator`
         Ring background estimator or something with an equivalent API.
+    n_jobs : int
+        Number of processes used to make the maps of the individual
+        observations. The results are stacked as they become available.
 
     Examples
     --------
@@ -372,13 +522,19 @@ class MapMakerRing(MapMaker):
     """
 
     def __init__(
-        self, geom, offset_max, exclusion_mask=None, background_estimator=None
+        self,
+        geom,
+        offset_max,
+        exclusion_mask=None,
+        background_estimator=None,
+        n_jobs=1,
     ):
         super().__init__(
             geom=geom,
             offset_max=offset_max,
             exclusion_mask=exclusion_mask,
             geom_true=None,
+            n_jobs=n_jobs,
         )
         self.background_estimator = background_estimator
 
@@ -388,37 +544,19 @@ class MapMakerRing(MapMaker):
         if sum_over_axis:
             maps = self._maps_sum_over_axes(maps, spectrum, keepdims)
 
-        for obs in observations:
-            try:
-                obs_maker = self._get_obs_maker(obs, mode="strict")
-            except NoOverlapError:
-                log.info("Skipping obs_id: {} (no map overlap)".format(obs.obs_id))
-                continue
-            except PartialOverlapError:
-                log.info("Skipping obs_id: {} (partial map overlap)".format(obs.obs_id))
-                continue
-
-            maps_obs = obs_maker.run()
-            maps_obs["exclusion"] = obs_maker.exclusion_mask
-
-            if sum_over_axis:
-                maps_obs = self._maps_sum_over_axes(maps_obs, spectrum, keepdims)
-                maps_obs["exclusion"] = obs_maker.exclusion_mask.sum_over_axes(
-                    keepdims=keepdims
-                )
-                maps_obs["exclusion"].data = (
-                    maps_obs["exclusion"].data / self.geom.axes[0].nbin
-                )
-
-            maps_obs_bkg = self.background_estimator.run(maps_obs)
-            maps_obs.update(maps_obs_bkg)
-            maps_obs["exposure_on"] = maps_obs.pop("background")
-            maps_obs["on"] = maps_obs.pop("counts")
-
-            # Now paste the returned maps on the ref geom
+        func = partial(
+            _run_obs_maker_ring,
+            background_estimator=self.background_estimator,
+            selection=selection,
+            sum_over_axis=sum_over_axis,
+            spectrum=spectrum,
+            keepdims=keepdims,
+        )
+
+        # Now paste the returned maps on the ref geom
+        for maps_obs in self._imap_obs(func, observations, mode="strict"):
             for name in selection:
-                data = maps_obs[name].quantity.to_value(maps[name].unit)
-                maps[name].fill_by_coord(maps_obs[name].geom.get_coord(), data)
+                maps[name].stack(maps_obs[name])
 
         self._maps = maps
         return maps
@@ -474,3 +612,25 @@ class MapMakerRing(MapMaker):
             * ``"off"``: off map
         """
         return self._run(observations, sum_over_axis=False)
+
+
+def _run_obs_maker_ring(
+    obs_maker, background_estimator, selection, sum_over_axis, spectrum, keepdims
+):
+    maps_obs = obs_maker.run()
+    maps_obs["exclusion"] = obs_maker.exclusion_mask
+
+    if sum_over_axis:
+        maps_obs = MapMaker._maps_sum_over_axes(maps_obs, spectrum, keepdims)
+        maps_obs["exclusion"] = obs_maker.exclusion_mask.sum_over_axes(
+            keepdims=keepdims
+        )
+        maps_obs["exclusion"].data = (
+            maps_obs["exclusion"].data / obs_maker.geom.axes[0].nbin
+        )
+
+    maps_obs_bkg = background_estimator.run(maps_obs)
+    maps_obs.update(maps_obs_bkg)
+    maps_obs["exposure_on"] = maps_obs.pop("background")
+    maps_obs["on"] = maps_obs.pop("counts")
+    return {name: maps_obs[name] for name in selection}
@@ -403,6 +403,26 @@ class BackgroundModel(Model):
         back_values = norm * self.map.data * tilt_factor.value
         return self.map.copy(data=back_values)
 
+    def evaluate_gradient(self):
+        """Evaluate derivatives of the background model w.r.t. the parameter values.
+
+        Returns
+        -------
+        gradient : list of `~numpy.ndarray`
+            Derivatives, ordered like ``parameters.parameters``, in units of
+            the inverse parameter units.
+        """
+        norm = self.parameters["norm"].value
+        tilt = self.parameters["tilt"].value
+        reference = self.parameters["reference"].quantity
+        log_energy = np.log((self.energy_center / reference).to_value(""))
+        tilt_factor = np.exp(-tilt * log_energy)
+
+        d_norm = self.map.data * tilt_factor
+        d_tilt = -norm * d_norm * log_energy
+        d_reference = norm * d_norm * tilt / reference.value
+        return [d_norm, d_tilt, d_reference]
+
     @classmethod
     def from_skymodel(cls, skymodel, exposure, edisp=None, psf=None, **kwargs):
         """Create background model from sky model by applying IRFs.
@@ -95,18 +95,25 @@ def energy_dependent_table_psf_to_kernel_map(table_psf, geom, factor=4):
     factor : int
         the oversample factor to compute the PSF
     """
-    energy_axis = geom.get_axis_by_name("energy")
-    energy_idx = geom.axes.index(energy_axis)
-
     # prepare map and compute distances to map center
     kernel_map, rads = _compute_kernel_separations(geom, factor)
+    return _fill_energy_dependent_kernel_map(table_psf, kernel_map, rads, factor)
+
+
+def _fill_energy_dependent_kernel_map(table_psf, kernel_map, rads, factor):
+    """Fill the upsampled ``kernel_map`` with the normalised PSF at separations ``rads``.
+
+    The PSF is evaluated for all energies at once, so the separations are
+    shared across energies. Returns the downsampled kernel map.
+    """
+    energy_axis = kernel_map.geom.get_axis_by_name("energy")
+    energy_idx = kernel_map.geom.axes.index(energy_axis)
+
+    vals = table_psf.evaluate(energy=energy_axis.center, rad=rads.ravel()).value
+    vals /= vals.sum(axis=1, keepdims=True)
 
-    # loop over images
     for img, idx in kernel_map.iter_by_image():
-        # TODO: this is super complex. Find or invent a better way!
-        energy = energy_axis.center[idx[energy_idx]]
-        vals = table_psf.evaluate(energy=energy, rad=rads).reshape(img.shape)
-        img += vals.value / vals.sum().value
+        img += vals[idx[energy_idx]].reshape(img.shape)
 
     return kernel_map.downsample(factor, preserve_counts=True)
 
@@ -1,16 +1,25 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from collections import OrderedDict
 import numpy as np
 import astropy.units as u
 from astropy.coordinates import Angle
 import astropy.io.fits as fits
 from ..irf import EnergyDependentTablePSF
 from ..maps import Map
-from ..cube import PSFKernel
+from .irf_map import _offset_lookup, _stack_exposure_weighted
+from .psf_kernel import (
+    PSFKernel,
+    _make_kernel_geom,
+    _compute_kernel_separations,
+    _fill_energy_dependent_kernel_map,
+)
 
 __all__ = ["make_psf_map", "PSFMap"]
 
 
-def make_psf_map(psf, pointing, geom, max_offset, exposure_map=None):
+def make_psf_map(
+    psf, pointing, geom, max_offset, exposure_map=None, offset_binsz=None, dtype="float64"
+):
     """Make a psf map for a single observation
 
     Expected axes : rad and true energy in this specific order
@@ -30,6 +39,12 @@ def make_psf_map(psf, pointing, geom, max_offset, exposure_map=None):
     exposure_map : `~gammapy.maps.Map`, optional
         the associated exposure map.
         default is None
+    offset_binsz : `~astropy.coordinates.Angle`, optional
+        If given, the PSF is evaluated once per offset bin of this size and
+        the values are assigned to the pixels by their offset, instead of
+        evaluating the PSF at every pixel.
+    dtype : str
+        Data type of the map, e.g. "float32" to halve its memory use.
 
     Returns
     -------
@@ -45,18 +60,29 @@ def make_psf_map(psf, pointing, geom, max_offset, exposure_map=None):
     separations = pointing.separation(geom.to_image().get_coord().skycoord)
     valid = np.where(separations < max_offset)
 
+    if offset_binsz is None:
+        offset, idx = separations[valid], slice(None)
+    else:
+        offset, idx = _offset_lookup(separations[valid], offset_binsz)
+
     # Compute PSF values
-    psf_values = psf.evaluate(offset=separations[valid], energy=energy, rad=rad)
+    psf_values = psf.evaluate(offset=offset, energy=energy, rad=rad)
 
     # Re-order axes to be consistent with expected geometry
     psf_values = np.transpose(psf_values, axes=(2, 0, 1))
 
     # TODO: this probably does not ensure that probability is properly normalized in the PSFMap
     # Create Map and fill relevant entries
-    psfmap = Map.from_geom(geom, unit="sr-1")
-    psfmap.data[:, :, valid[0], valid[1]] += psf_values.to_value(psfmap.unit)
+    # the PSFMap stores a copy of the input map, fill the copy to not
+    # allocate the map twice (the pages of the zero input are never touched)
+    data = np.zeros(geom.data_shape, dtype=dtype)
+    psfmap = PSFMap(Map.from_geom(geom, data=data, unit="sr-1"), exposure_map)
+    psf_values = psf_values.to_value(psfmap.psf_map.unit)
+
+    for data_energy, values in zip(psfmap.psf_map.data, psf_values):
+        data_energy[:, valid[0], valid[1]] = values[:, idx]
 
-    return PSFMap(psfmap, exposure_map)
+    return psfmap
 
 
 class PSFMap:
@@ -70,6 +96,8 @@ class PSFMap:
     exposure_map : `~gammapy.maps.Map`
         Associated exposure map. Needs to have a consistent map geometry.
 
+    Copies of both maps are stored, because `stack` modifies them in place.
+
     Examples
     --------
     ::
@@ -114,6 +142,9 @@ class PSFMap:
         psf_map.write('psf_map.fits')
     """
 
+    kernel_cache_size = 32
+    """Maximum number of cached PSF kernels per target geometry."""
+
     def __init__(self, psf_map, exposure_map=None):
         if psf_map.geom.axes[1].name.upper() != "ENERGY":
             raise ValueError("Incorrect energy axis position in input Map")
@@ -121,7 +152,6 @@ class PSFMap:
         if psf_map.geom.axes[0].name.upper() != "THETA":
             raise ValueError("Incorrect theta axis position in input Map")
 
-        self.psf_map = psf_map
 
         if exposure_map is not None:
             # First adapt geometry, keep only energy axis
@@ -129,7 +159,14 @@ class PSFMap:
             if exposure_map.geom != expected_geom:
                 raise ValueError("PSFMap and exposure_map have inconsistent geometries")
 
+        # `stack` modifies the maps in place, so copies are stored
+        self.psf_map = psf_map.copy()
+
+        if exposure_map is not None:
+            exposure_map = exposure_map.copy()
+
         self.exposure_map = exposure_map
+        self._kernel_caches = []
 
     @classmethod
     def from_hdulist(
@@ -249,6 +286,8 @@ class PSFMap:
         """Returns a PSF kernel at the given position.
 
         The PSF is returned in the form a WcsNDMap defined by the input MapGeom.
+        The PSF is interpolated at the position. Use `get_psf_kernels` for
+        cached kernels at many positions.
 
         Parameters
         ----------
@@ -269,6 +308,93 @@ class PSFMap:
         table_psf = self.get_energy_dependent_table_psf(position)
         return PSFKernel.from_table_psf(table_psf, geom, max_radius, factor)
 
+    def get_psf_kernels(self, positions, geom, max_radius=None, factor=4):
+        """Returns PSF kernels at several positions.
+
+        Unlike `get_psf_kernel`, the PSF is not interpolated: positions in the
+        same PSF map pixel share the kernel, which is computed from the PSF at
+        the pixel center, and positions outside the PSF map use the nearest
+        pixel. Kernels are cached per pixel and target geometry (up to
+        ``kernel_cache_size`` kernels), so the PSF map data must not be
+        modified in place afterwards. The separations of the kernel pixels
+        are computed once for all positions and energies.
+
+        The returned kernels are shared with the cache and with other
+        calls, so they must not be modified; copy them first if needed.
+
+        This is a standalone method for users extracting many kernels, e.g.
+        along the track of a moving source. `~gammapy.cube.MapDataset` and
+        `~gammapy.cube.MapEvaluator` take a fixed `~gammapy.cube.PSFKernel`
+        and don't use this cache, so it has no effect on fits.
+
+        Parameters
+        ----------
+        positions : `~astropy.coordinates.SkyCoord`
+            the target positions
+        geom : `~gammapy.maps.MapGeom`
+            the target geometry to use
+        max_radius : `~astropy.coordinates.Angle`
+            maximum angular size of the kernel map
+        factor : int
+            oversampling factor to compute the PSF
+
+        Returns
+        -------
+        kernels : list of `~gammapy.cube.PSFKernel`
+            the resulting (shared) kernels, in the order of the flattened
+            positions
+        """
+        # TODO : use PSF containment radius if max_radius is None
+        if max_radius is not None:
+            geom = _make_kernel_geom(geom, max_radius)
+
+        cache = self._get_kernel_cache(geom, factor)
+
+        idx = self.psf_map.geom.to_image().coord_to_idx(positions, clip=True)
+        idx_lon, idx_lat = [np.ravel(_).astype(int) for _ in idx]
+
+        kernel_map, rads = None, None
+        kernels = []
+        for key in zip(idx_lat, idx_lon):
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                if kernel_map is None:
+                    kernel_map, rads = _compute_kernel_separations(geom, factor)
+
+                table_psf = self._get_table_psf_at_idx(key)
+                kernel_map_filled = _fill_energy_dependent_kernel_map(
+                    table_psf, kernel_map.copy(), rads, factor
+                )
+                cache[key] = PSFKernel(kernel_map_filled)
+
+                while len(cache) > self.kernel_cache_size:
+                    cache.popitem(last=False)
+
+            kernels.append(cache[key])
+
+        return kernels
+
+    def _get_kernel_cache(self, geom, factor):
+        """Kernel cache (`~collections.OrderedDict`) for a given geometry and factor."""
+        # geometries are not hashable, but there are usually only a few of them
+        for cache_geom, cache_factor, cache in self._kernel_caches:
+            if cache_factor == factor and cache_geom == geom:
+                return cache
+
+        cache = OrderedDict()
+        self._kernel_caches.append((geom, factor, cache))
+        return cache
+
+    def _get_table_psf_at_idx(self, idx):
+        """Energy-dependent PSF at the center of the PSF map pixel ``(idx_lat, idx_lon)``."""
+        psf_values = self.psf_map.quantity[(Ellipsis,) + tuple(idx)]
+
+        energies = self.psf_map.geom.axes[1].center
+        rad = self.psf_map.geom.axes[0].center
+
+        return EnergyDependentTablePSF(energy=energies, rad=rad, psf_value=psf_values)
+
     def containment_radius_map(self, energy, fraction=0.68):
         """Containment radius map.
 
@@ -295,50 +421,21 @@ class PSFMap:
         return m
 
     def stack(self, other):
-        """Stack PSFMap with another one.
+        """Stack PSFMap with another one, in place.
 
         The other PSFMap is projected on the current PSFMap geometry.
+        The maps are averaged weighted with their exposure, and the exposure
+        maps are summed.
 
         Parameters
         ----------
         other : `~gammapy.cube.PSFMap`
             the psfmap to be stacked with this one.
-
-        Returns
-        -------
-        new : `~gammapy.cube.PSFMap`
-            the stacked psfmap
         """
         if self.exposure_map is None or other.exposure_map is None:
             raise ValueError("Missing exposure map for PSFMap.stack")
 
-        # Reproject other exposure
-        exposure_coord = self.exposure_map.geom.get_coord()
-        reproj_exposure = Map.from_geom(
-            self.exposure_map.geom, unit=self.exposure_map.unit
-        )
-        reproj_exposure.fill_by_coord(
-            exposure_coord, other.exposure_map.get_by_coord(exposure_coord)
-        )
-
-        # Reproject other psfmap using same geom
-        psfmap_coord = self.psf_map.geom.get_coord()
-        reproj_psfmap = Map.from_geom(self.psf_map.geom, unit=self.psf_map.unit)
-        reproj_psfmap.fill_by_coord(
-            psfmap_coord, other.psf_map.get_by_coord(psfmap_coord)
+        _stack_exposure_weighted(
+            self.psf_map, self.exposure_map, other.psf_map, other.exposure_map
         )
-
-        exposure = self.exposure_map.quantity[:, np.newaxis, :, :]
-        stacked_psf_quantity = self.psf_map.quantity * exposure
-
-        other_exposure = reproj_exposure.quantity[:, np.newaxis, :, :]
-        stacked_psf_quantity += reproj_psfmap.quantity * other_exposure
-
-        total_exposure = exposure + other_exposure
-        stacked_psf_quantity /= total_exposure
-
-        reproj_psfmap.quantity = stacked_psf_quantity
-        # We need to remove the extra axis in the total exposure
-        reproj_exposure.quantity = total_exposure[:, 0, :, :]
-
-        return PSFMap(reproj_psfmap, reproj_exposure)
+        self._kernel_caches = []
@@ -142,6 +142,30 @@ def test_make_map_background_irf(bkg_3d, pars, fixed_pointing_info):
     assert_allclose(m.data.sum(), pars["sum"], rtol=1e-5)
 
 
+@requires_data("gammapy-data")
+def test_make_map_background_irf_time_slices(bkg_3d, fixed_pointing_info):
+    kwargs = dict(
+        pointing=fixed_pointing_info,
+        ontime="42 s",
+        bkg=bkg_3d,
+        geom=geom(
+            map_type="wcs", ebounds=[0.1, 1, 10], skydir=fixed_pointing_info.radec
+        ),
+    )
+    m = make_map_background_irf(**kwargs)
+    m_1 = make_map_background_irf(n_time_slices=1, **kwargs)
+    m_10 = make_map_background_irf(n_time_slices=10, **kwargs)
+
+    assert m_10.data.shape == m.data.shape
+    assert_allclose(m_1.data, m.data, rtol=1e-4)
+    assert_allclose(m_10.data.sum(), m.data.sum(), rtol=1e-2)
+
+    with pytest.raises(ValueError):
+        make_map_background_irf(
+            n_time_slices=2, **dict(kwargs, pointing=fixed_pointing_info.radec)
+        )
+
+
 @requires_data("gammapy-data")
 def test_make_map_background_irf_constant(fixed_pointing_info_aligned):
     m = make_map_background_irf_with_symmetry(
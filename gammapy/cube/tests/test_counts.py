@@ -35,6 +35,15 @@ def test_fill_map_counts_wcs(events):
     assert_allclose(m.data[0, 0, 0], 1)
 
 
+def test_fill_map_counts_chunks(events):
+    axis = MapAxis.from_edges([9, 11, 13], name="energy", unit="TeV")
+    m = Map.create(npix=(2, 1), binsz=10, axes=[axis])
+    chunks = [events.select_row_subset([0]), events.select_row_subset([1])]
+    fill_map_counts(m, iter(chunks + chunks))
+    assert m.data.sum() == 2
+    assert_allclose(m.data[0, 0, 0], 2)
+
+
 @requires_dependency("healpy")
 def test_fill_map_counts_hpx(events):
     # 2D map
@@ -65,3 +74,26 @@ def test_fill_map_counts_uint_column(events):
     fill_map_counts(m, events)
     assert m.data.sum() == 1
     assert_allclose(m.data[0, 0, 0], 1)
+
+
+@pytest.mark.parametrize("coordsys", ["CEL", "GAL"])
+def test_fill_map_counts_wcs_fast_path(coordsys):
+    # Direct binning has to agree with the generic `fill_by_coord` path
+    rng = np.random.RandomState(0)
+    t = Table()
+    t["RA"] = rng.uniform(80, 90, 1000) * u.deg
+    t["DEC"] = rng.uniform(17, 27, 1000) * u.deg
+    t["ENERGY"] = 10 ** rng.uniform(-1, 2, 1000) * u.TeV
+    events = EventList(t)
+
+    axis = MapAxis.from_bounds(0.1, 100, nbin=6, interp="log", name="energy", unit="TeV")
+    m = Map.create(
+        skydir=(85, 22), binsz=0.2, width=8, axes=[axis], coordsys=coordsys, proj="TAN"
+    )
+    fill_map_counts(m, events)
+
+    m_ref = Map.from_geom(m.geom)
+    m_ref.fill_by_coord(events._get_coord_from_geom(m.geom))
+
+    assert m.data.sum() > 0
+    assert_allclose(m.data, m_ref.data)
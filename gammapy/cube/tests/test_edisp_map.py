@@ -113,11 +113,61 @@ def test_edisp_map_to_energydispersion():
     assert_allclose(edisp.get_resolution(e_true=1.0 * u.TeV), 0.2, atol=3e-2)
 
 
+def test_edisp_map_energy_dispersion_matrix():
+    edmap = make_edisp_map_test()
+
+    positions = SkyCoord([0, 0.5, -1.2], [0, 0.3, 1.0], unit="deg")
+    e_reco = np.logspace(-0.3, 0.2, 200) * u.TeV
+
+    data = edmap.get_energy_dispersion_matrix(positions, e_reco)
+    assert data.shape == (3, 4, 199)
+
+    for position, matrix in zip(positions, data):
+        edisp = edmap.get_energy_dispersion(position, e_reco)
+        assert_allclose(edisp.pdf_matrix, matrix)
+
+    assert_allclose(data[0, 1].sum(), 1, atol=2e-2)
+
+
+def test_edisp_map_energy_dispersion_matrix_per_bin():
+    edmap = make_edisp_map_test()
+    migra_axis, energy_axis = edmap.edisp_map.geom.axes
+
+    positions = SkyCoord([0, 0.5], [0, 0.3], unit="deg")
+    e_reco = np.logspace(-0.3, 0.2, 200) * u.TeV
+    migra_step = 5e-3
+
+    data = edmap.get_energy_dispersion_matrix(positions, e_reco, migra_step)
+
+    # Integrate each position and true energy bin separately
+    migra = np.arange(migra_axis.edges[0], migra_axis.edges[-1], migra_step)
+    pix_lon, pix_lat = edmap.edisp_map.geom.to_image().coord_to_pix(positions)
+
+    for idx in range(positions.size):
+        for idx_e, e_true in enumerate(energy_axis.center):
+            pix = (pix_lon[idx], pix_lat[idx], migra_axis.coord_to_pix(migra), idx_e)
+            values = edmap.edisp_map.interp_by_pix(pix)
+            cumulative = np.nan_to_num(np.cumsum(values) / np.sum(values))
+
+            migra_e_reco = (e_reco / e_true).to_value("")
+            pos_migra = np.maximum(np.digitize(migra_e_reco, migra) - 1, 0)
+            expected = np.diff(cumulative[pos_migra])
+
+            assert_allclose(data[idx, idx_e], expected, atol=1e-6)
+
+    # cached pixels give the same result
+    assert len(edmap._cumulative_cache) > 0
+    assert_allclose(
+        edmap.get_energy_dispersion_matrix(positions, e_reco, migra_step), data
+    )
+
+
 def test_edisp_map_stacking():
     edmap1 = make_edisp_map_test()
     edmap2 = make_edisp_map_test()
     edmap2.exposure_map.quantity *= 2
 
-    edmap_stack = edmap1.stack(edmap2)
+    edmap_stack = make_edisp_map_test()
+    edmap_stack.stack(edmap2)
     assert_allclose(edmap_stack.edisp_map.data, edmap1.edisp_map.data)
     assert_allclose(edmap_stack.exposure_map.data, edmap1.exposure_map.data * 3)
@@ -1,22 +1,28 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 from numpy.testing import assert_allclose
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import SkyCoord, Angle
 from ...utils.testing import requires_data
 from ...maps import WcsGeom, HpxGeom, MapAxis, WcsNDMap
 from ...irf import EffectiveAreaTable2D
-from ..exposure import make_map_exposure_true_energy, _map_spectrum_weight
+from ..exposure import (
+    make_map_exposure_true_energy,
+    _map_spectrum_weight,
+    _get_aeff_offset_table,
+)
 from ...spectrum.models import ConstantModel
 
 pytest.importorskip("healpy")
 
 
+aeff_filename = (
+    "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
+)
+
+
 @pytest.fixture(scope="session")
 def aeff():
-    filename = (
-        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
-    )
-    return EffectiveAreaTable2D.read(filename, hdu="EFFECTIVE AREA")
+    return EffectiveAreaTable2D.read(aeff_filename, hdu="EFFECTIVE AREA")
 
 
 def geom(map_type, ebounds):
@@ -65,6 +71,32 @@ def test_make_map_exposure_true_energy(aeff, pars):
     assert_allclose(m.data.sum(), pars["sum"], rtol=1e-5)
 
 
+@requires_data("gammapy-data")
+def test_make_map_exposure_true_energy_offset_step(aeff):
+    axis = MapAxis.from_edges([0.1, 1, 10], name="energy", unit="TeV", interp="log")
+    geom = WcsGeom.create(npix=(40, 30), binsz=0.1, axes=[axis])
+    kwargs = dict(pointing=SkyCoord(0.5, 1, unit="deg"), livetime="42 s", geom=geom)
+
+    expected = make_map_exposure_true_energy(aeff=aeff, **kwargs)
+    actual = make_map_exposure_true_energy(aeff=aeff, offset_step="0.01 deg", **kwargs)
+
+    assert actual.unit == "m2 s"
+    assert_allclose(actual.data, expected.data, rtol=1e-3)
+
+    # the offset table is reused for effective areas with identical data
+    table = _get_aeff_offset_table(aeff, axis.center, Angle("0.01 deg"), 10)
+    aeff_copy = EffectiveAreaTable2D.read(aeff_filename, hdu="EFFECTIVE AREA")
+    table_copy = _get_aeff_offset_table(aeff_copy, axis.center, Angle("0.01 deg"), 10)
+    assert table_copy is table
+    assert table.shape == (2, 16)
+
+    # a larger table also serves requests for fewer offset bins
+    table_large = _get_aeff_offset_table(aeff, axis.center, Angle("0.01 deg"), 20)
+    assert table_large.shape == (2, 32)
+    assert_allclose(table_large[:, :16].value, table.value)
+    assert _get_aeff_offset_table(aeff, axis.center, Angle("0.01 deg"), 5) is table_large
+
+
 def test_map_spectrum_weight():
     axis = MapAxis.from_edges([0.1, 10, 1000], unit="TeV", name="energy")
     expo_map = WcsNDMap.create(npix=10, binsz=1, axes=[axis], unit="m2 s")
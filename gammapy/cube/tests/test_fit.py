@@ -1,7 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
@@ -12,7 +12,7 @@ from ...irf.energy_dispersion import EnergyDispersion
 from ...maps import MapAxis, WcsGeom, WcsNDMap, Map
 from ...image.models import SkyGaussian
 from ...spectrum.models import PowerLaw
-from ..models import SkyModel, BackgroundModel
+from ..models import SkyModel, SkyModels, BackgroundModel
 from .. import MapDataset, make_map_exposure_true_energy, PSFKernel
 
 
@@ -188,6 +188,54 @@ def test_map_fit(sky_model):
         dataset_1.npred()
 
 
+@requires_data("gammapy-data")
+@pytest.mark.parametrize("evaluation_mode", ["local", "global"])
+def test_map_dataset_npred_cache(sky_model, evaluation_mode):
+    ebounds = np.logspace(-1.0, 1.0, 3)
+    ebounds_true = np.logspace(-1.0, 1.0, 4)
+    geom_r = geom(ebounds)
+    geom_t = geom_etrue(ebounds_true)
+
+    background_model = BackgroundModel(background(geom_r))
+    sky_model_2 = sky_model.copy()
+    sky_model_2.spatial_model.lon_0.value = -0.2
+
+    dataset = MapDataset(
+        model=SkyModels([sky_model, sky_model_2]),
+        exposure=exposure(geom_t),
+        psf=psf(geom_t),
+        edisp=edisp(geom_r, geom_t),
+        background_model=background_model,
+        evaluation_mode=evaluation_mode,
+    )
+
+    npred = dataset.npred()
+    assert dataset.npred_cache_stats == {"hits": 0, "misses": 2}
+
+    assert_allclose(dataset.npred().data, npred.data)
+    assert dataset.npred_cache_stats == {"hits": 2, "misses": 2}
+
+    sky_model_2.spectral_model.amplitude.value *= 2
+    npred_2 = dataset.npred()
+    assert dataset.npred_cache_stats == {"hits": 3, "misses": 3}
+
+    # the result does not depend on the history of previous calls
+    sky_model_2.spectral_model.amplitude.value /= 2
+    assert_equal(dataset.npred().data, npred.data)
+    sky_model_2.spectral_model.amplitude.value *= 2
+    assert_equal(dataset.npred().data, npred_2.data)
+
+    dataset_2 = MapDataset(
+        model=SkyModels([sky_model, sky_model_2]),
+        exposure=dataset.exposure,
+        psf=dataset.psf,
+        edisp=dataset.edisp,
+        background_model=background_model,
+        evaluation_mode=evaluation_mode,
+    )
+    assert_allclose(npred_2.data, dataset_2.npred().data, rtol=1e-10, atol=1e-12)
+
+
 @requires_dependency("iminuit")
 @requires_data("gammapy-data")
 def test_map_fit_one_energy_bin(sky_model):
@@ -236,3 +284,48 @@ def test_map_fit_one_energy_bin(sky_model):
 
     assert_allclose(pars["amplitude"].value, 1e-11, rtol=1e-2)
     assert_allclose(pars.error("amplitude"), 2.163318e-12, rtol=1e-2)
+
+
+@requires_data("gammapy-data")
+@pytest.mark.parametrize("evaluation_mode", ["local", "global"])
+def test_map_dataset_likelihood_gradient(sky_model, evaluation_mode):
+    ebounds = np.logspace(-1.0, 1.0, 3)
+    ebounds_true = np.logspace(-1.0, 1.0, 4)
+    geom_r = geom(ebounds)
+    geom_t = geom_etrue(ebounds_true)
+
+    background_model = BackgroundModel(background(geom_r))
+    background_model.tilt.frozen = False
+    dataset = MapDataset(
+        model=sky_model,
+        exposure=exposure(geom_t),
+        psf=psf(geom_t),
+        edisp=edisp(geom_r, geom_t),
+        background_model=background_model,
+        evaluation_mode=evaluation_mode,
+    )
+    dataset.counts = dataset.npred()
+
+    # move away from the best fit, so that the gradient does not vanish
+    sky_model.spatial_model.lon_0.value = 0.25
+    sky_model.spatial_model.sigma.value = 0.15
+    sky_model.spectral_model.index.value = 2.8
+    background_model.norm.value = 1.1
+
+    parameters = dataset.parameters
+    gradient = dataset.likelihood_gradient(parameters)
+
+    for par, grad in zip(parameters.parameters, gradient):
+        if par.frozen:
+            assert grad == 0
+            continue
+
+        value = par.value
+        step = 1e-4 * abs(value) or 1e-4
+        par.value = value + step
+        upper = dataset.likelihood(parameters)
+        par.value = value - step
+        lower = dataset.likelihood(parameters)
+        par.value = value
+
+        assert_allclose(grad, (upper - lower) / (2 * step), rtol=1e-3)
@@ -6,7 +6,7 @@ import astropy.units as u
 from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
 from ...utils.testing import requires_data
-from ...data import DataStore
+from ...data import DataStore, HDUCache
 from ...maps import WcsGeom, MapAxis, Map
 from ..make import MapMaker, MapMakerRing
 from ...background import RingBackgroundEstimator
@@ -133,3 +133,65 @@ def test_map_maker_ring(observations):
     assert_allclose(np.nansum(images["on"].data), 21981, rtol=1e-2)
     assert_allclose(np.nansum(images["exposure_off"].data), 109751.45, rtol=1e-2)
     assert images["on"].geom.is_image is True
+
+
+@requires_data("gammapy-data")
+def test_map_maker_n_jobs(observations):
+    geomd = geom(ebounds=[0.1, 1, 10])
+    maps = MapMaker(geom=geomd, offset_max="2 deg").run(observations)
+    maps_parallel = MapMaker(geom=geomd, offset_max="2 deg", n_jobs=2).run(observations)
+
+    for name in ["counts", "exposure", "background"]:
+        assert_allclose(maps_parallel[name].data, maps[name].data)
+
+
+class _ObservationWrapper:
+    """Observation that is not a `DataStoreObservation`."""
+
+    def __init__(self, observation):
+        self.observation = observation
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name == "observation":
+            raise AttributeError(name)
+        return getattr(self.observation, name)
+
+
+@requires_data("gammapy-data")
+def test_map_maker_n_jobs_other_observations(observations):
+    geomd = geom(ebounds=[0.1, 1, 10])
+    maps = MapMaker(geom=geomd, offset_max="2 deg").run(observations)
+
+    wrapped = [_ObservationWrapper(obs) for obs in observations]
+    maker = MapMaker(geom=geomd, offset_max="2 deg", n_jobs=2)
+    maps_parallel = maker.run(wrapped, selection=["counts"])
+    assert_allclose(maps_parallel["counts"].data, maps["counts"].data)
+
+
+@requires_data("gammapy-data")
+def test_map_maker_n_jobs_hdu_cache():
+    data_store = DataStore.from_dir("$GAMMAPY_DATA/cta-1dc/index/gps/")
+    data_store.hdu_cache = HDUCache(max_size=8)
+    observations = data_store.get_observations([110380, 111140])
+
+    geomd = geom(ebounds=[0.1, 1, 10])
+    maps = MapMaker(geom=geomd, offset_max="2 deg").run(observations)
+    maps_parallel = MapMaker(geom=geomd, offset_max="2 deg", n_jobs=2).run(observations)
+
+    for name in ["counts", "exposure", "background"]:
+        assert_allclose(maps_parallel[name].data, maps[name].data)
+
+
+@requires_data("gammapy-data")
+def test_map_maker_background_time_slices(observations):
+    geomd = geom(ebounds=[0.1, 1, 10])
+    maps = MapMaker(geom=geomd, offset_max="2 deg").run(observations)
+
+    maker = MapMaker(geom=geomd, offset_max="2 deg", background_time_slices=4)
+    assert maker._get_obs_maker(observations[0]).background_time_slices == 4
+    maps_sliced = maker.run(observations, selection=["background"])
+
+    # The CTA 1DC background models are radially symmetric
+    assert_allclose(
+        maps_sliced["background"].data.sum(), maps["background"].data.sum(), rtol=1e-2
+    )
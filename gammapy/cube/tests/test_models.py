@@ -411,3 +411,28 @@ class TestSkyModelMapEvaluator:
         assert out.data.shape == (2, 4, 5)
         assert_allclose(out.data.sum(), 2.253073467739508e-06, rtol=1e-5)
         assert_allclose(out.data[0, 0, 0], 2.407252e-08, rtol=1e-5)
+
+    @staticmethod
+    def test_compute_npred_separable(sky_model, exposure, psf, edisp):
+        evaluator = MapEvaluator(sky_model.copy(), exposure, psf=psf, edisp=edisp)
+        assert evaluator.is_separable
+
+        def compute_npred_full():
+            flux = evaluator.compute_flux()
+            npred = evaluator.apply_psf(evaluator.apply_exposure(flux))
+            return evaluator.apply_edisp(npred)
+
+        out = evaluator.compute_npred()
+        assert_allclose(out.data, compute_npred_full().data, rtol=1e-5)
+        exposure_psf = evaluator._separable_cache["exposure_psf"]
+
+        # changing a spectral parameter keeps the cached spatial part
+        evaluator.model.spectral_model.index.value += 0.5
+        out = evaluator.compute_npred()
+        assert evaluator._separable_cache["exposure_psf"] is exposure_psf
+        assert_allclose(out.data, compute_npred_full().data, rtol=1e-5)
+
+        evaluator.model.spatial_model.lon_0.value += 0.5
+        out = evaluator.compute_npred()
+        assert evaluator._separable_cache["exposure_psf"] is not exposure_psf
+        assert_allclose(out.data, compute_npred_full().data, rtol=1e-5)
@@ -122,6 +122,36 @@ def test_psfmap_to_psf_kernel():
     assert_allclose(psfkernel.psf_kernel_map.data.sum(axis=(1, 2)), 1.0, atol=1e-7)
 
 
+def test_psfmap_get_psf_kernels():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+
+    energy_axis = psfmap.psf_map.geom.axes[1]
+    kern_geom = WcsGeom.create(binsz=0.02, width=5.0, axes=[energy_axis])
+    positions = SkyCoord([1, 1.02, -1], [1, 1, 0.5], unit="deg")
+
+    kernels = psfmap.get_psf_kernels(positions, kern_geom, max_radius=1 * u.deg)
+    assert len(kernels) == 3
+
+    # positions in the same PSF map pixel share the cached kernel
+    assert kernels[0] is kernels[1]
+    assert kernels[0] is not kernels[2]
+
+    kernel = psfmap.get_psf_kernels(positions[2], kern_geom, max_radius=1 * u.deg)[0]
+    assert kernel is kernels[2]
+    assert_allclose(kernels[2].psf_kernel_map.data.sum(axis=(1, 2)), 1.0, atol=1e-7)
+
+    # get_psf_kernel interpolates the PSF and does not use the cache
+    kernel = psfmap.get_psf_kernel(positions[2], kern_geom, max_radius=1 * u.deg)
+    assert kernel is not kernels[2]
+    assert_allclose(kernel.psf_kernel_map.data.sum(axis=(1, 2)), 1.0, atol=1e-7)
+
+    psfmap.kernel_cache_size = 1
+    psfmap.get_psf_kernels(positions[0], kern_geom, max_radius=1 * u.deg)
+    kernel = psfmap.get_psf_kernels(positions[2], kern_geom, max_radius=1 * u.deg)[0]
+    assert kernel is not kernels[2]
+    assert_allclose(kernel.data, kernels[2].data)
+
+
 def test_psfmap_to_from_hdulist():
     psfmap = make_test_psfmap(0.15 * u.deg)
     hdulist = psfmap.to_hdulist(psf_hdu="PSF", psf_hdubands="BANDS")
@@ -168,16 +198,56 @@ def test_psfmap_stacking():
     psfmap2 = make_test_psfmap(0.1 * u.deg, shape="flat")
     psfmap2.exposure_map.quantity *= 2
 
-    psfmap_stack = psfmap1.stack(psfmap2)
+    psfmap_stack = make_test_psfmap(0.1 * u.deg, shape="flat")
+    psfmap_stack.stack(psfmap2)
     assert_allclose(psfmap_stack.psf_map.data, psfmap1.psf_map.data)
     assert_allclose(psfmap_stack.exposure_map.data, psfmap1.exposure_map.data * 3)
 
     psfmap3 = make_test_psfmap(0.3 * u.deg, shape="flat")
-    psfmap_stack = psfmap1.stack(psfmap3)
+    psfmap1.stack(psfmap3)
+
+    assert_allclose(psfmap1.psf_map.data[0, 40, 20, 20], 0.0)
+    assert_allclose(psfmap1.psf_map.data[0, 20, 20, 20], 5805.28955078125)
+    assert_allclose(psfmap1.psf_map.data[0, 0, 20, 20], 58052.78955078125)
+
+
+def test_psfmap_stacking_shared_exposure():
+    psfmap = make_test_psfmap(0.1 * u.deg, shape="flat")
+    psf_map, exposure_map = psfmap.psf_map, psfmap.exposure_map
+    data = exposure_map.data.copy()
+    psf_data = psf_map.data.copy()
+
+    psfmap_1 = PSFMap(psf_map, exposure_map)
+    psfmap_2 = PSFMap(psf_map, exposure_map)
+    psfmap_1.stack(make_test_psfmap(0.3 * u.deg, shape="flat"))
+    psfmap_2.stack(psfmap)
+
+    assert_allclose(psfmap_1.exposure_map.data, 2 * data)
+    assert_allclose(psfmap_2.exposure_map.data, 2 * data)
+    assert_allclose(exposure_map.data, data)
+    assert_allclose(psf_map.data, psf_data)
+    assert_allclose(psfmap_2.psf_map.data, psf_data)
+
+
+def test_make_psf_map_offset_binned():
+    psf = fake_psf3d(0.3 * u.deg)
+
+    pointing = SkyCoord(0, 0, unit="deg")
+    energy_axis = MapAxis(nodes=[0.2, 0.7, 1.5, 2.0, 10.0], unit="TeV", name="energy")
+    rad_axis = MapAxis(nodes=np.linspace(0.0, 1.0, 51), unit="deg", name="theta")
+
+    geom = WcsGeom.create(
+        skydir=pointing, binsz=0.2, width=5, axes=[rad_axis, energy_axis]
+    )
+
+    psfmap = make_psf_map(psf, pointing, geom, 3 * u.deg)
+    psfmap_binned = make_psf_map(
+        psf, pointing, geom, 3 * u.deg, offset_binsz=0.01 * u.deg, dtype="float32"
+    )
 
-    assert_allclose(psfmap_stack.psf_map.data[0, 40, 20, 20], 0.0)
-    assert_allclose(psfmap_stack.psf_map.data[0, 20, 20, 20], 5805.28955078125)
-    assert_allclose(psfmap_stack.psf_map.data[0, 0, 20, 20], 58052.78955078125)
+    assert psfmap.psf_map.data.dtype == np.float64
+    assert psfmap_binned.psf_map.data.dtype == np.float32
+    assert_allclose(psfmap_binned.psf_map.data, psfmap.psf_map.data, rtol=1e-2)
 
 
 # TODO: add a test comparing make_mean_psf and PSFMap.stack for a set of observations in an Observations
@@ -2,6 +2,7 @@
 """Data and observation handling."""
 from .pointing import *
 from .data_store import *
+from .data_store_cache import *
 from .event_list import *
 from .gti import *
 from .hdu_index_table import *
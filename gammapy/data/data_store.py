@@ -5,6 +5,7 @@ from ..utils.scripts import make_path
 from ..utils.testing import Checker
 from .obs_table import ObservationTable
 from .hdu_index_table import HDUIndexTable
+from .data_store_cache import DataStoreCache
 from .obs_table import ObservationTableChecker
 from .observations import DataStoreObservation, Observations, ObservationChecker
 
@@ -27,6 +28,12 @@ class DataStore:
         HDU index table
     obs_table : `~gammapy.data.ObservationTable`
         Observation index table
+    hdu_cache : `~gammapy.data.HDUCache`
+        Cache for loaded HDU objects. If None, every access reads the data
+        from disk.
+    index_cache : `~gammapy.data.DataStoreCache`
+        On-disk cache for parsed index tables and GTIs. If None, the FITS
+        files are parsed on every access.
 
     Examples
     --------
@@ -35,6 +42,16 @@ class DataStore:
     >>> from gammapy.data import DataStore
     >>> data_store = DataStore.from_dir('$GAMMAPY_DATA/hess-dl3-dr1')
     >>> data_store.info()
+
+    To avoid reading the same IRFs from disk repeatedly, set a cache:
+
+    >>> from gammapy.data import HDUCache
+    >>> data_store.hdu_cache = HDUCache(max_size=64)
+
+    To start quickly in many short-lived processes, keep the parsed index
+    tables in a cache directory:
+
+    >>> data_store = DataStore.from_dir('$GAMMAPY_DATA/hess-dl3-dr1', cache_dir='cache')
     """
 
     DEFAULT_HDU_TABLE = "hdu-index.fits.gz"
@@ -43,15 +60,19 @@ class DataStore:
     DEFAULT_OBS_TABLE = "obs-index.fits.gz"
     """Default observation table filename."""
 
-    def __init__(self, hdu_table=None, obs_table=None):
+    def __init__(self, hdu_table=None, obs_table=None, hdu_cache=None, index_cache=None):
         self.hdu_table = hdu_table
         self.obs_table = obs_table
+        self.hdu_cache = hdu_cache
+        self.index_cache = index_cache
 
     def __str__(self):
         return self.info(show=False)
 
     @classmethod
-    def from_file(cls, filename, hdu_hdu="HDU_INDEX", hdu_obs="OBS_INDEX"):
+    def from_file(
+        cls, filename, hdu_hdu="HDU_INDEX", hdu_obs="OBS_INDEX", cache_dir=None
+    ):
         """Create from a FITS file.
 
         The FITS file must contain both index files.
@@ -64,17 +85,28 @@ class DataStore:
             FITS HDU name or number for the HDU index table
         hdu_obs : str or int
             FITS HDU name or number for the observation index table
+        cache_dir : str, Path
+            Directory of the `~gammapy.data.DataStoreCache` used to store
+            the parsed index tables. By default no cache is used.
         """
         filename = make_path(filename)
+        index_cache = DataStoreCache(cache_dir) if cache_dir else None
 
-        hdu_table = HDUIndexTable.read(filename, hdu=hdu_hdu, format="fits")
+        def read_tables():
+            hdu_table = HDUIndexTable.read(filename, hdu=hdu_hdu, format="fits")
+            obs_table = ObservationTable.read(filename, hdu=hdu_obs, format="fits")
+            return hdu_table, obs_table
 
-        obs_table = ObservationTable.read(filename, hdu=hdu_obs, format="fits")
-
-        return cls(hdu_table=hdu_table, obs_table=obs_table)
+        name = "index-{}-{}".format(hdu_hdu, hdu_obs)
+        hdu_table, obs_table = cls._read_index_tables(
+            read_tables, index_cache, name, [filename]
+        )
+        return cls(hdu_table=hdu_table, obs_table=obs_table, index_cache=index_cache)
 
     @classmethod
-    def from_dir(cls, base_dir, hdu_table_filename=None, obs_table_filename=None):
+    def from_dir(
+        cls, base_dir, hdu_table_filename=None, obs_table_filename=None, cache_dir=None
+    ):
         """Create from a directory.
 
         Parameters
@@ -89,6 +121,9 @@ class DataStore:
             Filename of the observation index file. May be specified either relative
             to `base_dir` or as an absolute path. If None, the default filename
             will be looked for.
+        cache_dir : str, Path
+            Directory of the `~gammapy.data.DataStoreCache` used to store
+            the parsed index tables. By default no cache is used.
         """
         base_dir = make_path(base_dir)
 
@@ -108,16 +143,43 @@ class DataStore:
 
         if not hdu_table_filename.exists():
             raise IOError("File not found: {}".format(hdu_table_filename))
-        log.debug("Reading {}".format(hdu_table_filename))
-        hdu_table = HDUIndexTable.read(str(hdu_table_filename), format="fits")
-        hdu_table.meta["BASE_DIR"] = str(base_dir)
 
         if not obs_table_filename.exists():
             raise IOError("File not found: {}".format(obs_table_filename))
-        log.debug("Reading {}".format(str(obs_table_filename)))
-        obs_table = ObservationTable.read(str(obs_table_filename), format="fits")
 
-        return cls(hdu_table=hdu_table, obs_table=obs_table)
+        index_cache = DataStoreCache(cache_dir) if cache_dir else None
+
+        def read_tables():
+            log.debug("Reading {}".format(hdu_table_filename))
+            hdu_table = HDUIndexTable.read(str(hdu_table_filename), format="fits")
+            log.debug("Reading {}".format(str(obs_table_filename)))
+            obs_table = ObservationTable.read(str(obs_table_filename), format="fits")
+            return hdu_table, obs_table
+
+        hdu_table, obs_table = cls._read_index_tables(
+            read_tables, index_cache, "index", [hdu_table_filename, obs_table_filename]
+        )
+        hdu_table.meta["BASE_DIR"] = str(base_dir)
+
+        return cls(hdu_table=hdu_table, obs_table=obs_table, index_cache=index_cache)
+
+    @staticmethod
+    def _read_index_tables(read_tables, index_cache, name, filenames):
+        """Read HDU and observation index table, using the cache if given."""
+        if index_cache is None:
+            return read_tables()
+
+        tables = index_cache.read_tables(name, filenames)
+        if tables is None:
+            hdu_table, obs_table = read_tables()
+            index_cache.write_tables(
+                name, filenames, {"hdu": hdu_table, "obs": obs_table}
+            )
+            return hdu_table, obs_table
+
+        hdu_table = HDUIndexTable(tables["hdu"], copy=False)
+        obs_table = ObservationTable(tables["obs"], copy=False)
+        return hdu_table, obs_table
 
     @classmethod
     def from_config(cls, config):
@@ -185,6 +247,10 @@ class DataStore:
     def get_observations(self, obs_id, skip_missing=False):
         """Generate a `~gammapy.data.Observations`.
 
+        The observation data is loaded lazily on access. To read the data of
+        the next observations in background threads while iterating, use
+        `~gammapy.data.Observations.prefetch`.
+
         Parameters
         ----------
         obs_id : list
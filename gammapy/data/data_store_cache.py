@@ -0,0 +1,219 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import hashlib
+import json
+import logging
+import os
+import zipfile
+import zlib
+from collections import OrderedDict
+import numpy as np
+from astropy.table import Table, MaskedColumn
+from ..utils.scripts import make_path
+from .gti import GTI
+
+__all__ = ["DataStoreCache"]
+
+log = logging.getLogger(__name__)
+
+
+class DataStoreCache:
+    """On-disk cache for the parsed data store index tables and GTIs.
+
+    Parsed tables are stored as ``.npz`` files in ``cache_dir``, together
+    with a header holding the cache format version and a signature of the
+    source files (path, size and modification time, optionally a CRC32
+    checksum of the content). A cache entry is only used if the signature
+    of the source files still matches, otherwise it is re-created.
+
+    This avoids parsing the FITS index files and GTI tables again in every
+    new process that opens the same data store. Column masks are stored,
+    column descriptions and formats are not. Tables with meta data that
+    can't be stored as JSON are not cached.
+
+    Parameters
+    ----------
+    cache_dir : str, `~pathlib.Path`
+        Cache directory. Is created if it doesn't exist.
+    checksum : bool
+        Include a CRC32 checksum of the source file content in the signature.
+        This is more robust against files modified in place, but requires
+        reading the source files.
+
+    Examples
+    --------
+    >>> from gammapy.data import DataStore
+    >>> data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1", cache_dir="cache")
+    """
+
+    VERSION = 2
+    """Cache format version."""
+
+    def __init__(self, cache_dir, checksum=False):
+        self.cache_dir = make_path(cache_dir)
+        self.checksum = checksum
+
+    def __repr__(self):
+        return "{}(cache_dir={!r})".format(self.__class__.__name__, str(self.cache_dir))
+
+    def _signature(self, filenames):
+        signature = []
+        for filename in filenames:
+            filename = make_path(filename).resolve()
+            stat = filename.stat()
+            entry = [str(filename), stat.st_size, stat.st_mtime_ns]
+
+            if self.checksum:
+                with filename.open("rb") as fh:
+                    entry.append(zlib.crc32(fh.read()))
+
+            signature.append(entry)
+
+        return {"version": self.VERSION, "sources": signature}
+
+    def _filename(self, name, filenames):
+        paths = [str(make_path(_).resolve()) for _ in filenames]
+        key = hashlib.sha1(json.dumps(paths).encode()).hexdigest()[:16]
+        return self.cache_dir / "{}-{}.npz".format(name, key)
+
+    def read_tables(self, name, filenames):
+        """Read cached tables.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache entry.
+        filenames : list
+            Source files the tables were created from.
+
+        Returns
+        -------
+        tables : `~collections.OrderedDict` or None
+            Dict of `~astropy.table.Table`, or None if there is no valid entry.
+        """
+        path = self._filename(name, filenames)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(str(path), allow_pickle=False) as data:
+                header = json.loads(str(data["header"]))
+                if header["signature"] != self._signature(filenames):
+                    log.debug("Cache entry out of date: {}".format(path))
+                    return None
+
+                tables = OrderedDict()
+                for table_name, info in header["tables"].items():
+                    tables[table_name] = _table_from_arrays(data, table_name, info)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as err:
+            log.warning("Ignoring invalid cache entry {}: {}".format(path, err))
+            return None
+
+        log.debug("Read cache entry: {}".format(path))
+        return tables
+
+    def write_tables(self, name, filenames, tables):
+        """Write tables to the cache.
+
+        The file is written to a temporary file and then renamed, so that
+        concurrent processes never read a partially written entry.
+
+        Tables with meta data that can't be stored as JSON are not written,
+        a warning is logged instead.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache entry.
+        filenames : list
+            Source files the tables were created from.
+        tables : dict
+            Dict of `~astropy.table.Table`.
+        """
+        path = self._filename(name, filenames)
+
+        arrays, infos = {}, OrderedDict()
+        for table_name, table in tables.items():
+            infos[table_name] = _table_to_arrays(table, table_name, arrays)
+
+        header = {"signature": self._signature(filenames), "tables": infos}
+        try:
+            arrays["header"] = np.array(json.dumps(header))
+        except TypeError as err:
+            log.warning("Not writing cache entry {}: {}".format(path, err))
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        path_tmp = path.parent / "{}.{}.tmp".format(path.name, os.getpid())
+        with path_tmp.open("wb") as fh:
+            np.savez(fh, **arrays)
+        os.replace(str(path_tmp), str(path))
+        log.debug("Wrote cache entry: {}".format(path))
+
+    def load_gti(self, location):
+        """Load GTI, using the cache.
+
+        Parameters
+        ----------
+        location : `~gammapy.data.HDULocation`
+            HDU location of the GTI.
+
+        Returns
+        -------
+        gti : `~gammapy.data.GTI`
+            Good time intervals.
+        """
+        filenames = [location.path()]
+        name = "gti-{}-{}".format(location.obs_id, location.hdu_name)
+        tables = self.read_tables(name, filenames)
+
+        if tables is None:
+            gti = location.load()
+            self.write_tables(name, filenames, {"gti": gti.table})
+            return gti
+
+        return GTI(tables["gti"])
+
+    def clear(self):
+        """Remove all cache entries."""
+        for path in self.cache_dir.glob("*.npz"):
+            path.unlink()
+
+
+def _table_to_arrays(table, table_name, arrays):
+    """Add table columns to ``arrays`` and return column and meta info."""
+    columns = []
+    for idx, column in enumerate(table.columns.values()):
+        data = np.asarray(column)
+        if data.dtype.kind == "O":
+            data = data.astype(str)
+
+        arrays["{}_{}".format(table_name, idx)] = data
+
+        masked = isinstance(column, MaskedColumn)
+        if masked:
+            arrays["{}_{}_mask".format(table_name, idx)] = np.asarray(column.mask)
+
+        unit = column.unit.to_string() if column.unit is not None else None
+        columns.append([column.name, unit, masked])
+
+    return {"columns": columns, "meta": list(table.meta.items())}
+
+
+def _table_from_arrays(data, table_name, info):
+    columns = []
+    for idx, (name, _, masked) in enumerate(info["columns"]):
+        column = data["{}_{}".format(table_name, idx)]
+        if masked:
+            mask = data["{}_{}_mask".format(table_name, idx)]
+            column = MaskedColumn(column, name=name, mask=mask)
+        columns.append(column)
+
+    names = [name for name, _, _ in info["columns"]]
+    table = Table(columns, names=names, meta=OrderedDict(info["meta"]))
+
+    for name, unit, _ in info["columns"]:
+        if unit is not None:
+            table[name].unit = unit
+
+    return table
@@ -65,7 +65,7 @@ class EventListBase:
         self.table = table
 
     @classmethod
-    def read(cls, filename, **kwargs):
+    def read(cls, filename, columns=None, memmap=False, **kwargs):
         """Read from FITS file.
 
         Format specification: :ref:`gadf:iact-events`
@@ -74,12 +74,86 @@ class EventListBase:
         ----------
         filename : `pathlib.Path`, str
             Filename
+        columns : list of str
+            Names of the table columns to read. By default all columns are
+            read. Only the selected columns are loaded into memory.
+        memmap : bool
+            Memory-map the file. Columns are then only read from disk when
+            they are accessed, and selections such as `select_time`,
+            `select_energy` or `select_sky_cone` only read the columns they
+            need and copy only the selected rows.
+            Note that compressed files can't be memory-mapped.
+        **kwargs : dict
+            Keyword arguments passed to `~astropy.table.Table.read`.
+
+        Examples
+        --------
+        Read only the columns needed to fill a counts cube:
+
+        >>> from gammapy.data import EventList
+        >>> filename = '$GAMMAPY_DATA/cta-1dc/data/baseline/gps/gps_baseline_110380.fits'
+        >>> events = EventList.read(filename, columns=["RA", "DEC", "ENERGY"])
         """
         filename = make_path(filename)
         kwargs.setdefault("hdu", "EVENTS")
-        table = Table.read(str(filename), **kwargs)
+
+        # Memory-map if columns are selected, so only those are copied to memory
+        memmap = memmap or columns is not None
+        table = Table.read(str(filename), memmap=memmap, **kwargs)
+
+        if columns is not None:
+            table = table[list(columns)]
+
         return cls(table=table)
 
+    @classmethod
+    def read_chunks(cls, filename, chunk_size=1000000, columns=None, **kwargs):
+        """Iterate over fixed-size row blocks of an event list FITS file.
+
+        The file is memory-mapped and only the rows of the current block are
+        copied to memory, so event lists larger than the available memory can
+        be processed, e.g. with `~gammapy.cube.fill_map_counts`.
+        Note that compressed files can't be memory-mapped and are always
+        read completely.
+
+        Parameters
+        ----------
+        filename : `pathlib.Path`, str
+            Filename
+        chunk_size : int
+            Number of rows per block. The last block may be smaller.
+        columns : list of str
+            Names of the table columns to read. By default all columns are read.
+        **kwargs : dict
+            Keyword arguments passed to `~astropy.table.Table.read`.
+
+        Yields
+        ------
+        events : `EventListBase`
+            Event list with the rows of one block.
+
+        Examples
+        --------
+        >>> from gammapy.data import EventListLAT
+        >>> from gammapy.maps import Map
+        >>> from gammapy.cube import fill_map_counts
+        >>> filename = "$GAMMAPY_DATA/fermi-3fhl-gc/fermi-3fhl-gc-events.fits.gz"
+        >>> counts = Map.create(npix=(360, 180), binsz=1.0, proj="AIT", coordsys="GAL")
+        >>> fill_map_counts(counts, EventListLAT.read_chunks(filename, chunk_size=10000))
+        """
+        filename = make_path(filename)
+        kwargs.setdefault("hdu", "EVENTS")
+        table = Table.read(str(filename), memmap=True, **kwargs)
+
+        for start in range(0, len(table), chunk_size):
+            # Select the columns per block, so only the block is copied to memory
+            chunk = table[start : start + chunk_size]
+            if columns is not None:
+                chunk = chunk[list(columns)]
+            else:
+                chunk = chunk.copy()
+            yield cls(table=chunk)
+
     @classmethod
     def stack(cls, event_lists, **kwargs):
         """Stack (concatenate) list of event lists.
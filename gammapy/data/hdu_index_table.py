@@ -1,5 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import os
 import sys
+import threading
+from collections import OrderedDict
 import numpy as np
 import logging
 from astropy.io import fits
@@ -7,7 +10,7 @@ from astropy.table import Table
 from astropy.utils import lazyproperty
 from ..utils.scripts import make_path
 
-__all__ = ["HDULocation", "HDUIndexTable"]
+__all__ = ["HDULocation", "HDUIndexTable", "HDUCache"]
 
 log = logging.getLogger(__name__)
 
@@ -173,9 +176,12 @@ class HDUIndexTable(Table):
         location : `~gammapy.data.HDULocation`
             HDU location
         """
-        self._validate_selection(obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
+        index = self._index
+        self._validate_selection(
+            obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class, index=index
+        )
 
-        idx = self.row_idx(obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
+        idx = self._row_idx(index, obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
 
         if len(idx) == 1:
             idx = idx[0]
@@ -186,16 +192,19 @@ class HDUIndexTable(Table):
             )
         else:
             idx = idx[0]
-            log.warning(
-                "Found multiple HDU matching: OBS_ID = {}, HDU_TYPE = {}, HDU_CLASS = {}."
-                "".format(obs_id, hdu_type, hdu_class)
-                + " Returning the first entry, which has HDU_TYPE = {} and HDU_CLASS = {}"
-                "".format(self[idx]["HDU_TYPE"], self[idx]["HDU_CLASS"])
-            )
+            self._warn_multiple_match(obs_id, hdu_type, hdu_class, idx)
 
         return self.location_info(idx)
 
-    def _validate_selection(self, obs_id, hdu_type, hdu_class):
+    def _warn_multiple_match(self, obs_id, hdu_type, hdu_class, idx):
+        log.warning(
+            "Found multiple HDU matching: OBS_ID = {}, HDU_TYPE = {}, HDU_CLASS = {}."
+            "".format(obs_id, hdu_type, hdu_class)
+            + " Returning the first entry, which has HDU_TYPE = {} and HDU_CLASS = {}"
+            "".format(self[idx]["HDU_TYPE"], self[idx]["HDU_CLASS"])
+        )
+
+    def _validate_selection(self, obs_id, hdu_type, hdu_class, index=None):
         """Validate HDU selection.
 
         The goal is to give helpful error messages to the user.
@@ -215,7 +224,13 @@ class HDUIndexTable(Table):
             msg += "Valid values are: {}".format(valid)
             raise ValueError(msg)
 
-        if obs_id not in self["OBS_ID"]:
+        if obs_id is None:
+            return
+
+        if index is None:
+            index = self._index
+
+        if obs_id not in index["obs_id"]:
             raise IndexError("No entry available with OBS_ID = {}".format(obs_id))
 
     def row_idx(self, obs_id, hdu_type=None, hdu_class=None):
@@ -235,17 +250,20 @@ class HDUIndexTable(Table):
         idx : list of int
             List of row indices matching the selection.
         """
-        selection = self["OBS_ID"] == obs_id
+        return self._row_idx(self._index, obs_id, hdu_type, hdu_class)
+
+    @staticmethod
+    def _row_idx(index, obs_id, hdu_type=None, hdu_class=None):
+        idx = index["obs_id"].get(obs_id, [])
 
         if hdu_class:
-            is_hdu_class = self._hdu_class_stripped == hdu_class
-            selection &= is_hdu_class
+            idx_class = set(index["hdu_class"].get((obs_id, hdu_class), []))
+            idx = [_ for _ in idx if _ in idx_class]
 
         if hdu_type:
-            is_hdu_type = self._hdu_type_stripped == hdu_type
-            selection &= is_hdu_type
+            idx_type = set(index["hdu_type"].get((obs_id, hdu_type), []))
+            idx = [_ for _ in idx if _ in idx_type]
 
-        idx = np.where(selection)[0]
         return list(idx)
 
     def location_info(self, idx):
@@ -261,13 +279,156 @@ class HDUIndexTable(Table):
             hdu_name=row["HDU_NAME"].strip(),
         )
 
-    @lazyproperty
+    def hdu_locations(self, obs_ids, hdu_type=None, hdu_class=None):
+        """Create `HDULocation` objects for many observations.
+
+        Equivalent to calling `hdu_location` for every observation, but all
+        observation IDs are looked up at once with array operations.
+
+        Parameters
+        ----------
+        obs_ids : list of int
+            Observation IDs
+        hdu_type : str
+            HDU type (see `~gammapy.data.HDUIndexTable.VALID_HDU_TYPE`)
+        hdu_class : str
+            HDU class (see `~gammapy.data.HDUIndexTable.VALID_HDU_CLASS`)
+
+        Returns
+        -------
+        locations : list of `~gammapy.data.HDULocation`
+            HDU locations, in the order of ``obs_ids``
+        """
+        index = self._index
+        self._validate_selection(
+            obs_id=None, hdu_type=hdu_type, hdu_class=hdu_class, index=index
+        )
+
+        obs_ids = np.asarray(obs_ids, dtype=self["OBS_ID"].dtype)
+        obs_id_sel, rows_sel, counts_sel = self._selection_rows(
+            index, hdu_type, hdu_class
+        )
+
+        pos = np.searchsorted(obs_id_sel, obs_ids)
+        found = np.zeros(len(obs_ids), dtype=bool)
+        if len(obs_id_sel) > 0:
+            pos = np.clip(pos, 0, len(obs_id_sel) - 1)
+            found = obs_id_sel[pos] == obs_ids
+
+        if not found.all():
+            obs_id = obs_ids[~found][0]
+            self._validate_selection(
+                obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class, index=index
+            )
+            raise IndexError(
+                "No HDU found matching: OBS_ID = {}, HDU_TYPE = {}, HDU_CLASS = {}"
+                "".format(obs_id, hdu_type, hdu_class)
+            )
+
+        rows = rows_sel[pos]
+
+        multiple = counts_sel[pos] > 1
+        for obs_id, idx in zip(obs_ids[multiple], rows[multiple]):
+            self._warn_multiple_match(obs_id, hdu_type, hdu_class, idx)
+
+        base_dir = self.base_dir.as_posix()
+        columns = [
+            self["OBS_ID"].data[rows],
+            index["hdu_type_stripped"][rows],
+            index["hdu_class_stripped"][rows],
+            [_.strip() for _ in self["FILE_DIR"][rows]],
+            [_.strip() for _ in self["FILE_NAME"][rows]],
+            [_.strip() for _ in self["HDU_NAME"][rows]],
+        ]
+
+        return [
+            HDULocation(
+                obs_id=obs_id,
+                hdu_type=hdu_type_,
+                hdu_class=hdu_class_,
+                base_dir=base_dir,
+                file_dir=file_dir,
+                file_name=file_name,
+                hdu_name=hdu_name,
+            )
+            for obs_id, hdu_type_, hdu_class_, file_dir, file_name, hdu_name in zip(*columns)
+        ]
+
+    @property
+    def _index(self):
+        """Dict index from OBS_ID, (OBS_ID, HDU_TYPE) and (OBS_ID, HDU_CLASS) to rows.
+
+        The index is built on first access and rebuilt if the number of rows
+        changes. After changing the table in place, e.g. with ``sort`` or by
+        setting values, call ``_reset_index``.
+        """
+        index = self.__dict__.get("_index_cache")
+        if index is not None and index["n_rows"] == len(self):
+            return index
+
+        hdu_type = np.array([_.strip() for _ in self["HDU_TYPE"]])
+        hdu_class = np.array([_.strip() for _ in self["HDU_CLASS"]])
+
+        index = {
+            "n_rows": len(self),
+            "selections": {},
+            "obs_id": {},
+            "hdu_type": {},
+            "hdu_class": {},
+            "hdu_type_stripped": hdu_type,
+            "hdu_class_stripped": hdu_class,
+        }
+
+        rows = zip(self["OBS_ID"].data.tolist(), hdu_type.tolist(), hdu_class.tolist())
+        for idx, (obs_id, type_, class_) in enumerate(rows):
+            index["obs_id"].setdefault(obs_id, []).append(idx)
+            index["hdu_type"].setdefault((obs_id, type_), []).append(idx)
+            index["hdu_class"].setdefault((obs_id, class_), []).append(idx)
+
+        self.__dict__["_index_cache"] = index
+        return index
+
+    def _selection_rows(self, index, hdu_type, hdu_class):
+        """Rows matching a HDU selection, per OBS_ID.
+
+        Returns the sorted OBS_IDs with matching rows, the first matching row
+        and the number of matching rows for each of them. The result is
+        stored in the index.
+        """
+        key = (hdu_type, hdu_class)
+        selections = index["selections"]
+
+        if key not in selections:
+            mask = np.ones(len(self), dtype=bool)
+            if hdu_type:
+                mask &= index["hdu_type_stripped"] == hdu_type
+            if hdu_class:
+                mask &= index["hdu_class_stripped"] == hdu_class
+
+            rows = np.flatnonzero(mask)
+            obs_id, first, counts = np.unique(
+                self["OBS_ID"].data[rows], return_index=True, return_counts=True
+            )
+            selections[key] = obs_id, rows[first], counts
+
+        return selections[key]
+
+    def _reset_index(self):
+        """Drop the cached row index, it is rebuilt on next access.
+
+        Call this after changing the OBS_ID, HDU_TYPE or HDU_CLASS columns
+        in place, e.g. after ``table.sort("OBS_ID")`` or
+        ``table["OBS_ID"][idx] = 42``.
+        """
+        self.__dict__.pop("_index_cache", None)
+
+    @property
     def _hdu_class_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_CLASS"]])
+        return self._index["hdu_class_stripped"]
 
-    @lazyproperty
+    @property
     def _hdu_type_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_TYPE"]])
+        return self._index["hdu_type_stripped"]
 
     @lazyproperty
     def obs_id_unique(self):
@@ -297,3 +458,124 @@ class HDUIndexTable(Table):
                 "HDU_CLASS: {}".format(self.hdu_class_unique),
             ]
         )
+
+
+class HDUCache:
+    """Least recently used (LRU) cache for loaded HDU objects.
+
+    Objects are cached by file path, HDU name and file modification time,
+    so an IRF file shared by many observations is read and parsed once.
+    Cached objects are shared between observations and should not be
+    modified in place.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of cached objects. If exceeded, the least recently
+        used object is removed from the cache.
+    hdu_classes : list of str
+        HDU classes to cache (see `~gammapy.data.HDUIndexTable.VALID_HDU_CLASS`).
+        By default all HDU classes except ``"events"`` are cached.
+
+    Examples
+    --------
+    >>> from gammapy.data import DataStore, HDUCache
+    >>> data_store = DataStore.from_dir("$GAMMAPY_DATA/cta-1dc/index/gps")
+    >>> data_store.hdu_cache = HDUCache(max_size=32)
+    >>> observations = data_store.get_observations([110380, 111140])
+    >>> aeff = [obs.aeff for obs in observations]
+    >>> data_store.hdu_cache.info()
+    """
+
+    def __init__(self, max_size=128, hdu_classes=None):
+        if hdu_classes is None:
+            hdu_classes = [_ for _ in HDUIndexTable.VALID_HDU_CLASS if _ != "events"]
+
+        self.max_size = max_size
+        self.hdu_classes = hdu_classes
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __getstate__(self):
+        # The lock can't be pickled and the cached objects are not sent
+        # along, e.g. to the worker processes of a `~gammapy.cube.MapMaker`.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(location):
+        path = str(location.path(abs_path=True))
+        return path, location.hdu_name, os.path.getmtime(path)
+
+    def load(self, location):
+        """Load HDU as appropriate class, using the cache.
+
+        Parameters
+        ----------
+        location : `~gammapy.data.HDULocation`
+            HDU location
+
+        Returns
+        -------
+        object : object
+            Object depends on type, e.g. for `events` it's a `~gammapy.data.EventList`.
+        """
+        if location.hdu_class not in self.hdu_classes or self.max_size < 1:
+            return location.load()
+
+        key = self._key(location)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+
+            self.misses += 1
+
+        value = location.load()
+
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        """Remove all objects from the cache and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self):
+        """Cache statistics (dict)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self),
+            "max_size": self.max_size,
+        }
+
+    def info(self, show=True):
+        """Print some info."""
+        s = "HDU cache:\n"
+        s += "\n".join("{}: {}".format(key, val) for key, val in self.stats.items())
+
+        if show:
+            print(s)
+        else:
+            return s
@@ -155,6 +155,11 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
+        mask = self._range_mask(selection_variable, value_range, inverted)
+        return self[mask]
+
+    def _range_mask(self, selection_variable, value_range, inverted=False):
+        """Row mask for `select_range`."""
         value_range = Quantity(value_range)
 
         # read values into a quantity in case units have to be taken into account
@@ -168,7 +173,7 @@ class ObservationTable(Table):
         if inverted:
             mask = np.invert(mask)
 
-        return self[mask]
+        return mask
 
     def select_time_range(self, selection_variable, time_range, inverted=False):
         """Make an observation table, applying a time selection.
@@ -195,6 +200,11 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
+        mask = self._time_range_mask(selection_variable, time_range, inverted)
+        return self[mask]
+
+    def _time_range_mask(self, selection_variable, time_range, inverted=False):
+        """Row mask for `select_time_range`."""
         if self.meta["TIME_FORMAT"] == "absolute":
             # read times into a Time object
             time = Time(self[selection_variable])
@@ -209,7 +219,113 @@ class ObservationTable(Table):
         if inverted:
             mask = np.invert(mask)
 
-        return self[mask]
+        return mask
+
+    @property
+    def _sky_index(self):
+        """Spatial index on the pointing positions.
+
+        The pointing positions are stored as ICRS unit vectors in a
+        `~scipy.spatial.cKDTree`, so that sky region selections only have
+        to transform and test the observations close to the region.
+
+        The index is built on first access and rebuilt if the number of rows
+        changes. After changing the table in place, e.g. with ``sort`` or by
+        setting values, call ``_reset_index``.
+        """
+        from scipy.spatial import cKDTree
+        from ..catalog import skycoord_from_table
+
+        index = self.__dict__.get("_sky_index_cache")
+        if index is not None and index["n_rows"] == len(self):
+            return index
+
+        try:
+            skycoord = skycoord_from_table(self)
+        except KeyError:
+            skycoord = self.pointing_radec
+
+        xyz = skycoord.icrs.cartesian.xyz.value.T
+        index = {"n_rows": len(self), "skycoord": skycoord, "tree": cKDTree(xyz)}
+
+        self.__dict__["_sky_index_cache"] = index
+        return index
+
+    def _reset_index(self):
+        """Drop the cached row indices, they are rebuilt on next access.
+
+        Call this after changing the OBS_ID or pointing columns in place,
+        e.g. after ``table.sort("RA_PNT")`` or ``table["RA_PNT"][idx] = 83.6``.
+        """
+        self.__dict__.pop("_index_dict", None)
+        self.__dict__.pop("_sky_index_cache", None)
+
+    def _sky_cap_idx(self, center, radius):
+        """Row indices of pointings within ``radius`` of ``center`` (superset).
+
+        Parameters
+        ----------
+        center : `~astropy.coordinates.SkyCoord`
+            Cap center.
+        radius : `~astropy.coordinates.Angle`
+            Cap radius.
+        """
+        if radius >= Angle(180, "deg"):
+            return np.arange(len(self))
+
+        # chord length for the angular radius, with a small margin because
+        # the exact cut is applied afterwards on the candidates
+        chord = 2 * np.sin(0.5 * radius.to_value("rad")) + 1e-8
+        xyz = center.icrs.cartesian.xyz.value
+        idx = self._sky_index["tree"].query_ball_point(xyz, chord)
+        return np.array(sorted(idx), dtype=int)
+
+    def _sky_circle_mask(self, lon, lat, radius, frame="icrs", inverted=False):
+        """Row mask for a ``sky_circle`` selection."""
+        from ..catalog.utils import _sky_circle_mask
+
+        radius = Angle(radius)
+        center = SkyCoord(lon, lat, frame=frame)
+        idx = self._sky_cap_idx(center, radius)
+
+        mask = np.zeros(len(self), dtype=bool)
+        if len(idx) > 0:
+            skycoord = self._sky_index["skycoord"][idx]
+            mask[idx] = _sky_circle_mask(skycoord, lon, lat, radius, frame)
+
+        if inverted:
+            mask = np.invert(mask)
+
+        return mask
+
+    def _sky_box_mask(self, lon, lat, frame="icrs", inverted=False):
+        """Row mask for a ``sky_box`` selection.
+
+        Candidates are pre-selected with the smaller of the two polar caps
+        containing the latitude band of the box.
+        """
+        from ..catalog.utils import _sky_box_mask
+
+        lat = Angle(lat)
+        radius_north = Angle(90, "deg") - lat[0]
+        radius_south = Angle(90, "deg") + lat[1]
+
+        if radius_north <= radius_south:
+            pole = SkyCoord(0, 90, unit="deg", frame=frame)
+            idx = self._sky_cap_idx(pole, radius_north)
+        else:
+            pole = SkyCoord(0, -90, unit="deg", frame=frame)
+            idx = self._sky_cap_idx(pole, radius_south)
+
+        mask = np.zeros(len(self), dtype=bool)
+        if len(idx) > 0:
+            skycoord = self._sky_index["skycoord"][idx]
+            mask[idx] = _sky_box_mask(skycoord, lon, lat, frame)
+
+        if inverted:
+            mask = np.invert(mask)
+
+        return mask
 
     def select_observations(self, selection=None):
         """Select subset of observations.
@@ -263,11 +379,19 @@ class ObservationTable(Table):
         **inverted** flag, in which case, the selection is applied to keep all
         elements outside the selected range.
 
+        Several selection criteria can be given as a list, in which case only
+        the observations passing all of them are kept. The criteria are combined
+        as row masks, so the table is only copied once at the end.
+
+        Sky region selections use a spatial index on the pointing positions,
+        which is built on first use, so that only the observations close to
+        the region have to be transformed into the selection frame.
+
         A few examples of selection criteria are given below.
 
         Parameters
         ----------
-        selection : dict
+        selection : dict or list of dict
             Dictionary with a few keywords for applying selection cuts.
 
         Returns
@@ -305,23 +429,37 @@ class ObservationTable(Table):
         >>> selection = dict(type='par_box', variable='N_TELS',
         ...                  value_range=[4, 4])
         >>> selected_obs_table = obs_table.select_observations(selection)
+
+        >>> selection = [dict(type='sky_circle', frame='galactic',
+        ...                   lon=Angle(0, 'deg'), lat=Angle(0, 'deg'),
+        ...                   radius=Angle(5, 'deg'), border=Angle(0, 'deg')),
+        ...              dict(type='par_box', variable='ALT',
+        ...                   value_range=Angle([60., 70.], 'deg'))]
+        >>> selected_obs_table = obs_table.select_observations(selection)
         """
-        from ..catalog import select_sky_box, select_sky_circle
+        if selection is None:
+            selection = []
+        elif isinstance(selection, dict):
+            selection = [selection]
 
-        if "inverted" not in selection.keys():
-            selection["inverted"] = False
+        mask = np.ones(len(self), dtype=bool)
+        for _ in selection:
+            mask &= self._selection_mask(_)
+
+        return self[mask]
+
+    def _selection_mask(self, selection):
+        """Row mask for a single selection dict (see `select_observations`)."""
+        inverted = selection.get("inverted", False)
 
         if selection["type"] == "sky_circle":
-            lon = selection["lon"]
-            lat = selection["lat"]
             radius = selection["radius"] + selection["border"]
-            return select_sky_circle(
-                self,
-                lon_cen=lon,
-                lat_cen=lat,
+            return self._sky_circle_mask(
+                lon=selection["lon"],
+                lat=selection["lat"],
                 radius=radius,
                 frame=selection["frame"],
-                inverted=selection["inverted"],
+                inverted=inverted,
             )
 
         elif selection["type"] == "sky_box":
@@ -330,22 +468,16 @@ class ObservationTable(Table):
             border = selection["border"]
             lon = Angle([lon[0] - border, lon[1] + border])
             lat = Angle([lat[0] - border, lat[1] + border])
-            return select_sky_box(
-                self,
-                lon_lim=lon,
-                lat_lim=lat,
-                frame=selection["frame"],
-                inverted=selection["inverted"],
+            return self._sky_box_mask(
+                lon=lon, lat=lat, frame=selection["frame"], inverted=inverted
             )
 
         elif selection["type"] == "time_box":
-            return self.select_time_range(
-                "TSTART", selection["time_range"], selection["inverted"]
-            )
+            return self._time_range_mask("TSTART", selection["time_range"], inverted)
 
         elif selection["type"] == "par_box":
-            return self.select_range(
-                selection["variable"], selection["value_range"], selection["inverted"]
+            return self._range_mask(
+                selection["variable"], selection["value_range"], inverted
             )
 
         else:
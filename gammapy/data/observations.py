@@ -1,11 +1,13 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from collections import OrderedDict
 from astropy.coordinates import SkyCoord
 from astropy.units import Quantity
 from astropy.time import Time
-from .event_list import EventListChecker
+from .event_list import EventList, EventListChecker
 from ..utils.testing import Checker
 from ..utils.fits import earth_location_from_dict
 from ..utils.table import table_row_to_dict
@@ -35,12 +37,14 @@ class DataStoreObservation:
         # Assert that `obs_id` is available
         if obs_id not in data_store.obs_table["OBS_ID"]:
             raise ValueError("OBS_ID = {} not in obs index table.".format(obs_id))
-        if obs_id not in data_store.hdu_table["OBS_ID"]:
+        if not data_store.hdu_table.row_idx(obs_id):
             raise ValueError("OBS_ID = {} not in HDU index table.".format(obs_id))
 
         self.obs_id = obs_id
         self.data_store = data_store
         self.obs_filter = obs_filter or ObservationFilter()
+        # HDU objects loaded ahead of time by `Observations.prefetch`
+        self._prefetched = {}
 
     def __str__(self):
         ss = "Info for OBS_ID = {}\n".format(self.obs_id)
@@ -91,20 +95,118 @@ class DataStoreObservation:
         object : object
             Object depends on type, e.g. for `events` it's a `~gammapy.data.EventList`.
         """
+        if hdu_class is None and hdu_type in self._prefetched:
+            return self._prefetched[hdu_type]
+
         location = self.location(hdu_type=hdu_type, hdu_class=hdu_class)
+        return self._load_location(location)
+
+    def _load_location(self, location):
+        if self.data_store.hdu_cache is not None:
+            return self.data_store.hdu_cache.load(location)
+
         return location.load()
 
+    def _prefetch(self, hdu_types):
+        """Load the given HDU types, skipping the ones that are not available."""
+        prefetched = {}
+        for hdu_type in hdu_types:
+            try:
+                location = self.location(hdu_type=hdu_type)
+            except IndexError:
+                continue
+            prefetched[hdu_type] = self._load_location(location)
+        return prefetched
+
+    def _prefetch_size(self, hdu_types):
+        """Total size in bytes of the files holding the given HDU types."""
+        filenames = set()
+        for hdu_type in hdu_types:
+            try:
+                location = self.location(hdu_type=hdu_type)
+            except IndexError:
+                continue
+            filenames.add(str(location.path()))
+        return sum(os.path.getsize(_) for _ in filenames)
+
     @property
     def events(self):
         """Load `gammapy.data.EventList` object and apply the filter."""
         events = self.load(hdu_type="events")
         return self.obs_filter.filter_events(events)
 
+    def get_events(self, columns=None, memmap=False):
+        """Load `gammapy.data.EventList` object and apply the filter.
+
+        In contrast to `events`, this allows to read a subset of the table
+        columns and to memory-map the events file, see
+        `~gammapy.data.EventList.read`. The filter is applied before any
+        unselected rows are copied to memory.
+
+        Parameters
+        ----------
+        columns : list of str
+            Names of the table columns to read. Columns used by the
+            observation filter have to be included.
+            By default all columns are read.
+        memmap : bool
+            Memory-map the events file.
+
+        Returns
+        -------
+        events : `~gammapy.data.EventList`
+            Event list
+        """
+        if "events" in self._prefetched:
+            events = self._prefetched["events"]
+            if columns is not None:
+                events = EventList(events.table[list(columns)])
+            return self.obs_filter.filter_events(events)
+
+        location = self.location(hdu_type="events")
+        events = EventList.read(
+            location.path(), hdu=location.hdu_name, columns=columns, memmap=memmap
+        )
+        return self.obs_filter.filter_events(events)
+
+    def iter_events(self, chunk_size=1000000, columns=None):
+        """Iterate over blocks of the event list and apply the filter.
+
+        See `~gammapy.data.EventListBase.read_chunks`.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of rows per block, before the filter is applied.
+        columns : list of str
+            Names of the table columns to read. Columns used by the
+            observation filter have to be included.
+            By default all columns are read.
+
+        Yields
+        ------
+        events : `~gammapy.data.EventList`
+            Filtered event list of one block.
+        """
+        location = self.location(hdu_type="events")
+        chunks = EventList.read_chunks(
+            location.path(),
+            chunk_size=chunk_size,
+            columns=columns,
+            hdu=location.hdu_name,
+        )
+        for events in chunks:
+            yield self.obs_filter.filter_events(events)
+
     @property
     def gti(self):
         """Load `gammapy.data.GTI` object and apply the filter."""
         try:
-            gti = self.load(hdu_type="gti")
+            if "gti" in self._prefetched or self.data_store.index_cache is None:
+                gti = self.load(hdu_type="gti")
+            else:
+                location = self.location(hdu_type="gti")
+                gti = self.data_store.index_cache.load_gti(location)
         except IndexError:
             # For now we support data without GTI HDUs
             # TODO: if GTI becomes required, we should drop this case
@@ -310,6 +412,84 @@ class Observations:
 
         return self.__class__(new_obs_list)
 
+    def prefetch(self, n_prefetch=2, n_jobs=2, hdu_types=None, max_size=None):
+        """Iterate over the observations, loading data ahead in background threads.
+
+        While an observation is processed, the events and IRFs of the
+        following ``n_prefetch`` observations are read by a thread pool,
+        which hides the file access latency e.g. on network file systems.
+        The loaded data is attached to the observations and released once
+        the iteration moved on to the next observation.
+
+        Parameters
+        ----------
+        n_prefetch : int
+            Maximum number of observations loaded ahead.
+        n_jobs : int
+            Number of threads used for reading.
+        hdu_types : list of str
+            HDU types to load (see `~gammapy.data.HDUIndexTable.VALID_HDU_TYPE`).
+            Types not available for an observation are skipped.
+            Default is ``["events", "gti", "aeff", "edisp", "psf", "bkg"]``.
+        max_size : int, optional
+            Memory budget in bytes, estimated from the size of the data files.
+            No further observation is loaded ahead once the observations
+            in flight exceed it. By default only ``n_prefetch`` limits the
+            number of loaded observations.
+
+        Yields
+        ------
+        observation : `~gammapy.data.DataStoreObservation`
+            Observation with prefetched data.
+
+        Examples
+        --------
+        >>> from gammapy.data import DataStore
+        >>> data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/")
+        >>> observations = data_store.get_observations([23523, 23526, 23559])
+        >>> for obs in observations.prefetch(n_prefetch=2):
+        ...     print(len(obs.events.table))
+        """
+        if hdu_types is None:
+            hdu_types = ["events", "gti", "aeff", "edisp", "psf", "bkg"]
+
+        obs_iter = iter(self.list)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+
+            def submit():
+                size_pending = sum(size for _, _, size in pending)
+                if len(pending) >= max(n_prefetch, 1):
+                    return False
+                if pending and max_size is not None and size_pending >= max_size:
+                    return False
+
+                try:
+                    obs = next(obs_iter)
+                except StopIteration:
+                    return False
+
+                size = obs._prefetch_size(hdu_types) if max_size is not None else 0
+                future = executor.submit(obs._prefetch, hdu_types)
+                pending.append((obs, future, size))
+                return True
+
+            while submit():
+                pass
+
+            while pending:
+                obs, future, _ = pending.popleft()
+                obs._prefetched = future.result()
+
+                while submit():
+                    pass
+
+                try:
+                    yield obs
+                finally:
+                    obs._prefetched = {}
+
 
 class ObservationChecker(Checker):
     """Check an observation.
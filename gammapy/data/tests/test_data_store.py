@@ -1,7 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pickle
 import pytest
+from numpy.testing import assert_allclose, assert_equal
+from astropy.table import Table, MaskedColumn
 from ...utils.testing import requires_data
-from ...data import DataStore
+from ...data import DataStore, DataStoreCache, HDUCache
 
 
 @pytest.fixture(scope="session")
@@ -102,3 +105,112 @@ class TestDataStoreChecker:
     def test_check_all(self):
         records = list(self.data_store.check())
         assert len(records) == 32
+
+
+@requires_data("gammapy-data")
+def test_datastore_hdu_cache():
+    data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/")
+    data_store.hdu_cache = HDUCache(max_size=2)
+    obs = data_store.obs(obs_id=23523)
+
+    aeff = obs.aeff
+    assert obs.aeff is aeff
+    assert data_store.hdu_cache.stats["hits"] == 1
+    assert data_store.hdu_cache.stats["misses"] == 1
+
+    # events are not cached by default
+    obs.events
+    obs.events
+    assert len(data_store.hdu_cache) == 1
+
+    obs.edisp
+    obs.psf
+    assert len(data_store.hdu_cache) == 2
+    assert data_store.hdu_cache.stats["misses"] == 3
+
+    # aeff was evicted as least recently used entry
+    assert obs.aeff is not aeff
+
+    data_store.hdu_cache.clear()
+    assert data_store.hdu_cache.stats == {
+        "hits": 0, "misses": 0, "size": 0, "max_size": 2
+    }
+
+
+def test_hdu_cache_pickle():
+    cache = HDUCache(max_size=2)
+    cache._cache["key"] = "value"
+    cache.hits = 3
+
+    cache_copy = pickle.loads(pickle.dumps(cache))
+    assert len(cache_copy) == 0
+    assert cache_copy.hits == 3
+    assert cache_copy.max_size == 2
+    with cache_copy._lock:
+        pass
+
+
+@requires_data("gammapy-data")
+def test_datastore_index_cache(tmpdir):
+    data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/", cache_dir=tmpdir)
+    gti = data_store.obs(obs_id=23523).gti
+    assert len(tmpdir.listdir()) == 2
+
+    data_store_cached = DataStore.from_dir(
+        "$GAMMAPY_DATA/hess-dl3-dr1/", cache_dir=tmpdir
+    )
+    assert isinstance(data_store_cached.index_cache, DataStoreCache)
+    assert len(data_store_cached.hdu_table) == len(data_store.hdu_table)
+    assert data_store_cached.obs_table.colnames == data_store.obs_table.colnames
+    assert data_store_cached.obs_table["RA_PNT"].unit == "deg"
+
+    obs = data_store_cached.obs(obs_id=23523)
+    assert_allclose(obs.gti.table["START"], gti.table["START"])
+    assert str(type(obs.aeff)) == (
+        "<class 'gammapy.irf.effective_area.EffectiveAreaTable2D'>"
+    )
+
+    data_store_cached.index_cache.clear()
+    assert len(tmpdir.listdir()) == 0
+
+
+def test_data_store_cache_tables(tmpdir):
+    filename = str(tmpdir / "source.txt")
+    with open(filename, "w") as fh:
+        fh.write("source")
+
+    table = Table()
+    table["A"] = MaskedColumn([1, 2, 3], mask=[False, True, False], unit="deg")
+    table["B"] = ["a", "b", "c"]
+    table.meta["OBSERVER"] = "me"
+
+    cache = DataStoreCache(tmpdir / "cache")
+    cache.write_tables("test", [filename], {"table": table})
+    cached = cache.read_tables("test", [filename])["table"]
+
+    assert isinstance(cached["A"], MaskedColumn)
+    assert_equal(cached["A"].mask, [False, True, False])
+    assert cached["A"].unit == "deg"
+    assert not isinstance(cached["B"], MaskedColumn)
+    assert cached.meta["OBSERVER"] == "me"
+
+    # tables with meta data that can't be stored as JSON are not cached
+    table.meta["OBSERVER"] = object()
+    cache.write_tables("test-meta", [filename], {"table": table})
+    assert cache.read_tables("test-meta", [filename]) is None
+
+
+def test_data_store_cache_truncated(tmpdir, caplog):
+    filename = str(tmpdir / "source.txt")
+    with open(filename, "w") as fh:
+        fh.write("source")
+
+    cache = DataStoreCache(tmpdir / "cache")
+    cache.write_tables("test", [filename], {"table": Table({"A": [1, 2, 3]})})
+
+    path = cache._filename("test", [filename])
+    content = path.read_bytes()
+    path.write_bytes(content[: len(content) // 2])
+
+    assert cache.read_tables("test", [filename]) is None
+    assert "Ignoring invalid cache entry" in caplog.text
@@ -62,6 +62,25 @@ class TestEventListHESS:
         assert_allclose(altaz[0].alt.deg, 31.200132, atol=1e-3)
         # TODO: add asserts for frame properties
 
+    def test_read_columns(self):
+        filename = (
+            "$GAMMAPY_DATA/tests/unbundled/hess/run_0023037_hard_eventlist.fits.gz"
+        )
+        events = EventList.read(filename, columns=["RA", "DEC", "ENERGY"])
+        assert events.table.colnames == ["RA", "DEC", "ENERGY"]
+        assert len(events.table) == 49
+        assert_allclose(events.table["ENERGY"], self.events.table["ENERGY"])
+        assert events.table.meta["OBS_ID"] == self.events.table.meta["OBS_ID"]
+
+    def test_read_chunks(self):
+        filename = (
+            "$GAMMAPY_DATA/tests/unbundled/hess/run_0023037_hard_eventlist.fits.gz"
+        )
+        chunks = list(EventList.read_chunks(filename, chunk_size=20, columns=["ENERGY"]))
+        assert [len(_.table) for _ in chunks] == [20, 20, 9]
+        assert chunks[0].table.colnames == ["ENERGY"]
+        assert_allclose(chunks[2].table["ENERGY"], self.events.table["ENERGY"][40:])
+
     def test_stack(self):
         event_lists = [self.events] * 3
         stacked_list = EventList.stack(event_lists)
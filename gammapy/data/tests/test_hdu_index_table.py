@@ -106,3 +106,93 @@ def test_hdu_index_table_hd_hap():
         hdu_index.hdu_location(obs_id=23523, hdu_class="invalid")
     msg = "Invalid hdu_class: invalid. Valid values are: ['events', 'gti', 'aeff_2d', 'edisp_2d', 'psf_table', 'psf_3gauss', 'psf_king', 'bkg_2d', 'bkg_3d']"
     assert exc.value.args[0] == msg
+
+
+def test_hdu_index_table_index():
+    table = HDUIndexTable(
+        rows=[
+            {
+                "OBS_ID": obs_id,
+                "HDU_TYPE": hdu_type,
+                "HDU_CLASS": hdu_class,
+                "FILE_DIR": "data",
+                "FILE_NAME": "{}.fits".format(obs_id),
+                "HDU_NAME": hdu_type.upper(),
+            }
+            for obs_id in [1, 2, 3]
+            for hdu_type, hdu_class in [("events", "events"), ("aeff", "aeff_2d")]
+        ]
+    )
+    table.meta["BASE_DIR"] = "spam"
+
+    assert table.row_idx(obs_id=2) == [2, 3]
+    assert table.row_idx(obs_id=2, hdu_type="aeff") == [3]
+    assert table.row_idx(obs_id=2, hdu_type="aeff", hdu_class="aeff_2d") == [3]
+    assert table.row_idx(obs_id=2, hdu_type="aeff", hdu_class="events") == []
+    assert table.row_idx(obs_id=4, hdu_type="aeff") == []
+
+    locations = table.hdu_locations([3, 1], hdu_type="aeff")
+    assert [_.obs_id for _ in locations] == [3, 1]
+    assert locations[0].path().as_posix() == "spam/data/3.fits"
+    assert locations[0].hdu_name == "AEFF"
+    assert locations[1].hdu_class == "aeff_2d"
+
+    with pytest.raises(IndexError):
+        table.hdu_locations([1, 4], hdu_type="aeff")
+
+    # index is updated when the table changes
+    table.add_row(
+        {
+            "OBS_ID": 4,
+            "HDU_TYPE": "aeff",
+            "HDU_CLASS": "aeff_2d",
+            "FILE_DIR": "data",
+            "FILE_NAME": "4.fits",
+            "HDU_NAME": "AEFF",
+        }
+    )
+    assert table.row_idx(obs_id=4, hdu_type="aeff") == [6]
+
+    # in place changes need an explicit reset
+    table["OBS_ID"][6] = 0
+    table._reset_index()
+    assert table.row_idx(obs_id=0) == [6]
+    assert table.row_idx(obs_id=4) == []
+
+    table.sort(["OBS_ID", "HDU_TYPE"])
+    table._reset_index()
+    assert table.row_idx(obs_id=0) == [0]
+    assert table.row_idx(obs_id=2) == [3, 4]
+    assert table.row_idx(obs_id=3, hdu_type="events") == [6]
+    assert table.hdu_location(obs_id=1, hdu_type="events").file_name == "1.fits"
+
+    table.remove_rows([0])
+    assert table.row_idx(obs_id=0) == []
+    assert table.row_idx(obs_id=1) == [0, 1]
+    assert table.row_idx(obs_id=2) == [2, 3]
+
+
+def test_hdu_index_table_hdu_locations_multiple(caplog):
+    table = HDUIndexTable(
+        rows=[
+            {
+                "OBS_ID": obs_id,
+                "HDU_TYPE": "events",
+                "HDU_CLASS": "events",
+                "FILE_DIR": "data",
+                "FILE_NAME": file_name,
+                "HDU_NAME": "EVENTS",
+            }
+            for obs_id, file_name in [(1, "a.fits"), (2, "b.fits"), (1, "c.fits")]
+        ]
+    )
+
+    locations = table.hdu_locations([2, 1], hdu_type="events")
+    assert [_.file_name for _ in locations] == ["b.fits", "a.fits"]
+    assert "Found multiple HDU matching: OBS_ID = 1" in caplog.text
+
+    with pytest.raises(IndexError):
+        table.hdu_locations([3], hdu_type="events")
+
+    with pytest.raises(IndexError):
+        table.hdu_locations([1], hdu_type="aeff")
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
+from numpy.testing import assert_allclose
 from astropy.units import Quantity
 from astropy.coordinates import Angle, SkyCoord, AltAz
 from astropy.time import Time, TimeDelta
@@ -402,6 +403,38 @@ def test_select_sky_regions():
     )
     common_sky_region_select_test_routines(obs_table, selection)
 
+    # the spatial index is rebuilt after the rows are reordered
+    obs_table.sort("RA_PNT")
+    obs_table._reset_index()
+    common_sky_region_select_test_routines(obs_table, selection)
+
+
+def test_select_observations_combined():
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=100, random_state=random_state)
+
+    sky_circle = dict(
+        type="sky_circle",
+        frame="galactic",
+        lon=Angle(0.0, "deg"),
+        lat=Angle(0.0, "deg"),
+        radius=Angle(50.0, "deg"),
+        border=Angle(2.0, "deg"),
+    )
+    par_box = dict(type="par_box", variable="ALT", value_range=Angle([60, 80], "deg"))
+
+    selected = obs_table.select_observations([sky_circle, par_box])
+    expected = obs_table.select_observations(sky_circle).select_observations(par_box)
+
+    assert len(selected) > 0
+    assert_allclose(selected["OBS_ID"], expected["OBS_ID"])
+
+    # the spatial index is rebuilt when the table changes
+    obs_table.remove_row(0)
+    selected = obs_table.select_observations(sky_circle)
+    expected = obs_table.select_observations(dict(sky_circle, inverted=True))
+    assert len(selected) + len(expected) == len(obs_table)
+
 
 def test_create_gti():
     """Test the `~gammapy.data.ObservationTable.create_gti()` method.
@@ -31,6 +31,19 @@ def test_data_store_observation(data_store):
     assert_skycoord_allclose(obs.target_radec, c)
 
 
+@requires_data("gammapy-data")
+def test_data_store_observation_get_events(data_store):
+    obs = data_store.obs(23523)
+    events = obs.get_events(columns=["TIME", "RA", "DEC", "ENERGY"], memmap=True)
+    assert events.table.colnames == ["TIME", "RA", "DEC", "ENERGY"]
+    assert len(events.table) == len(obs.events.table)
+
+    time_interval = Time([53343.930, 53343.940], format="mjd", scale="tt")
+    obs = obs.select_time(time_interval)
+    events = obs.get_events(columns=["TIME", "RA", "DEC", "ENERGY"])
+    assert len(events.table) == len(obs.events.table)
+
+
 @requires_data("gammapy-data")
 @pytest.mark.parametrize(
     "time_interval, expected_times",
@@ -121,6 +134,23 @@ def test_observations_select_time(
         )
 
 
+@requires_data("gammapy-data")
+@pytest.mark.parametrize("max_size", [None, 1])
+def test_observations_prefetch(data_store, max_size):
+    obs_ids = data_store.obs_table["OBS_ID"][:3]
+    observations = data_store.get_observations(obs_ids)
+
+    obs_ids_prefetched = []
+    for obs in observations.prefetch(n_prefetch=2, max_size=max_size):
+        assert "events" in obs._prefetched
+        assert obs.aeff is obs._prefetched["aeff"]
+        assert len(obs.get_events(columns=["ENERGY"]).table.colnames) == 1
+        obs_ids_prefetched.append(obs.obs_id)
+
+    assert obs_ids_prefetched == list(obs_ids)
+    assert observations[0]._prefetched == {}
+
+
 @requires_data("gammapy-data")
 class TestObservationChecker:
     def setup(self):
@@ -32,6 +32,49 @@ def smooth_edge(x, width):
     return 0.5 * (1 - erf(value * EDGE_WIDTH_95))
 
 
+def _smooth_edge_derivative(x, width):
+    """Derivative of `smooth_edge` w.r.t. ``x``."""
+    value = (x / width).to_value("")
+    scale = EDGE_WIDTH_95 / width
+    return -scale / np.sqrt(np.pi) * np.exp(-(value * EDGE_WIDTH_95) ** 2)
+
+
+def _separation_derivatives(lon, lat, lon_0, lat_0):
+    """Derivatives of the angular separation w.r.t. ``lon_0`` and ``lat_0``.
+
+    Computed as ``d sep = - d cos(sep) / sin(sep)``, the derivatives are set
+    to zero at the center, where they are not defined.
+    """
+    d_cos_lon_0 = np.cos(lat) * np.cos(lat_0) * np.sin(lon - lon_0)
+    d_cos_lat_0 = np.sin(lat) * np.cos(lat_0) - np.cos(lat) * np.sin(lat_0) * np.cos(
+        lon - lon_0
+    )
+    sep = angular_separation(lon, lat, lon_0, lat_0)
+    sin_sep = np.atleast_1d(np.sin(sep).to_value(""))
+
+    derivatives = []
+    for d_cos in [d_cos_lon_0, d_cos_lat_0]:
+        d_cos = np.atleast_1d(u.Quantity(d_cos).to_value(""))
+        d_sep = np.zeros(np.broadcast(d_cos, sin_sep).shape)
+        np.divide(-d_cos, sin_sep, out=d_sep, where=sin_sep > 0)
+        derivatives.append(d_sep.reshape(np.shape(sep)))
+
+    return derivatives
+
+
+def _linear_weight(diff, width):
+    """Linear interpolation weight and its derivative w.r.t. the position.
+
+    ``diff`` is the offset of the evaluation point from the position.
+    """
+    width = np.abs(width)
+    value = (diff / width).to_value("")
+    inside = np.abs(value) < 1
+    weight = np.where(inside, 1 - np.abs(value), 0) / width
+    d_weight = np.where(inside, np.sign(value), 0) / width ** 2
+    return weight, d_weight
+
+
 class SkySpatialModel(Model):
     """Sky spatial model base class."""
 
@@ -43,6 +86,32 @@ class SkySpatialModel(Model):
 
         return self.evaluate(lon, lat, **kwargs)
 
+    def gradient(self, lon, lat):
+        """Derivatives of the model w.r.t. the parameter values.
+
+        Uses the ``evaluate_gradient`` method of derived classes, if they
+        define one, otherwise the derivatives are computed by finite
+        differences of the model.
+
+        Parameters
+        ----------
+        lon, lat : `~astropy.units.Quantity`
+            Coordinates at which to evaluate
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives, ordered like ``parameters.parameters``. Entries of
+            frozen parameters can be None.
+        """
+        if hasattr(self, "evaluate_gradient"):
+            kwargs = dict()
+            for par in self.parameters.parameters:
+                kwargs[par.name] = par.quantity
+            return list(self.evaluate_gradient(lon, lat, **kwargs))
+
+        return self._numerical_gradient(self, lon, lat)
+
     @property
     def position(self):
         """Spatial model center position"""
@@ -112,6 +181,19 @@ class SkyPointSource(SkySpatialModel):
 
         return lon_val * lat_val
 
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0):
+        """Evaluate the derivatives w.r.t. the parameters (static function)."""
+        wrapval = lon_0 + 180 * u.deg
+        lon = Angle(lon).wrap_at(wrapval)
+
+        _, grad_lon = np.gradient(lon)
+        grad_lat, _ = np.gradient(lat)
+        lon_val, d_lon_val = _linear_weight(lon - lon_0, grad_lon)
+        lat_val, d_lat_val = _linear_weight(lat - lat_0, grad_lat)
+
+        return [d_lon_val * lat_val, lon_val * d_lat_val]
+
 
 class SkyGaussian(SkySpatialModel):
     r"""Two-dimensional symmetric Gaussian model
@@ -184,6 +266,28 @@ class SkyGaussian(SkySpatialModel):
         exponent = -0.5 * ((1 - np.cos(sep)) / a)
         return u.Quantity(norm.value * np.exp(exponent).value, "sr-1", copy=False)
 
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0, sigma):
+        """Evaluate the derivatives w.r.t. the parameters (static function)."""
+        value = SkyGaussian.evaluate(lon, lat, lon_0, lat_0, sigma)
+        sep = angular_separation(lon, lat, lon_0, lat_0)
+        a = (1.0 - np.cos(sigma)).to_value("")
+        one_minus_cos_sep = (1 - np.cos(sep)).to_value("")
+
+        # the model depends on the position through cos(sep) only
+        d_cos_sep = value / (2 * a) / u.rad
+        d_lon_0 = d_cos_sep * np.cos(lat) * np.cos(lat_0) * np.sin(lon - lon_0)
+        d_lat_0 = d_cos_sep * (
+            np.sin(lat) * np.cos(lat_0)
+            - np.cos(lat) * np.sin(lat_0) * np.cos(lon - lon_0)
+        )
+
+        exp = np.exp(-1.0 / a)
+        d_log_a = -1 / a + exp / (a ** 2 * (1 - exp)) + one_minus_cos_sep / (2 * a ** 2)
+        d_sigma = value * np.sin(sigma) * d_log_a / u.rad
+
+        return [d_lon_0, d_lat_0, d_sigma]
+
 
 class SkyDisk(SkySpatialModel):
     r"""Constant radial disk model.
@@ -287,6 +391,28 @@ class SkyDisk(SkySpatialModel):
         in_disk = smooth_edge(sep - r_0, edge)
         return u.Quantity(norm.value * in_disk, "sr-1", copy=False)
 
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0, r_0, edge):
+        """Evaluate the derivatives w.r.t. the parameters (static function)."""
+        sep = angular_separation(lon, lat, lon_0, lat_0)
+        norm = 1.0 / (2 * np.pi * (1 - np.cos(r_0)))
+        norm = u.Quantity(norm.value, "sr-1")
+
+        in_disk = smooth_edge(sep - r_0, edge)
+        d_in_disk = _smooth_edge_derivative(sep - r_0, edge)
+        d_sep_lon_0, d_sep_lat_0 = _separation_derivatives(lon, lat, lon_0, lat_0)
+
+        d_norm = -norm * np.sin(r_0) / (1 - np.cos(r_0)) / u.rad
+        d_r_0 = d_norm * in_disk - norm * d_in_disk
+        d_edge = -norm * d_in_disk * ((sep - r_0) / edge).to_value("")
+
+        return [
+            norm * d_in_disk * d_sep_lon_0,
+            norm * d_in_disk * d_sep_lat_0,
+            d_r_0,
+            d_edge,
+        ]
+
 
 class SkyEllipse(SkySpatialModel):
     r"""Constant elliptical model.
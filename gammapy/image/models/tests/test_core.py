@@ -73,6 +73,27 @@ def test_sky_disk_edge():
     assert_allclose((value_edge_nwidth / value_center).to_value(""), 0.95)
 
 
+@pytest.mark.parametrize(
+    "model",
+    [
+        SkyPointSource(lon_0="2.33 deg", lat_0="2.61 deg"),
+        SkyGaussian(lon_0="2.5 deg", lat_0="2.2 deg", sigma="0.8 deg"),
+        SkyDisk(lon_0="2.5 deg", lat_0="2.2 deg", r_0="1.1 deg", edge="0.5 deg"),
+    ],
+)
+def test_sky_model_gradient(model):
+    lat, lon = np.mgrid[0:6:0.1, 0:6:0.1] * u.deg
+    gradient = model.gradient(lon, lat)
+    gradient_numerical = model._numerical_gradient(model, lon, lat, eps=1e-6)
+
+    for grad, grad_numerical in zip(gradient, gradient_numerical):
+        if grad_numerical is None:
+            continue
+        grad = grad.to_value(grad_numerical.unit)
+        atol = 1e-4 * np.abs(grad_numerical.value).max()
+        assert_allclose(grad, grad_numerical.value, rtol=1e-4, atol=atol)
+
+
 def test_sky_ellipse():
     pytest.importorskip("astropy", minversion="3.1.1")
     # test the normalization for an elongated ellipse near the Galactic Plane
@@ -2,6 +2,7 @@
 from collections import OrderedDict
 import numpy as np
 from scipy.special import erf
+from scipy.sparse import csr_matrix
 from astropy.io import fits
 from astropy.coordinates import Angle
 from astropy.units import Quantity
@@ -84,30 +85,44 @@ class EnergyDispersion:
         ss += "\n{}".format(self.data)
         return ss
 
-    def apply(self, data):
+    def apply(self, data, axis=0):
         """Apply energy dispersion.
 
         Computes the matrix product of ``data``
         (which typically is model flux or counts in true energy bins)
-        with the energy dispersion matrix.
+        with the energy dispersion matrix, using the sparse representation
+        `pdf_matrix_sparse`.
 
         Parameters
         ----------
         data : array_like
-            1-dim data array.
+            Data array, e.g. 1-dim spectrum or 3-dim map cube data.
+        axis : int
+            Axis of ``data`` corresponding to true energy.
 
         Returns
         -------
-        convolved_data : array
-            1-dim data array after multiplication with the energy dispersion matrix
+        convolved_data : `~astropy.units.Quantity`
+            Data array after multiplication with the energy dispersion matrix,
+            with reco energy along ``axis``.
         """
-        if len(data) != self.e_true.nbin:
+        data = Quantity(data, copy=False)
+
+        if data.shape[axis] != self.e_true.nbin:
             raise ValueError(
                 "Input size {} does not match true energy axis {}".format(
-                    len(data), self.e_true.nbin
+                    data.shape[axis], self.e_true.nbin
                 )
             )
-        return np.dot(data, self.data.data)
+
+        values = np.moveaxis(data.value, axis, 0)
+        shape = values.shape
+        values = values.reshape((shape[0], -1))
+
+        result = self.pdf_matrix_sparse.T.dot(values)
+        result = result.reshape((self.e_reco.nbin,) + shape[1:])
+        result = np.moveaxis(result, 0, axis)
+        return Quantity(result, data.unit * self.data.data.unit, copy=False)
 
     @property
     def e_reco(self):
@@ -128,6 +143,23 @@ class EnergyDispersion:
         """
         return self.data.data.value
 
+    @property
+    def pdf_matrix_sparse(self):
+        """Energy dispersion PDF matrix in CSR format (`~scipy.sparse.csr_matrix`).
+
+        Only the non-zero entries are stored, e.g. the ones above ``pdf_threshold``
+        for `from_gauss`. The matrix is built on first access and re-built if
+        the data array is replaced.
+        """
+        data = self.data.data
+        cached = self.__dict__.get("_pdf_matrix_sparse")
+
+        if cached is None or cached[0] is not data:
+            cached = (data, csr_matrix(data.value))
+            self.__dict__["_pdf_matrix_sparse"] = cached
+
+        return cached[1]
+
     def pdf_in_safe_range(self, lo_threshold, hi_threshold):
         """PDF matrix with bins outside threshold set to 0.
 
@@ -889,12 +921,7 @@ class EnergyDispersion2D:
         e_true = EnergyBounds(e_true)
         e_reco = EnergyBounds(e_reco)
 
-        data = []
-        for energy in e_true.log_centers:
-            vec = self.get_response(offset=offset, e_true=energy, e_reco=e_reco)
-            data.append(vec)
-
-        data = np.asarray(data)
+        data = self._get_response(offset, e_true.log_centers, e_reco)
         e_lo, e_hi = e_true[:-1], e_true[1:]
         ereco_lo, ereco_hi = (e_reco[:-1], e_reco[1:])
 
@@ -938,31 +965,28 @@ class EnergyDispersion2D:
             # Translate given e_reco binning to migra at bin center
             e_reco = EnergyBounds(e_reco)
 
-        # migration value of e_reco bounds
-        migra_e_reco = e_reco / e_true
+        return self._get_response(offset, e_true, e_reco, migra_step)
+
+    def _get_response(self, offset, e_true, e_reco, migra_step=5e-3):
+        """Redistribution vectors for an array of true energies.
 
+        The migration pdf is evaluated for all true energies at once, the
+        result has the shape of ``e_true`` plus a last reco energy axis.
+        """
         # Define a vector of migration with mig_step step
         mrec_min = self.data.axis("migra").edges[0]
         mrec_max = self.data.axis("migra").edges[-1]
         mig_array = np.arange(mrec_min, mrec_max, migra_step)
 
         # Compute energy dispersion probability dP/dm for each element of migration array
-        vals = self.data.evaluate(offset=offset, e_true=e_true, migra=mig_array)
-
-        # Compute normalized cumulative sum to prepare integration
-        with np.errstate(invalid="ignore"):
-            tmp = np.nan_to_num(np.cumsum(vals) / np.sum(vals))
-
-        # Determine positions (bin indices) of e_reco bounds in migration array
-        pos_mig = np.digitize(migra_e_reco, mig_array) - 1
-        # We ensure that no negative values are found
-        pos_mig = np.maximum(pos_mig, 0)
-
-        # We compute the difference between 2 successive bounds in e_reco
-        # to get integral over reco energy bin
-        integral = np.diff(tmp[pos_mig])
+        values = self.data.evaluate(
+            offset=offset, e_true=e_true[..., np.newaxis], migra=mig_array
+        )
+        cumulative = np.cumsum(Quantity(values).value, axis=-1)
 
-        return integral
+        # migration value of e_reco bounds
+        migra_e_reco = (e_reco / e_true[..., np.newaxis]).to_value("")
+        return _integrate_migra(cumulative, mig_array, migra_e_reco)
 
     def plot_migration(self, ax=None, offset=None, e_true=None, migra=None, **kwargs):
         """Plot energy dispersion for given offset and true energy.
@@ -1102,3 +1126,49 @@ class EnergyDispersion2D:
     def to_fits(self, name="ENERGY DISPERSION"):
         """Convert to `~astropy.io.fits.BinTable`."""
         return fits.BinTableHDU(self.to_table(), name=name)
+
+
+def _integrate_migra(cumulative, migra, migra_e_reco):
+    """Integrate migration pdfs over reconstructed energy bins.
+
+    Works on arrays of pdfs, e.g. for many true energies and positions at
+    once. The integral over a bin is the difference of the normalised
+    cumulative sum at the bin edges, which are looked up by the last
+    migration node below the edge.
+
+    Parameters
+    ----------
+    cumulative : `~numpy.ndarray`
+        Cumulative sum of the migration pdf along the last axis, sampled at
+        ``migra``. It is normalised by its last value.
+    migra : `~numpy.ndarray`
+        Migration nodes (1D, increasing).
+    migra_e_reco : `~numpy.ndarray`
+        Migration values of the reco energy bin edges along the last axis.
+        The other axes are broadcasted with the other axes of ``cumulative``.
+
+    Returns
+    -------
+    integral : `~numpy.ndarray`
+        Probability to reconstruct the energy in the reco energy bins.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cumulative = np.nan_to_num(cumulative / cumulative[..., -1:])
+
+    # Determine positions (bin indices) of e_reco bounds in migration array
+    # We ensure that no negative values are found
+    idx = np.maximum(np.digitize(migra_e_reco, migra) - 1, 0)
+
+    # Look up the cumulative sum at the bin edges with flat fancy indexing
+    # (``np.take_along_axis`` needs numpy 1.15)
+    shape = np.broadcast(cumulative[..., 0], idx[..., 0]).shape
+    cumulative = np.broadcast_to(cumulative, shape + cumulative.shape[-1:])
+    idx = np.broadcast_to(idx, shape + idx.shape[-1:])
+
+    cumulative = cumulative.reshape(-1, cumulative.shape[-1])
+    idx = idx.reshape(-1, idx.shape[-1])
+    values = cumulative[np.arange(len(idx))[:, np.newaxis], idx]
+
+    # We compute the difference between 2 successive bounds in e_reco
+    # to get integral over reco energy bin
+    return np.diff(values.reshape(shape + idx.shape[-1:]), axis=-1)
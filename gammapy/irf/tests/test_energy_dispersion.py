@@ -61,6 +61,21 @@ class TestEnergyDispersion:
         assert str(len(counts)) in str(exc.value)
         assert_allclose(actual[0], 1.8612999017723058, atol=1e-3)
 
+    def test_apply_axis(self):
+        n_true = len(self.e_true) - 1
+        data = np.arange(n_true * 6).reshape((2, n_true, 3))
+        actual = self.edisp.apply(data, axis=1)
+
+        expected = np.einsum("itj,tr->irj", data, self.edisp.pdf_matrix)
+        assert actual.shape == (2, self.edisp.e_reco.nbin, 3)
+        assert_allclose(actual.value, expected)
+
+    def test_pdf_matrix_sparse(self):
+        pdf_sparse = self.edisp.pdf_matrix_sparse
+        assert_allclose(pdf_sparse.toarray(), self.edisp.pdf_matrix)
+        assert pdf_sparse.nnz == np.count_nonzero(self.edisp.pdf_matrix)
+        assert self.edisp.pdf_matrix_sparse is pdf_sparse
+
     def test_get_bias(self):
         bias = self.edisp.get_bias(3.34 * u.TeV)
         assert_allclose(bias, self.bias, atol=1e-2)
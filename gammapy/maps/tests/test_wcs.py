@@ -229,6 +229,14 @@ def test_cutout():
     assert_allclose(cutout_geom.center_coord, (0.1, 0.2, 2.0))
     assert cutout_geom.data_shape == (2, 6, 6)
 
+    slices = (Ellipsis,) + cutout_geom.cutout_info["parent-slices"]
+    coord = geom.get_coord()
+    coord_cutout = cutout_geom.get_coord()
+    assert_allclose(coord.lon[slices], coord_cutout.lon, atol=1e-10)
+    assert_allclose(coord.lat[slices], coord_cutout.lat, atol=1e-10)
+    assert cutout_geom.to_image().cutout_info is cutout_geom.cutout_info
+    assert geom.cutout_info is None
+
 
 def test_wcsgeom_get_coord():
     geom = WcsGeom.create(
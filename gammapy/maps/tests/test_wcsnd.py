@@ -517,6 +517,45 @@ def test_make_cutout(mode):
     assert_allclose(cutout.geom.width.to_value("deg"), [[2.0], [3.0]])
 
 
+def test_stack_cutout():
+    pos = SkyCoord(0, 0, unit="deg", frame="galactic")
+    geom = WcsGeom.create(
+        npix=(10, 10), binsz=1, skydir=pos, proj="CAR", coordsys="GAL", axes=axes2
+    )
+    m = WcsNDMap(geom, unit="m2")
+
+    cutout_geom = geom.cutout(position=pos, width=(2.0, 3.0) * u.deg)
+    cutout = WcsNDMap(cutout_geom, data=np.ones(cutout_geom.data_shape), unit="cm2")
+    m.stack(cutout)
+    m.stack(cutout)
+
+    assert_allclose(m.data.sum(), 2 * 36 * 1e-4)
+    assert_allclose(m.data[0, 0, 5, 5], 2e-4)
+    assert_allclose(m.data[0, 0, 0, 0], 0)
+
+    m.stack(m.copy())
+    assert_allclose(m.data.sum(), 4 * 36 * 1e-4)
+
+    other = WcsNDMap.create(npix=(5, 5), binsz=1, axes=axes2)
+    with pytest.raises(ValueError):
+        m.stack(other)
+
+    # different non-spatial axes
+    with pytest.raises(ValueError):
+        m.stack(cutout.slice_by_idx({cutout_geom.axes[0].name: slice(0, 1)}))
+
+    # cutout of a different parent geometry
+    geom_other = WcsGeom.create(
+        npix=(12, 12), binsz=1, skydir=pos, proj="CAR", coordsys="GAL", axes=axes2
+    )
+    with pytest.raises(ValueError):
+        m.stack(Map.from_geom(geom_other.cutout(position=pos, width=2 * u.deg)))
+
+    # the cutout info is dropped if the spatial part changes
+    assert cutout_geom.pad(1).cutout_info is None
+    assert cutout_geom.upsample(2).cutout_info is None
+
+
 def test_convolve_vs_smooth():
     axes = [
         MapAxis(np.logspace(0.0, 3.0, 3), interp="log"),
@@ -558,6 +597,45 @@ def test_convolve_nd():
     assert_allclose(mc.data.sum(axis=(1, 2)), [0, 1, 1], atol=1e-5)
 
 
+@pytest.mark.parametrize("npix", [(20, 21), (33, 16)])
+def test_convolve_batched_fft(npix):
+    axis = MapAxis.from_edges(np.logspace(-1.0, 1.0, 4), unit="TeV", name="energy")
+    geom = WcsGeom.create(binsz=0.05 * u.deg, npix=npix, axes=[axis])
+    m = Map.from_geom(geom)
+    m.data = np.random.RandomState(0).uniform(size=m.data.shape)
+
+    kernel = PSFKernel.from_gauss(geom, sigma=0.1 * u.deg, max_radius=0.3 * u.deg)
+
+    actual = m.convolve(kernel)
+    desired = m.convolve(kernel, mode="same")
+    assert_allclose(actual.data, desired.data, rtol=1e-5, atol=1e-6)
+
+    # the cached kernel spectrum gives the same result
+    assert_allclose(m.convolve(kernel, n_threads=2).data, actual.data)
+
+    kernel_2d = Gaussian2DKernel(2).array[:, 1:]
+    actual = m.convolve(kernel_2d)
+    desired = m.convolve(kernel_2d, mode="same")
+    assert_allclose(actual.data, desired.data, rtol=1e-5, atol=1e-6)
+
+
+def test_convolve_numpy_fft_fallback(monkeypatch):
+    from .. import wcsnd
+
+    monkeypatch.setattr(wcsnd, "_fft", np.fft)
+    monkeypatch.setattr(wcsnd, "_FFT_HAS_WORKERS", False)
+
+    axis = MapAxis.from_edges(np.logspace(-1.0, 1.0, 4), unit="TeV", name="energy")
+    geom = WcsGeom.create(binsz=0.05 * u.deg, npix=(20, 21), axes=[axis])
+    m = Map.from_geom(geom)
+    m.data = np.random.RandomState(0).uniform(size=m.data.shape)
+    kernel = PSFKernel.from_gauss(geom, sigma=0.1 * u.deg, max_radius=0.3 * u.deg)
+
+    actual = m.convolve(kernel, n_threads=2)
+    desired = m.convolve(kernel, mode="same")
+    assert_allclose(actual.data, desired.data, rtol=1e-5, atol=1e-6)
+
+
 def test_convolve_pixel_scale_error():
     m = WcsNDMap.create(binsz=0.05 * u.deg, width=5 * u.deg)
     kgeom = WcsGeom.create(binsz=0.04 * u.deg, width=0.5 * u.deg)
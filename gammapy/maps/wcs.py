@@ -175,13 +175,19 @@ class WcsGeom(MapGeom):
     conv : {'gadf', 'fgst-ccube', 'fgst-template'}
         Serialization format convention.  This sets the default format
         that will be used when writing this geometry to a file.
+    cutout_info : dict
+        Dict with the ``"parent-slices"`` and ``"cutout-slices"`` of the
+        spatial axes and the ``"parent-shape"`` and ``"parent-wcs"`` of the
+        parent image, if the geometry was created with `WcsGeom.cutout`.
     """
 
     _slice_spatial_axes = slice(0, 2)
     _slice_non_spatial_axes = slice(2, None)
     is_hpx = False
 
-    def __init__(self, wcs, npix, cdelt=None, crpix=None, axes=None, conv="gadf"):
+    def __init__(
+        self, wcs, npix, cdelt=None, crpix=None, axes=None, conv="gadf", cutout_info=None
+    ):
         self._wcs = wcs
         self._coordsys = get_coordys(wcs)
         self._projection = get_projection(wcs)
@@ -201,6 +207,7 @@ class WcsGeom(MapGeom):
             crpix = tuple(1.0 + (np.array(self._npix) - 1.0) / 2.0)
 
         self._crpix = crpix
+        self._cutout_info = cutout_info
 
     @property
     def data_shape(self):
@@ -294,6 +301,29 @@ class WcsGeom(MapGeom):
     def ndim(self):
         return len(self.data_shape)
 
+    @property
+    def cutout_info(self):
+        """Slices of the cutout in the parent geometry (dict or None).
+
+        Set for geometries created with `WcsGeom.cutout`. The
+        ``"parent-slices"`` select the spatial cutout region from data of the
+        parent geometry, the ``"cutout-slices"`` the overlapping region from
+        data of the cutout geometry (different only for ``mode='partial'``).
+        The ``"parent-shape"`` and ``"parent-wcs"`` describe the parent image.
+
+        Geometries derived with a different spatial part (e.g. with
+        `WcsGeom.pad` or `WcsGeom.downsample`) don't keep the cutout info.
+        """
+        return self._cutout_info
+
+    def _init_copy(self, **kwargs):
+        # the cutout slices are only valid as long as the spatial part is unchanged
+        spatial_args = ["wcs", "npix", "cdelt", "crpix"]
+        if "cutout_info" not in kwargs and any(_ in kwargs for _ in spatial_args):
+            kwargs["cutout_info"] = None
+
+        return super()._init_copy(**kwargs)
+
     @property
     def center_coord(self):
         """Map coordinate of the center of the geometry.
@@ -697,13 +727,21 @@ class WcsGeom(MapGeom):
     def to_image(self):
         npix = (np.max(self._npix[0]), np.max(self._npix[1]))
         cdelt = (np.max(self._cdelt[0]), np.max(self._cdelt[1]))
-        return self.__class__(self._wcs, npix, cdelt=cdelt)
+        return self.__class__(
+            self._wcs, npix, cdelt=cdelt, cutout_info=self.cutout_info
+        )
 
     def to_cube(self, axes):
         npix = (np.max(self._npix[0]), np.max(self._npix[1]))
         cdelt = (np.max(self._cdelt[0]), np.max(self._cdelt[1]))
         axes = copy.deepcopy(self.axes) + axes
-        return self.__class__(self._wcs.deepcopy(), npix, cdelt=cdelt, axes=axes)
+        return self.__class__(
+            self._wcs.deepcopy(),
+            npix,
+            cdelt=cdelt,
+            axes=axes,
+            cutout_info=copy.deepcopy(self.cutout_info),
+        )
 
     def pad(self, pad_width):
         if np.isscalar(pad_width):
@@ -736,7 +774,7 @@ class WcsGeom(MapGeom):
             npix = (self.npix[0] / factor, self.npix[1] / factor)
             cdelt = (self._cdelt[0] * factor, self._cdelt[1] * factor)
             wcs = get_resampled_wcs(self.wcs, factor, True)
-            return self._init_copy(wcs=wcs, npix=npix, cdelt=cdelt)
+            return self._init_copy(wcs=wcs, npix=npix, cdelt=cdelt, cutout_info=None)
         else:
             if not self.is_regular:
                 raise NotImplementedError("Upsampling in non-spatial axes not"
@@ -753,7 +791,7 @@ class WcsGeom(MapGeom):
             npix = (self.npix[0] * factor, self.npix[1] * factor)
             cdelt = (self._cdelt[0] / factor, self._cdelt[1] / factor)
             wcs = get_resampled_wcs(self.wcs, factor, False)
-            return self._init_copy(wcs=wcs, npix=npix, cdelt=cdelt)
+            return self._init_copy(wcs=wcs, npix=npix, cdelt=cdelt, cutout_info=None)
         else:
             if not self.is_regular:
                 raise NotImplementedError("Upsampling in non-spatial axes not"
@@ -829,8 +867,9 @@ class WcsGeom(MapGeom):
 
         Returns
         -------
-        cutout : `~gammapy.maps.WcsNDMap`
-            Cutout map
+        cutout : `~gammapy.maps.WcsGeom`
+            Cutout geometry, with the slices into this geometry stored
+            in `WcsGeom.cutout_info`.
         """
         width = _check_width(width)
         dummy_data = np.empty(self.to_image().data_shape)
@@ -843,7 +882,10 @@ class WcsGeom(MapGeom):
             mode=mode,
         )
 
-        return self._init_copy(wcs=c2d.wcs, npix=c2d.shape[::-1])
+        cutout_info = _make_cutout_info(c2d, self)
+        return self._init_copy(
+            wcs=c2d.wcs, npix=c2d.shape[::-1], cutout_info=cutout_info
+        )
 
     def region_mask(self, regions, inside=True):
         """Create a mask from a given list of regions
@@ -944,6 +986,16 @@ class WcsGeom(MapGeom):
         return not self.__eq__(other)
 
 
+def _make_cutout_info(c2d, geom):
+    """Cutout info dict (see `WcsGeom.cutout_info`) of a `~astropy.nddata.Cutout2D`."""
+    return {
+        "parent-slices": c2d.slices_original,
+        "cutout-slices": c2d.slices_cutout,
+        "parent-shape": tuple(geom.data_shape[-2:]),
+        "parent-wcs": geom.wcs.deepcopy(),
+    }
+
+
 def pix2world(wcs, cdelt, crpix, pix):
     """Perform pixel to world coordinate transformation for a WCS
     projection with a given pixel size (CDELT) and reference pixel
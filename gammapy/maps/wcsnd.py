@@ -1,5 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+import threading
+from weakref import WeakKeyDictionary
 import numpy as np
 from astropy.io import fits
 import astropy.units as u
@@ -7,13 +9,14 @@ from astropy.nddata import Cutout2D
 from astropy.convolution import Tophat2DKernel
 from scipy.ndimage import gaussian_filter, uniform_filter, convolve
 from scipy.signal import fftconvolve
+from scipy.fftpack import next_fast_len
 from scipy.interpolate import griddata
 from scipy.ndimage import map_coordinates
 from ..extern.skimage import block_reduce
 from ..utils.units import unit_from_fits_image_hdu
 from ..utils.interpolation import ScaledRegularGridInterpolator
 from .geom import pix_tuple_to_idx
-from .wcs import _check_width
+from .wcs import _check_width, _make_cutout_info
 from .utils import interp_to_order, INVALID_INDEX
 from .wcsmap import WcsGeom, WcsMap
 from .reproject import reproject_car_to_hpx, reproject_car_to_wcs
@@ -23,6 +26,23 @@ __all__ = ["WcsNDMap"]
 
 log = logging.getLogger(__name__)
 
+try:
+    # scipy >= 1.4 supports multi-threaded transforms, before ``scipy.fft``
+    # is a function and not a module
+    import scipy.fft as _fft
+
+    _FFT_HAS_WORKERS = True
+except ImportError:
+    from numpy import fft as _fft
+
+    _FFT_HAS_WORKERS = False
+
+# Kernel spectra per `PSFKernel` and padded shape, see `_fft_convolve_same`
+_KERNEL_SPECTRUM_CACHE = WeakKeyDictionary()
+
+# Zero padded input buffers, per thread and padded shape
+_FFT_BUFFERS = threading.local()
+
 
 class WcsNDMap(WcsMap):
     """Representation of a N+2D map using WCS with two spatial dimensions
@@ -567,7 +587,7 @@ class WcsNDMap(WcsMap):
 
         return self._init_copy(data=smoothed_data)
 
-    def convolve(self, kernel, use_fft=True, **kwargs):
+    def convolve(self, kernel, use_fft=True, n_threads=None, **kwargs):
         """
         Convolve map with a kernel.
 
@@ -575,12 +595,19 @@ class WcsNDMap(WcsMap):
         If the kernel is higher dimensional it must match the map in the number of
         dimensions and the corresponding kernel is selected for every image plane.
 
+        With ``use_fft=True`` and no further keyword arguments all image planes
+        are transformed in one batched FFT. For a `~gammapy.cube.PSFKernel` the
+        Fourier transform of the kernel is cached and re-used in later calls
+        with the same map shape.
+
         Parameters
         ----------
         kernel : `~gammapy.cube.PSFKernel` or `numpy.ndarray`
             Convolution kernel.
         use_fft : bool
             Use `scipy.signal.fftconvolve` or `scipy.ndimage.convolve`.
+        n_threads : int, optional
+            Number of threads used for the batched FFT. Requires scipy >= 1.4.
         kwargs : dict
             Keyword arguments passed to `scipy.signal.fftconvolve` or
             `scipy.ndimage.convolve`.
@@ -592,10 +619,7 @@ class WcsNDMap(WcsMap):
         """
         from ..cube.psf_kernel import PSFKernel
 
-        conv_function = fftconvolve if use_fft else convolve
-        convolved_data = np.empty(self.data.shape, dtype=np.float32)
-        if use_fft:
-            kwargs.setdefault("mode", "same")
+        psf_kernel = None
 
         if isinstance(kernel, PSFKernel):
             kmap = kernel.psf_kernel_map
@@ -603,7 +627,16 @@ class WcsNDMap(WcsMap):
                 self.geom.pixel_scales.deg, kmap.geom.pixel_scales.deg, rtol=1e-5
             ):
                 raise ValueError("Pixel size of kernel and map not compatible.")
-            kernel = kmap.data
+            psf_kernel, kernel = kernel, kmap.data
+
+        if use_fft and not kwargs:
+            data = _fft_convolve_same(self.data, kernel, psf_kernel, n_threads)
+            return self._init_copy(data=data.astype(np.float32, copy=False))
+
+        conv_function = fftconvolve if use_fft else convolve
+        convolved_data = np.empty(self.data.shape, dtype=np.float32)
+        if use_fft:
+            kwargs.setdefault("mode", "same")
 
         for img, idx in self.iter_by_image():
             idx = Ellipsis if kernel.ndim == 2 else idx
@@ -644,7 +677,121 @@ class WcsNDMap(WcsMap):
         # Create the slices with the non-spatial axis
         cutout_slices = Ellipsis, c2d.slices_original[0], c2d.slices_original[1]
 
-        geom = WcsGeom(c2d.wcs, c2d.shape[::-1], axes=self.geom.axes)
+        cutout_info = _make_cutout_info(c2d, self.geom)
+        geom = WcsGeom(
+            c2d.wcs, c2d.shape[::-1], axes=self.geom.axes, cutout_info=cutout_info
+        )
         data = self.data[cutout_slices]
 
         return self._init_copy(geom=geom, data=data)
+
+    def stack(self, other):
+        """Stack cutout into map, in place.
+
+        The data of ``other`` is added to the data of this map without any
+        coordinate transformation, using the slices stored in
+        `WcsGeom.cutout_info` of the cutout geometry. The geometry of
+        ``other`` must therefore be a cutout of this map geometry (as created
+        by `WcsGeom.cutout` or `WcsNDMap.cutout`) or be identical to it,
+        with the same non-spatial axes.
+
+        Parameters
+        ----------
+        other : `WcsNDMap`
+            Other map to stack
+        """
+        if self.geom.axes != other.geom.axes:
+            raise ValueError("Can only stack maps with identical non-spatial axes.")
+
+        cutout_info = other.geom.cutout_info
+
+        if cutout_info is not None:
+            is_parent = cutout_info["parent-shape"] == self.geom.data_shape[-2:]
+            is_parent = is_parent and self.geom.wcs.wcs.compare(
+                cutout_info["parent-wcs"].wcs, tolerance=1e-6
+            )
+            if not is_parent:
+                raise ValueError("Can only stack cutouts of the same map geometry.")
+
+            parent_slices = (Ellipsis,) + tuple(cutout_info["parent-slices"])
+            cutout_slices = (Ellipsis,) + tuple(cutout_info["cutout-slices"])
+        elif self.geom == other.geom:
+            parent_slices, cutout_slices = Ellipsis, Ellipsis
+        else:
+            raise ValueError(
+                "Can only stack identical maps or cutouts of the same map geometry."
+            )
+
+        data = other.quantity[cutout_slices].to_value(self.unit)
+        self.data[parent_slices] += data
+
+
+def _fft_convolve_same(data, kernel, psf_kernel=None, n_threads=None):
+    """Convolve the image planes of ``data`` with a batched FFT.
+
+    Equivalent to `scipy.signal.fftconvolve` with ``mode="same"`` applied to
+    every image plane (last two axes). The kernel is either 2-dim, or has
+    the same number of dimensions as ``data``.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        Data array.
+    kernel : `~numpy.ndarray`
+        Kernel array.
+    psf_kernel : `~gammapy.cube.PSFKernel`, optional
+        Kernel object ``kernel`` was taken from. If given, the transformed
+        kernel is cached for this object.
+    n_threads : int, optional
+        Number of threads.
+    """
+    if kernel.ndim != 2 and kernel.ndim != data.ndim:
+        raise ValueError(
+            "Kernel dimension {} does not match data dimension {}".format(
+                kernel.ndim, data.ndim
+            )
+        )
+
+    shape_image = data.shape[-2:]
+    shape_kernel = kernel.shape[-2:]
+    shape_full = [n + k - 1 for n, k in zip(shape_image, shape_kernel)]
+    shape_fft = tuple(next_fast_len(int(_)) for _ in shape_full)
+    axes = (-2, -1)
+
+    kwargs = {}
+    if n_threads is not None and _FFT_HAS_WORKERS:
+        kwargs["workers"] = n_threads
+
+    kernel_fft = None
+    if psf_kernel is not None:
+        cache = _KERNEL_SPECTRUM_CACHE.setdefault(psf_kernel, {})
+        cached = cache.get(shape_fft)
+        if cached is not None and cached[0] is kernel:
+            kernel_fft = cached[1]
+
+    if kernel_fft is None:
+        kernel_fft = _fft.rfftn(kernel, s=shape_fft, axes=axes, **kwargs)
+        if psf_kernel is not None:
+            cache[shape_fft] = (kernel, kernel_fft)
+
+    # re-use the zero padded input buffer; only the data region is overwritten
+    buffers = _FFT_BUFFERS.__dict__.setdefault("buffers", {})
+    key = (data.shape, shape_fft)
+    buffer = buffers.get(key)
+    if buffer is None:
+        buffers.clear()
+        buffer = np.zeros(data.shape[:-2] + shape_fft)
+        buffers[key] = buffer
+
+    buffer[..., : shape_image[0], : shape_image[1]] = data
+
+    data_fft = _fft.rfftn(buffer, axes=axes, **kwargs)
+    data_fft *= kernel_fft
+    result = _fft.irfftn(data_fft, s=shape_fft, axes=axes, **kwargs)
+
+    start = [(k - 1) // 2 for k in shape_kernel]
+    return result[
+        ...,
+        start[0] : start[0] + shape_image[0],
+        start[1] : start[1] + shape_image[1],
+    ]
@@ -11,7 +11,7 @@ from ..maps.utils import edges_from_lo_hi
 from ..utils.nddata import NDDataArray
 from ..utils.scripts import make_path
 from ..utils.fits import energy_axis_to_ebounds, ebounds_to_energy_axis
-from ..data import EventList
+from ..data import EventListBase
 
 __all__ = ["CountsSpectrum", "PHACountsSpectrum", "PHACountsSpectrumList"]
 
@@ -125,13 +125,20 @@ class CountsSpectrum:
         Parameters
         ----------
         events : `~astropy.units.Quantity`, `gammapy.data.EventList`,
-            List of event energies
+            List of event energies. An iterable of event lists, e.g. the blocks
+            returned by `~gammapy.data.EventListBase.read_chunks`, is accumulated.
         """
-        if isinstance(events, EventList):
-            events = events.energy
+        if isinstance(events, (EventListBase, u.Quantity)):
+            events = [events]
+
+        binned_val = np.zeros(self.energy.nbin, dtype=int)
+        for chunk in events:
+            if isinstance(chunk, EventListBase):
+                chunk = chunk.energy
+
+            energy = chunk.to(self.energy.unit)
+            binned_val += np.histogram(energy.value, self.energy.edges)[0]
 
-        energy = events.to(self.energy.unit)
-        binned_val = np.histogram(energy.value, self.energy.edges)[0]
         self.data.data = binned_val
 
     @property
@@ -5,7 +5,14 @@ from astropy import units as u
 from .utils import SpectrumEvaluator
 from ..utils.scripts import make_path
 from ..utils.fitting import Dataset, Parameters
-from ..stats import wstat, cash
+from ..stats import (
+    wstat,
+    cash,
+    cash_derivative,
+    wstat_derivative,
+    cash_sum_cython,
+    wstat_sum_cython,
+)
 from ..utils.random import get_random_state
 from .core import CountsSpectrum, PHACountsSpectrum
 from .observation import SpectrumStats
@@ -115,16 +122,32 @@ class SpectrumDataset(Dataset):
         mask : `~numpy.ndarray`
             Mask to be combined with the dataset mask.
         """
-        if self.mask is None and mask is None:
-            stat = self.likelihood_per_bin()
-        elif self.mask is None:
-            stat = self.likelihood_per_bin()[mask]
-        elif mask is None:
-            stat = self.likelihood_per_bin()[self.mask]
-        else:
-            stat = self.likelihood_per_bin()[mask & self.mask]
+        if self.mask is not None:
+            mask = self.mask if mask is None else mask & self.mask
+
+        counts, npred = self.counts.data.data, self.npred().data.data
+        return cash_sum_cython(counts, npred, mask)
+
+    def likelihood_gradient(self, parameters=None, mask=None):
+        """Derivatives of the total likelihood w.r.t. the parameter values.
+
+        Parameters
+        ----------
+        mask : `~numpy.ndarray`
+            Mask to be combined with the dataset mask.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives, ordered like ``self.parameters.parameters``.
+            Entries of frozen parameters are zero.
+        """
+        if self.mask is not None:
+            mask = self.mask if mask is None else mask & self.mask
 
-        return np.sum(stat, dtype=np.float64)
+        counts, npred = self.counts.data.data, self.npred().data.data
+        dstat = cash_derivative(counts, npred)
+        return _chain_npred_gradient(dstat, self._predictor.compute_npred_gradient(), mask)
 
     def fake(self, random_state="random-seed"):
         """Simulate a fake `~gammapy.spectrum.CountsSpectrum`.
@@ -345,16 +368,41 @@ class SpectrumDatasetOnOff(Dataset):
         mask : `~numpy.ndarray`
             Mask to be combined with the dataset mask.
         """
-        if self.mask is None and mask is None:
-            stat = self.likelihood_per_bin()
-        elif self.mask is None:
-            stat = self.likelihood_per_bin()[mask]
-        elif mask is None:
-            stat = self.likelihood_per_bin()[self.mask]
-        else:
-            stat = self.likelihood_per_bin()[mask & self.mask]
+        if self.mask is not None:
+            mask = self.mask if mask is None else mask & self.mask
+
+        return wstat_sum_cython(
+            n_on=self.counts_on.data.data,
+            n_off=self.counts_off.data.data,
+            alpha=self.alpha,
+            mu_sig=self.npred().data.data,
+            mask=mask,
+        )
+
+    def likelihood_gradient(self, parameters=None, mask=None):
+        """Derivatives of the total likelihood w.r.t. the parameter values.
+
+        Parameters
+        ----------
+        mask : `~numpy.ndarray`
+            Mask to be combined with the dataset mask.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives, ordered like ``self.parameters.parameters``.
+            Entries of frozen parameters are zero.
+        """
+        if self.mask is not None:
+            mask = self.mask if mask is None else mask & self.mask
 
-        return np.sum(stat, dtype=np.float64)
+        dstat = wstat_derivative(
+            n_on=self.counts_on.data.data,
+            n_off=self.counts_off.data.data,
+            alpha=self.alpha,
+            mu_sig=self.npred().data.data,
+        )
+        return _chain_npred_gradient(dstat, self._predictor.compute_npred_gradient(), mask)
 
     @classmethod
     def read(cls, filename):
@@ -663,6 +711,16 @@ class SpectrumDatasetOnOff(Dataset):
         return stacked_stats
 
 
+def _chain_npred_gradient(dstat, npred_gradient, mask=None):
+    """Chain the likelihood derivative per bin with the npred derivatives."""
+    dstat = np.asarray(dstat)
+    if mask is not None:
+        dstat = dstat * mask
+
+    gradient = [0.0 if grad is None else np.sum(dstat * grad) for grad in npred_gradient]
+    return np.array(gradient)
+
+
 class SpectrumDatasetOnOffStacker:
     r"""Stack a list of homogeneous datasets.
 
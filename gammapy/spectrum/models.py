@@ -39,14 +39,41 @@ class SpectralModel(Model):
 
     def __call__(self, energy):
         """Call evaluate method of derived classes"""
+        kwargs = self._evaluate_kwargs(energy)
+        return self.evaluate(energy, **kwargs)
+
+    def _evaluate_kwargs(self, energy):
         kwargs = dict()
         for par in self.parameters.parameters:
             quantity = par.quantity
             if quantity.unit.physical_type == "energy":
                 quantity = quantity.to(energy.unit)
             kwargs[par.name] = quantity
+        return kwargs
 
-        return self.evaluate(energy, **kwargs)
+    def gradient(self, energy):
+        """Derivatives of the model w.r.t. the parameter values.
+
+        Uses the ``evaluate_gradient`` method of derived classes, if they
+        define one, otherwise the derivatives are computed by finite
+        differences of the model.
+
+        Parameters
+        ----------
+        energy : `~astropy.units.Quantity`
+            Energy at which to evaluate
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives, ordered like ``parameters.parameters``. Entries of
+            frozen parameters can be None.
+        """
+        if hasattr(self, "evaluate_gradient"):
+            kwargs = self._evaluate_kwargs(energy)
+            return list(self.evaluate_gradient(energy, **kwargs))
+
+        return self._numerical_gradient(self, energy)
 
     def __mul__(self, model):
         if not isinstance(model, SpectralModel):
@@ -537,6 +564,13 @@ class PowerLaw(SpectralModel):
         """Evaluate the model (static function)."""
         return amplitude * np.power((energy / reference), -index)
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference):
+        """Evaluate the derivatives w.r.t. the parameters (static function)."""
+        value = amplitude * np.power((energy / reference), -index)
+        log_energy = np.log((energy / reference).to(""))
+        return [-value * log_energy, value / amplitude, value * index / reference]
+
     def integral(self, emin, emax, **kwargs):
         r"""Integrate power law analytically.
 
@@ -867,6 +901,18 @@ class ExponentialCutoffPowerLaw(SpectralModel):
             cutoff = exp(-energy * lambda_)
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference, lambda_):
+        """Evaluate the derivatives w.r.t. the parameters (static function)."""
+        value = amplitude * (energy / reference) ** (-index) * np.exp(-energy * lambda_)
+        log_energy = np.log((energy / reference).to(""))
+        return [
+            -value * log_energy,
+            value / amplitude,
+            value * index / reference,
+            -value * energy,
+        ]
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.utils.Quantity`).
@@ -1086,6 +1132,18 @@ class LogParabola(SpectralModel):
             exponent = -alpha - beta * log(xx)
         return amplitude * np.power(xx, exponent)
 
+    @staticmethod
+    def evaluate_gradient(energy, amplitude, reference, alpha, beta):
+        """Evaluate the derivatives w.r.t. the parameters (static function)."""
+        log_xx = np.log((energy / reference).to(""))
+        value = amplitude * np.exp(-alpha * log_xx - beta * log_xx ** 2)
+        return [
+            value / amplitude,
+            value * (alpha + 2 * beta * log_xx) / reference,
+            -value * log_xx,
+            -value * log_xx ** 2,
+        ]
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -40,6 +40,15 @@ class TestCountsSpectrum:
                 energy_hi=bins.upper_bounds,
             )
 
+    def test_fill_chunks(self):
+        spec = CountsSpectrum(energy_lo=self.bins[:-1], energy_hi=self.bins[1:])
+        energy = [1.2, 3, 9] * u.TeV
+        spec.fill(energy)
+        assert_allclose(spec.data.data.value, [1, 0, 1, 0, 0, 1])
+
+        spec.fill([energy, energy[:1]])
+        assert_allclose(spec.data.data.value, [2, 0, 1, 0, 0, 1])
+
     def test_evaluate(self):
         test_e = self.bins[2] + 0.1 * u.TeV
         test_eval = self.spec.data.evaluate(energy=test_e)
@@ -235,6 +235,30 @@ def test_model_unit():
     assert value.unit == "cm-2 s-1 TeV-1"
 
 
+@pytest.mark.parametrize(
+    "model",
+    [
+        PowerLaw(index=2.3, amplitude="1e-12 cm-2 s-1 TeV-1", reference="1 TeV"),
+        ExponentialCutoffPowerLaw(lambda_="0.2 TeV-1"),
+        LogParabola(alpha=2.2, beta=0.3, reference="1 TeV"),
+    ],
+)
+def test_model_gradient(model):
+    energy = [0.5, 2, 30] * u.TeV
+    gradient = model.gradient(energy)
+    gradient_numerical = model._numerical_gradient(model, energy)
+
+    assert len(gradient) == len(model.parameters.parameters)
+
+    for par, grad, grad_numerical in zip(
+        model.parameters.parameters, gradient, gradient_numerical
+    ):
+        if grad_numerical is None:
+            continue
+        unit = grad_numerical.unit
+        assert_quantity_allclose(grad.to(unit), grad_numerical, rtol=1e-6)
+
+
 @requires_dependency("matplotlib")
 @requires_data("gammapy-data")
 def test_table_model_from_file():
@@ -141,3 +141,37 @@ def test_counts_predictor(case):
     predictor = SpectrumEvaluator(**case)
     actual = predictor.compute_npred().total_counts.value
     assert_allclose(actual, desired)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        PowerLaw(index=2.3, amplitude="1e-11 TeV-1 cm-2 s-1", reference="1 TeV"),
+        ExponentialCutoffPowerLaw(
+            index=2, amplitude="1e-11 TeV-1 cm-2 s-1", lambda_="0.1 TeV-1"
+        ),
+    ],
+)
+def test_counts_predictor_gradient(model):
+    e_true = Quantity(np.logspace(-1, 2, 30), "TeV")
+    e_reco = Quantity(np.logspace(-1, 2, 20), "TeV")
+    predictor = SpectrumEvaluator(
+        model=model,
+        aeff=EffectiveAreaTable.from_parametrization(e_true),
+        edisp=EnergyDispersion.from_gauss(
+            e_reco=e_reco, e_true=e_true, bias=0, sigma=0.2
+        ),
+        livetime=Quantity(10, "h"),
+    )
+
+    gradient = predictor.compute_npred_gradient()
+    gradient_numerical = model._numerical_gradient(
+        lambda: predictor.compute_npred().data.data.value, eps=1e-6
+    )
+
+    for par, actual, desired in zip(
+        model.parameters.parameters, gradient, gradient_numerical
+    ):
+        if par.frozen:
+            continue
+        assert_allclose(actual, desired.to_value(1 / par.unit), rtol=1e-4, atol=1e-10)
@@ -70,8 +70,40 @@ class SpectrumEvaluator:
         true_counts = self.apply_aeff(integral_flux)
         return self.apply_edisp(true_counts)
 
-    def integrate_model(self):
-        """Integrate model in true energy space"""
+    def compute_npred_gradient(self):
+        """Evaluate derivatives of the predicted counts w.r.t. the parameter values.
+
+        The model derivatives (see `~gammapy.spectrum.models.SpectralModel.gradient`)
+        are integrated over the true energy bins with the derivative of the
+        log-log trapezoidal rule used by `integrate_model`, and then
+        propagated through effective area and energy dispersion.
+
+        Returns
+        -------
+        gradient : list of `~numpy.ndarray`
+            Derivatives of npred, ordered like ``model.parameters.parameters``,
+            in units of the inverse parameter units. Entries of frozen parameters
+            are None.
+        """
+        energy = self._get_e_true()
+        values = self.model(energy)
+
+        gradient = []
+        for par, grad in zip(self.model.parameters.parameters, self.model.gradient(energy)):
+            if grad is None:
+                gradient.append(None)
+                continue
+
+            integral = _trapz_loglog_gradient(values, grad, energy)
+            # multiply with the parameter unit, so that the derivative has the
+            # units of the integral flux expected by `apply_aeff`
+            true_counts = self.apply_aeff(integral * par.unit)
+            gradient.append(self.apply_edisp(true_counts).data.data.value)
+
+        return gradient
+
+    def _get_e_true(self):
+        """True energy bin edges, set from the effective area if given."""
         if self.aeff is not None:
             # TODO: True energy is converted to model amplitude unit. See issue 869
             ref_unit = None
@@ -86,9 +118,12 @@ class SpectrumEvaluator:
             if self.e_true is None:
                 raise ValueError("No true energy binning given")
 
-        return self.model.integral(
-            emin=self.e_true[:-1], emax=self.e_true[1:], intervals=True
-        )
+        return self.e_true
+
+    def integrate_model(self):
+        """Integrate model in true energy space"""
+        e_true = self._get_e_true()
+        return self.model.integral(emin=e_true[:-1], emax=e_true[1:], intervals=True)
 
     def apply_aeff(self, integral_flux):
         if self.aeff is not None:
@@ -253,3 +288,50 @@ def _trapz_loglog(y, x, axis=-1, intervals=False):
     ret = np.add.reduce(trapzs, axis) * x_unit * y_unit
 
     return ret
+
+
+def _trapz_loglog_gradient(y, y_gradient, x):
+    r"""Derivative of the `_trapz_loglog` integrals in the intervals of ``x``.
+
+    The integral of a power law through :math:`(x_1, y_1)` and
+    :math:`(x_2, y_2)` can be written as :math:`x_1 y_1 L g(t)`, with
+    :math:`L = \log(x_2 / x_1)`, :math:`t = \log(x_2 y_2 / (x_1 y_1))` and
+    :math:`g(t) = (e^t - 1) / t`. Its derivative w.r.t. a parameter follows
+    from the chain rule with the derivatives of :math:`y_1` and :math:`y_2`.
+
+    Parameters
+    ----------
+    y : `~astropy.units.Quantity`
+        Function values at ``x``.
+    y_gradient : `~astropy.units.Quantity`
+        Derivatives of the function values at ``x`` w.r.t. the parameter.
+    x : `~astropy.units.Quantity`
+        Interval edges, 1D.
+
+    Returns
+    -------
+    gradient : `~astropy.units.Quantity`
+        Derivatives of the integrals in the intervals of ``x``.
+    """
+    y_gradient = Quantity(y_gradient)
+    x_unit, grad_unit = x.unit, y_gradient.unit
+    x, y = x.value, y.value
+    dy = np.broadcast_to(y_gradient.value, x.shape)
+    x1, x2, y1, y2, dy1, dy2 = x[:-1], x[1:], y[:-1], y[1:], dy[:-1], dy[1:]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_x = np.log(x2 / x1)
+        t = np.log((x2 * y2) / (x1 * y1))
+
+        # use the series expansion where (e^t - 1) / t is numerically unstable
+        small = np.abs(t) < 1e-4
+        g = np.where(small, 1 + t / 2 + t ** 2 / 6, np.expm1(t) / t)
+        dg = np.where(
+            small, 0.5 + t / 3 + t ** 2 / 8, (t * np.exp(t) - np.expm1(t)) / t ** 2
+        )
+        gradient = x1 * log_x * ((g - dg) * dy1 + dg * y1 / y2 * dy2)
+
+    tozero = (y1 == 0.0) | (y2 == 0.0) | (x1 == x2)
+    gradient[tozero] = 0.0
+
+    return gradient * x_unit * grad_unit
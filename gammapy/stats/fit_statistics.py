@@ -8,7 +8,9 @@ import numpy as np
 __all__ = [
     "cash",
     "cstat",
+    "cash_derivative",
     "wstat",
+    "wstat_derivative",
     "get_wstat_mu_bkg",
     "get_wstat_gof_terms",
     "chi2",
@@ -112,6 +114,37 @@ def cstat(n_on, mu_on, n_on_min=N_ON_MIN):
     return stat
 
 
+def cash_derivative(n_on, mu_on):
+    r"""Derivative of the Cash statistic w.r.t. the expected counts.
+
+    .. math::
+        \frac{\partial C}{\partial \mu_{on}} = 2 \left( 1 - \frac{n_{on}}{\mu_{on}} \right)
+
+    and zero where :math:`\mu_{on} <= 0`. The C statistic `cstat` differs from
+    the Cash statistic by model independent terms only, so this is its
+    derivative as well.
+
+    Parameters
+    ----------
+    n_on : array_like
+        Observed counts
+    mu_on : array_like
+        Expected counts
+
+    Returns
+    -------
+    derivative : ndarray
+        Derivative per bin
+    """
+    n_on = np.asanyarray(n_on, dtype=np.float64)
+    mu_on = np.asanyarray(mu_on, dtype=np.float64)
+
+    # suppress zero division warnings, they are corrected below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        derivative = 2 * (1 - n_on / mu_on)
+    return np.where(mu_on > 0, derivative, 0)
+
+
 def wstat(n_on, n_off, alpha, mu_sig, mu_bkg=None, extra_terms=True):
     r"""W statistic, for Poisson data with Poisson background.
 
@@ -190,6 +223,44 @@ def wstat(n_on, n_off, alpha, mu_sig, mu_bkg=None, extra_terms=True):
     return stat
 
 
+def wstat_derivative(n_on, n_off, alpha, mu_sig):
+    r"""Derivative of the W statistic w.r.t. the signal expected counts.
+
+    As ``mu_bkg`` is the profile likelihood solution, the derivative of the
+    statistic w.r.t. ``mu_bkg`` vanishes and the total derivative is:
+
+    .. math::
+        \frac{\partial W}{\partial \mu_{sig}} = 2 \left( 1 -
+            \frac{n_{on}}{\mu_{sig} + \alpha \mu_{bkg}} \right)
+
+    Bins where the statistic is not defined have a derivative of zero.
+
+    Parameters
+    ----------
+    n_on : array_like
+        Total observed counts
+    n_off : array_like
+        Total observed background counts
+    alpha : array_like
+        Exposure ratio between on and off region
+    mu_sig : array_like
+        Signal expected counts
+
+    Returns
+    -------
+    derivative : ndarray
+        Derivative per bin
+    """
+    n_on = np.atleast_1d(np.asanyarray(n_on, dtype=np.float64))
+    mu_bkg = get_wstat_mu_bkg(n_on, n_off, alpha, mu_sig)
+    mu_on = mu_sig + alpha * mu_bkg
+
+    # suppress zero division warnings, they are corrected below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        derivative = 2 * (1 - np.where(n_on == 0, 0, n_on / mu_on))
+    return np.where(np.isfinite(derivative), derivative, 0)
+
+
 def get_wstat_mu_bkg(n_on, n_off, alpha, mu_sig):
     """Calculate ``mu_bkg`` for wstat
 
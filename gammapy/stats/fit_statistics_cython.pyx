@@ -1,14 +1,41 @@
 import numpy as np
 cimport numpy as np
 cimport cython
+from libc.math cimport log, sqrt, isnan
 
-cdef extern from "math.h":
-    float log(float x)
+__all__ = ["cash_sum_cython", "cstat_sum_cython", "wstat_sum_cython"]
 
-@cython.cdivision(True)
-@cython.boundscheck(False)
-def cash_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
-                    np.ndarray[np.float_t, ndim=1] npred):
+ctypedef fused counts_t:
+    float
+    double
+
+ctypedef fused npred_t:
+    float
+    double
+
+
+def _as_1d(array):
+    """Flat float32 / float64 view (or copy) of an array."""
+    array = np.asarray(array)
+    if array.dtype != np.float32 and array.dtype != np.float64:
+        array = array.astype(np.float64)
+    return np.ascontiguousarray(array).ravel()
+
+
+def _as_mask(mask, size):
+    """Flat uint8 view of a boolean mask, or None."""
+    if mask is None:
+        return None
+
+    mask = np.ascontiguousarray(mask, dtype=bool).ravel()
+    if mask.size != size:
+        raise ValueError(
+            "Mask size {} does not match data size {}".format(mask.size, size)
+        )
+    return mask.view(np.uint8)
+
+
+def cash_sum_cython(counts, npred, mask=None):
     """Summed cash fit statistics.
 
     Parameters
@@ -17,22 +44,15 @@ def cash_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
         Counts array.
     npred : `~numpy.ndarray`
         Predicted counts array.
+    mask : `~numpy.ndarray`, optional
+        Boolean mask, only bins where it is True are summed.
+        The arrays are reduced in one pass, without copying the selected bins.
     """
-    cdef np.float_t sum = 0
-    cdef unsigned int i, ni
-    ni = counts.shape[0]
-    for i in range(ni):
-        if npred[i] > 0:
-            sum += npred[i]
-            if counts[i] > 0:
-                sum -= counts[i] * log(npred[i])
-    return 2 * sum
+    counts, npred = _as_1d(counts), _as_1d(npred)
+    return _cash_sum(counts, npred, _as_mask(mask, counts.size))
 
 
-@cython.cdivision(True)
-@cython.boundscheck(False)
-def cstat_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
-                     np.ndarray[np.float_t, ndim=1] npred):
+def cstat_sum_cython(counts, npred, mask=None):
     """Summed cstat fit statistics.
 
     Parameters
@@ -41,13 +61,118 @@ def cstat_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
         Counts array.
     npred : `~numpy.ndarray`
         Predicted counts array.
+    mask : `~numpy.ndarray`, optional
+        Boolean mask, only bins where it is True are summed.
+        The arrays are reduced in one pass, without copying the selected bins.
     """
-    cdef np.float_t sum = 0
-    cdef unsigned int i, ni
+    counts, npred = _as_1d(counts), _as_1d(npred)
+    return _cstat_sum(counts, npred, _as_mask(mask, counts.size))
+
+
+def wstat_sum_cython(n_on, n_off, alpha, mu_sig, mask=None):
+    """Summed wstat fit statistics.
+
+    Corresponds to the sum of `~gammapy.stats.wstat` (with ``extra_terms=True``),
+    where NaN values of single bins are set to zero.
+
+    Parameters
+    ----------
+    n_on : `~numpy.ndarray`
+        Total observed counts
+    n_off : `~numpy.ndarray`
+        Total observed background counts
+    alpha : `~numpy.ndarray` or float
+        Exposure ratio between on and off region
+    mu_sig : `~numpy.ndarray`
+        Signal expected counts
+    mask : `~numpy.ndarray`, optional
+        Boolean mask, only bins where it is True are summed.
+        The arrays are reduced in one pass, without copying the selected bins.
+    """
+    n_on, n_off, mu_sig = _as_1d(n_on), _as_1d(n_off), _as_1d(mu_sig)
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=np.float64), n_on.shape)
+    alpha = np.ascontiguousarray(alpha)
+
+    if not n_on.size == n_off.size == mu_sig.size:
+        raise ValueError("Input arrays must have the same size")
+
+    n_on = n_on.astype(np.float64, copy=False)
+    n_off = n_off.astype(np.float64, copy=False)
+    return _wstat_sum(n_on, n_off, alpha, mu_sig, _as_mask(mask, n_on.size))
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _cash_sum(const counts_t[::1] counts, const npred_t[::1] npred,
+              const unsigned char[::1] mask):
+    cdef double sum = 0
+    cdef Py_ssize_t i, ni
+    cdef bint use_mask = mask is not None
+    ni = counts.shape[0]
+
+    with nogil:
+        for i in range(ni):
+            if use_mask and not mask[i]:
+                continue
+            if npred[i] > 0:
+                sum += npred[i]
+                if counts[i] > 0:
+                    sum -= counts[i] * log(npred[i])
+    return 2 * sum
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _cstat_sum(const counts_t[::1] counts, const npred_t[::1] npred,
+               const unsigned char[::1] mask):
+    cdef double sum = 0
+    cdef Py_ssize_t i, ni
+    cdef bint use_mask = mask is not None
     ni = counts.shape[0]
-    for i in range(ni):
-        if npred[i] > 0:
-            sum += npred[i]
-            if counts[i] > 0:
-                sum += (- counts[i] + counts[i] * log(counts[i] / npred[i]))
-    return 2 * sum
\ No newline at end of file
+
+    with nogil:
+        for i in range(ni):
+            if use_mask and not mask[i]:
+                continue
+            if npred[i] > 0:
+                sum += npred[i]
+                if counts[i] > 0:
+                    sum += (- counts[i] + counts[i] * log(counts[i] / npred[i]))
+    return 2 * sum
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _wstat_sum(const double[::1] n_on, const double[::1] n_off,
+               const double[::1] alpha, const npred_t[::1] mu_sig,
+               const unsigned char[::1] mask):
+    cdef double sum = 0
+    cdef double c, d, a, mu_bkg, stat
+    cdef Py_ssize_t i, ni
+    cdef bint use_mask = mask is not None
+    ni = n_on.shape[0]
+
+    with nogil:
+        for i in range(ni):
+            if use_mask and not mask[i]:
+                continue
+
+            a = alpha[i]
+            c = a * (n_on[i] + n_off[i]) - (1 + a) * mu_sig[i]
+            d = sqrt(c * c + 4 * a * (a + 1) * n_off[i] * mu_sig[i])
+            mu_bkg = (c + d) / (2 * a * (a + 1))
+
+            stat = mu_sig[i] + (1 + a) * mu_bkg
+            if n_on[i] > 0:
+                stat += - n_on[i] * log(mu_sig[i] + a * mu_bkg)
+                stat += - n_on[i] * (1 - log(n_on[i]))
+            if n_off[i] > 0:
+                stat += - n_off[i] * log(mu_bkg)
+                stat += - n_off[i] * (1 - log(n_off[i]))
+
+            if not isnan(stat):
+                sum += 2 * stat
+    return sum
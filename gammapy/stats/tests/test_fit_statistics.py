@@ -131,6 +131,38 @@ def test_ctstat_sum_cython(test_data):
     assert_allclose(stat, ref)
 
 
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_stat_sum_cython_mask(test_data, dtype):
+    counts = np.array(test_data["n_on"], dtype=dtype)
+    npred = np.array(test_data["mu_sig"], dtype=dtype)
+    mask = counts > 4
+
+    stat = stats.cash_sum_cython(counts=counts, npred=npred, mask=mask)
+    ref = stats.cash(counts, npred)[mask].sum()
+    assert_allclose(stat, ref, rtol=1e-6)
+
+    stat = stats.cstat_sum_cython(counts=counts, npred=npred, mask=mask)
+    ref = stats.cstat(counts, npred)[mask].sum()
+    assert_allclose(stat, ref, rtol=1e-6)
+
+
+def test_wstat_sum_cython(test_data):
+    kwargs = dict(
+        n_on=test_data["n_on"],
+        n_off=test_data["n_off"],
+        alpha=test_data["alpha"],
+        mu_sig=test_data["mu_sig"],
+    )
+    ref = np.nan_to_num(stats.wstat(**kwargs))
+
+    stat = stats.wstat_sum_cython(**kwargs)
+    assert_allclose(stat, ref.sum())
+
+    mask = np.arange(len(ref)) % 2 == 0
+    stat = stats.wstat_sum_cython(mask=mask, **kwargs)
+    assert_allclose(stat, ref[mask].sum())
+
+
 def test_wstat_corner_cases():
     """test WSTAT formulae for corner cases"""
     n_on = 0
@@ -5,6 +5,7 @@ from .model import *
 from .likelihood import *
 from .fit import *
 from .datasets import *
+from .instrumentation import *
 
 # Backends
 from .scipy import *
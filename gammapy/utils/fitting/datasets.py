@@ -2,9 +2,12 @@
 import abc
 import copy
 from collections import Counter
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 import numpy as np
 from astropy.utils import lazyproperty
 from .parameter import Parameters
+from .instrumentation import record
 
 __all__ = ["Dataset", "Datasets"]
 
@@ -34,6 +37,17 @@ class Dataset(abc.ABC):
     def likelihood_per_bin(self):
         """Likelihood per bin given the current model parameters"""
 
+    def likelihood_gradient(self, parameters, mask=None):
+        """Derivatives of the total likelihood w.r.t. the parameter values.
+
+        Optional, datasets that implement it can be fitted with analytic
+        gradients (see `~gammapy.utils.fitting.Fit.optimize`).
+        Should return an array ordered like ``self.parameters.parameters``.
+        """
+        raise NotImplementedError(
+            "Likelihood gradient not available for {}".format(type(self).__name__)
+        )
+
     def copy(self):
         """A deep copy."""
         return copy.deepcopy(self)
@@ -48,9 +62,34 @@ class Datasets:
         List of `Dataset` objects ot be joined.
     mask : `~numpy.ndarray`
         Global fitting mask used for all datasets.
+    n_jobs : int
+        Number of workers used to evaluate the likelihoods of the datasets
+        concurrently. Default is 1, which evaluates them sequentially.
+    parallel_backend : {"threads", "processes"}
+        Worker type. With "processes" every worker process holds a copy of the
+        datasets, which is created when the pool is started on the first
+        likelihood evaluation. Afterwards only the parameter values are sent
+        to the workers. Call `close` after modifying the datasets in another
+        way than by setting parameter values.
+    instrumentation : `~gammapy.utils.fitting.Instrumentation`, optional
+        Records call counts and times of the likelihood evaluation.
+
+    Examples
+    --------
+    The worker pool is shut down when leaving the context::
+
+        with Datasets(datasets, n_jobs=4, parallel_backend="processes") as datasets:
+            result = Fit(datasets).run()
     """
 
-    def __init__(self, datasets, mask=None):
+    def __init__(
+        self,
+        datasets,
+        mask=None,
+        n_jobs=1,
+        parallel_backend="threads",
+        instrumentation=None,
+    ):
         if not isinstance(datasets, list):
             datasets = [datasets]
         self._datasets = datasets
@@ -60,7 +99,16 @@ class Datasets:
                 "Cannot apply mask if datasets are not of the same type and shape."
             )
 
+        if parallel_backend not in {"threads", "processes"}:
+            raise ValueError("Invalid parallel_backend: {!r}".format(parallel_backend))
+
         self.mask = mask
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+        self._pool = None
+        self._instrumentation = None
+        if instrumentation is not None:
+            self.instrumentation = instrumentation
 
     @lazyproperty
     def parameters(self):
@@ -75,6 +123,28 @@ class Datasets:
         """List of datasets"""
         return self._datasets
 
+    @property
+    def instrumentation(self):
+        """Instrumentation (`~gammapy.utils.fitting.Instrumentation`).
+
+        Is passed on to the datasets that support it.
+        """
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation):
+        self._instrumentation = instrumentation
+        for dataset in self.datasets:
+            if hasattr(dataset, "instrumentation"):
+                dataset.instrumentation = instrumentation
+
+    @property
+    def _components(self):
+        return [
+            "{}[{}]".format(type(dataset).__name__, idx)
+            for idx, dataset in enumerate(self.datasets)
+        ]
+
     @property
     def types(self):
         """Types of the contained datasets"""
@@ -93,15 +163,97 @@ class Datasets:
         return np.all(is_ref_shape)
 
     def likelihood(self, parameters=None):
-        """Compute joint likelihood"""
-        total_likelihood = 0
-        # TODO: add parallel evaluation of likelihoods
-        for dataset in self.datasets:
-            total_likelihood += dataset.likelihood(
-                parameters=parameters, mask=self.mask
-            )
+        """Compute joint likelihood.
+
+        The likelihoods of the datasets are always summed in the order of the
+        datasets, so the result does not depend on ``n_jobs``.
+        """
+        with record(self.instrumentation, "likelihood", "Datasets"):
+            total_likelihood = 0
+            for likelihood in self._evaluate("likelihood", parameters):
+                total_likelihood += likelihood
         return total_likelihood
 
+    def likelihood_gradient(self, parameters=None):
+        """Compute derivatives of the joint likelihood w.r.t. the parameter values.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives, ordered like ``self.parameters.parameters``.
+        """
+        gradient = {}
+        with record(self.instrumentation, "likelihood_gradient", "Datasets"):
+            results = self._evaluate("likelihood_gradient", parameters)
+        for dataset, values in zip(self.datasets, results):
+            for par, value in zip(dataset.parameters.parameters, values):
+                gradient[id(par)] = gradient.get(id(par), 0) + value
+
+        return np.array([gradient.get(id(par), 0.0) for par in self.parameters.parameters])
+
+    def _evaluate(self, method, parameters):
+        """Call ``method`` of all datasets, return the results in dataset order."""
+        instrumentation = self.instrumentation
+
+        def func(dataset, component):
+            with record(instrumentation, "dataset." + method, component):
+                return getattr(dataset, method)(parameters=parameters, mask=self.mask)
+
+        if self.n_jobs == 1 or len(self.datasets) == 1:
+            return list(map(func, self.datasets, self._components))
+
+        pool = self._get_pool()
+
+        if self.parallel_backend == "threads":
+            return pool.starmap(func, zip(self.datasets, self._components))
+
+        # the workers hold copies of the datasets, so only send parameter factors
+        # and scales, which reproduce the values exactly, and contiguous chunks
+        # of dataset indices
+        values = [(par.factor, par.scale) for par in self.parameters.parameters]
+        chunks = np.array_split(np.arange(len(self.datasets)), self.n_jobs)
+        args = [(method, chunk, values) for chunk in chunks if len(chunk) > 0]
+
+        results = []
+        for result in pool.map(_evaluate_worker, args):
+            results.extend(result)
+        return results
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.parallel_backend == "threads":
+                self._pool = ThreadPool(processes=self.n_jobs)
+            else:
+                datasets = Datasets(self.datasets, mask=self.mask)
+                self._pool = Pool(
+                    processes=self.n_jobs,
+                    initializer=_init_worker,
+                    initargs=(datasets,),
+                )
+        return self._pool
+
+    def close(self):
+        """Shut down the worker pool.
+
+        It is started again on the next likelihood evaluation.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # the worker pool can't be copied or pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
     def __str__(self):
         str_ = self.__class__.__name__ + "\n"
         str_ += "--------\n\n"
@@ -115,4 +267,25 @@ class Datasets:
 
     def copy(self):
         """A deep copy."""
-        return copy.deepcopy(self)
\ No newline at end of file
+        return copy.deepcopy(self)
+
+
+_worker_datasets = None
+
+
+def _init_worker(datasets):
+    global _worker_datasets
+    # calls in the worker processes are not recorded
+    datasets.instrumentation = None
+    _worker_datasets = datasets
+
+
+def _evaluate_worker(args):
+    """Evaluate ``method`` of the worker copies of the datasets with given indices."""
+    method, indices, values = args
+
+    for par, (factor, scale) in zip(_worker_datasets.parameters.parameters, values):
+        par.factor, par.scale = factor, scale
+
+    datasets, mask = _worker_datasets.datasets, _worker_datasets.mask
+    return [getattr(datasets[idx], method)(parameters=None, mask=mask) for idx in indices]
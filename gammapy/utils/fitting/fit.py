@@ -1,12 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import abc
+from multiprocessing import Pool
 import numpy as np
 from astropy.utils.misc import InheritDocstrings
 from .iminuit import optimize_iminuit, covariance_iminuit, confidence_iminuit, mncontour
 from .sherpa import optimize_sherpa, covariance_sherpa
 from .scipy import optimize_scipy, covariance_scipy, confidence_scipy
-from .datasets import Datasets
+from .datasets import Dataset, Datasets
+from .instrumentation import record
 
 __all__ = ["Fit"]
 
@@ -72,13 +74,32 @@ class Fit:
     ----------
     datasets : `Dataset`, list of `Dataset` or `Datasets`
         Dataset or joint datasets to be fitted.
+    instrumentation : `~gammapy.utils.fitting.Instrumentation`, optional
+        Records call counts and wall times of the fit stages. The recorded
+        table is attached to the `OptimizeResult` as ``timing``.
     """
 
-    def __init__(self, datasets):
+    def __init__(self, datasets, instrumentation=None):
         if not isinstance(datasets, Datasets):
             datasets = Datasets(datasets)
 
         self.datasets = datasets
+        self._instrumentation = None
+        if instrumentation is not None:
+            self.instrumentation = instrumentation
+
+    @property
+    def instrumentation(self):
+        """Instrumentation (`~gammapy.utils.fitting.Instrumentation`).
+
+        Is passed on to the datasets.
+        """
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation):
+        self._instrumentation = instrumentation
+        self.datasets.instrumentation = instrumentation
 
     @property
     def _parameters(self):
@@ -120,13 +141,19 @@ class Fit:
 
         return optimize_result
 
-    def optimize(self, backend="minuit", **kwargs):
+    def optimize(self, backend="minuit", use_gradient=False, **kwargs):
         """Run the optimization.
 
         Parameters
         ----------
         backend : str
             Which backend to use (see ``gammapy.utils.fitting.registry``)
+        use_gradient : bool
+            Pass the analytic likelihood gradient of the datasets to the
+            optimizer, instead of relying on numerical derivatives. Only
+            supported by the "minuit" and "scipy" backends, and requires all
+            datasets to implement ``likelihood_gradient``, otherwise a
+            ``ValueError`` is raised.
         **kwargs : dict
             Keyword arguments passed to the optimizer. For the `"minuit"` backend
             see https://iminuit.readthedocs.io/en/latest/api.html#iminuit.Minuit
@@ -153,17 +180,28 @@ class Fit:
             Results
         """
         parameters = self._parameters
+        optimize_opts = dict(backend=backend, use_gradient=use_gradient, **kwargs)
+
+        if use_gradient:
+            if backend not in {"minuit", "scipy"}:
+                raise ValueError(
+                    "Gradients not supported by backend {!r}".format(backend)
+                )
+            self._check_gradient_support()
+            kwargs["gradient"] = self.datasets.likelihood_gradient
 
         if parameters.apply_autoscale:
             parameters.autoscale()
 
         compute = registry.get("optimize", backend)
+
         # TODO: change this calling interface!
         # probably should pass a likelihood, which has a model, which has parameters
         # and return something simpler, not a tuple of three things
-        factors, info, optimizer = compute(
-            parameters=parameters, function=self.datasets.likelihood, **kwargs
-        )
+        with record(self.instrumentation, "optimize", backend):
+            factors, info, optimizer = compute(
+                parameters=parameters, function=self.datasets.likelihood, **kwargs
+            )
 
         # TODO: Change to a stateless interface for minuit also, or if we must support
         # stateful backends, put a proper, backend-agnostic solution for this.
@@ -171,6 +209,8 @@ class Fit:
         # can access the Minuit object, because it features a lot useful functionality
         if backend == "minuit":
             self.minuit = optimizer
+            # used to set up the `~iminuit.Minuit` instances of worker processes
+            self._minuit_optimize_opts = optimize_opts
 
         # Copy final results into the parameters object
         parameters.set_parameter_factors(factors)
@@ -180,9 +220,29 @@ class Fit:
             total_stat=self.datasets.likelihood(),
             backend=backend,
             method=kwargs.get("method", backend),
+            timing=self._timing(),
             **info
         )
 
+    def _check_gradient_support(self):
+        """Raise if a dataset does not implement ``likelihood_gradient``."""
+        names = []
+        for dataset in self.datasets.datasets:
+            method = getattr(type(dataset), "likelihood_gradient", None)
+            if method is None or method is Dataset.likelihood_gradient:
+                names.append(type(dataset).__name__)
+
+        if names:
+            raise ValueError(
+                "Gradients not supported by datasets: {}. Use use_gradient=False"
+                " for numerical derivatives.".format(", ".join(names))
+            )
+
+    def _timing(self):
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.to_table()
+
     def covariance(self, backend="minuit"):
         """Estimate the covariance matrix.
 
@@ -202,7 +262,9 @@ class Fit:
         parameters = self._parameters
 
         # TODO: wrap MINUIT in a stateless backend
-        with parameters.restore_values:
+        with parameters.restore_values, record(
+            self.instrumentation, "covariance", backend
+        ):
             if backend == "minuit":
                 method = "hesse"
                 if hasattr(self, "minuit"):
@@ -218,7 +280,9 @@ class Fit:
         # TODO: decide what to return, and fill the info correctly!
         return CovarianceResult(backend=backend, method=method, parameters=parameters, success=info["success"], message=info["message"])
 
-    def confidence(self, parameter, backend="minuit", sigma=1, **kwargs):
+    def confidence(
+        self, parameter=None, backend="minuit", sigma=1, parameters=None, n_jobs=1, **kwargs
+    ):
         """Estimate confidence interval.
 
         Extra ``kwargs`` are passed to the backend.
@@ -237,14 +301,36 @@ class Fit:
             Parameter of interest
         sigma : float
             Number of standard deviations for the confidence level
+        parameters : list
+            List of parameters of interest, to estimate several confidence
+            intervals in one call.
+        n_jobs : int
+            Number of processes used, if ``parameters`` is given. Every process
+            works on a copy of the datasets, starting from the current parameter
+            values. With the "minuit" backend every process first re-runs the
+            optimization with the options of the last `Fit.optimize` call,
+            to set up its `~iminuit.Minuit` instance.
         **kwargs : dict
             Keyword argument passed ot the confidence estimation method.
 
         Returns
         -------
-        result : dict
-            Dictionary with keys "errp", 'errn", "success" and "nfev".
+        result : dict or list of dict
+            Dictionary with keys "errp", 'errn", "success" and "nfev", or a
+            list of these, ordered like ``parameters``.
         """
+        if parameters is not None:
+            kwargs_list = [
+                dict(
+                    parameter=self._parameters._get_idx(par),
+                    backend=backend,
+                    sigma=sigma,
+                    **kwargs
+                )
+                for par in parameters
+            ]
+            return self._map_parallel("confidence", kwargs_list, n_jobs)
+
         compute = registry.get("confidence", backend)
         parameters = self._parameters
         parameter = parameters[parameter]
@@ -281,6 +367,7 @@ class Fit:
         nvalues=11,
         reoptimize=False,
         optimize_opts=None,
+        n_jobs=1,
     ):
         """Compute likelihood profile.
 
@@ -305,6 +392,13 @@ class Fit:
             Number of parameter grid points to use.
         reoptimize : bool
             Re-optimize other parameters, when computing the likelihood profile.
+        optimize_opts : dict
+            Options passed to `Fit.optimize`, if ``reoptimize=True``.
+        n_jobs : int
+            Number of processes used. Every process works on a copy of the
+            datasets and every profile point starts from the current parameter
+            values, while in a sequential computation the re-optimization
+            starts from the result of the previous point.
 
         Returns
         -------
@@ -326,6 +420,20 @@ class Fit:
 
             values = np.linspace(parmin, parmax, nvalues)
 
+        if n_jobs > 1:
+            kwargs_list = [
+                dict(
+                    parameter=parameters._get_idx(parameter),
+                    values=[value],
+                    reoptimize=reoptimize,
+                    optimize_opts=optimize_opts,
+                )
+                for value in values
+            ]
+            results = self._map_parallel("likelihood_profile", kwargs_list, n_jobs)
+            likelihood = [result["likelihood"][0] for result in results]
+            return {"values": values, "likelihood": np.array(likelihood)}
+
         likelihood = []
         with parameters.restore_values:
             for value in values:
@@ -358,7 +466,7 @@ class Fit:
         """
         raise NotImplementedError
 
-    def minos_contour(self, x, y, numpoints=10, sigma=1.0):
+    def minos_contour(self, x=None, y=None, numpoints=10, sigma=1.0, pairs=None, n_jobs=1):
         """Compute MINOS contour.
 
         Calls ``iminuit.Minuit.mncontour``.
@@ -379,16 +487,38 @@ class Fit:
             Number of contour points
         sigma : float
             Number of standard deviations for the confidence level
+        pairs : list of tuple
+            List of ``(x, y)`` parameter pairs, to compute several contours
+            in one call.
+        n_jobs : int
+            Number of processes used, if ``pairs`` is given. Every process
+            works on a copy of the datasets, and first re-runs the optimization
+            with the options of the last `Fit.optimize` call, to set up its
+            `~iminuit.Minuit` instance.
 
         Returns
         -------
-        result : dict
+        result : dict or list of dict
             Dictionary with keys "x", "y" (Numpy arrays with contour points)
             and a boolean flag "success".
             The result objects from ``mncontour`` are in the additional
-            keys "x_info" and "y_info".
+            keys "x_info" and "y_info". A list of these, ordered like ``pairs``,
+            if ``pairs`` is given.
         """
         parameters = self._parameters
+
+        if pairs is not None:
+            kwargs_list = [
+                dict(
+                    x=parameters._get_idx(x),
+                    y=parameters._get_idx(y),
+                    numpoints=numpoints,
+                    sigma=sigma,
+                )
+                for x, y in pairs
+            ]
+            return self._map_parallel("minos_contour", kwargs_list, n_jobs)
+
         x = parameters[x]
         y = parameters[y]
 
@@ -406,6 +536,65 @@ class Fit:
             "y_info": result["y_info"],
         }
 
+    def _map_parallel(self, method, kwargs_list, n_jobs=1):
+        """Call ``method`` with all kwargs, optionally in a process pool.
+
+        The processes work on copies of the datasets. If ``method`` uses the
+        `~iminuit.Minuit` instance, it is set up in every process by
+        re-running the optimization with the options of the last `optimize`
+        call, starting from the current best-fit values.
+        Results are returned in input order.
+        """
+        if n_jobs == 1:
+            return [getattr(self, method)(**kwargs) for kwargs in kwargs_list]
+
+        backends = [kwargs.get("backend") for kwargs in kwargs_list]
+        uses_minuit = method == "minos_contour" or (
+            method == "confidence" and "minuit" in backends
+        )
+        if uses_minuit:
+            if not hasattr(self, "minuit"):
+                raise RuntimeError("To use minuit, you must first optimize.")
+            optimize_opts = self._minuit_optimize_opts
+        else:
+            optimize_opts = None
+
+        args = [(method, kwargs) for kwargs in kwargs_list]
+        initargs = (self.datasets, optimize_opts)
+        pool = Pool(processes=n_jobs, initializer=_init_worker, initargs=initargs)
+        try:
+            log.info("Using {} jobs to compute {}.".format(n_jobs, method))
+            results = pool.map(_run_worker, args)
+        except BaseException:
+            # don't leave the workers running the remaining tasks
+            pool.terminate()
+            raise
+
+        pool.close()
+        pool.join()
+        return results
+
+
+_worker_fit = None
+
+
+def _init_worker(datasets, optimize_opts):
+    global _worker_fit
+    # the worker processes can't start process pools of their own
+    datasets.n_jobs = 1
+    datasets.instrumentation = None
+    _worker_fit = Fit(datasets)
+
+    if optimize_opts is not None:
+        # starts at the best-fit values, so this converges quickly
+        with _worker_fit._parameters.restore_values:
+            _worker_fit.optimize(**optimize_opts)
+
+
+def _run_worker(args):
+    method, kwargs = args
+    return getattr(_worker_fit, method)(**kwargs)
+
 
 class FitResult:
     """Fit result base class"""
@@ -460,9 +649,10 @@ class CovarianceResult(FitResult):
 class OptimizeResult(FitResult):
     """Optimize result object."""
 
-    def __init__(self, nfev, total_stat, **kwargs):
+    def __init__(self, nfev, total_stat, timing=None, **kwargs):
         self._nfev = nfev
         self._total_stat = total_stat
+        self._timing = timing
         super().__init__(**kwargs)
 
     @property
@@ -475,8 +665,18 @@ class OptimizeResult(FitResult):
         """Value of the fit statistic at minimum."""
         return self._total_stat
 
+    @property
+    def timing(self):
+        """Call counts and wall times of the fit stages (`~astropy.table.Table`).
+
+        None if the fit was not instrumented.
+        """
+        return self._timing
+
     def __repr__(self):
         str_ = super().__repr__()
         str_ += "\tnfev       : {}\n".format(self.nfev)
         str_ += "\ttotal stat : {:.2f}\n".format(self.total_stat)
+        if self.timing is not None:
+            str_ += "\n" + "\n".join(self.timing.pformat(max_lines=-1)) + "\n"
         return str_
@@ -16,8 +16,11 @@ class MinuitLikelihood(Likelihood):
         self.parameters.set_parameter_factors(factors)
         return self.function(self.parameters)
 
+    def grad(self, *factors):
+        return super().grad(factors)
 
-def optimize_iminuit(parameters, function, **kwargs):
+
+def optimize_iminuit(parameters, function, gradient=None, **kwargs):
     """iminuit optimization
 
     Parameters
@@ -26,6 +29,9 @@ def optimize_iminuit(parameters, function, **kwargs):
         Parameters with starting values
     function : callable
         Likelihood function
+    gradient : callable, optional
+        Likelihood gradient function. If given it is passed as ``grad``
+        to `iminuit.Minuit`, instead of using numerical derivatives.
     **kwargs : dict
         Options passed to `iminuit.Minuit` constructor. If there is an entry 'migrad_opts', those options
         will be passed to `iminuit.Minuit.migrad()`.
@@ -43,10 +49,14 @@ def optimize_iminuit(parameters, function, **kwargs):
     kwargs.setdefault("print_level", 0)
     kwargs.update(make_minuit_par_kwargs(parameters))
 
-    minuit_func = MinuitLikelihood(function, parameters)
+    minuit_func = MinuitLikelihood(function, parameters, gradient)
 
     kwargs = kwargs.copy()
     migrad_opts = kwargs.pop("migrad_opts", {})
+
+    if gradient is not None:
+        kwargs.setdefault("grad", minuit_func.grad)
+
     minuit = Minuit(minuit_func.fcn, **kwargs)
     minuit.migrad(**migrad_opts)
 
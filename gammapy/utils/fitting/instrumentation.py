@@ -0,0 +1,202 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Instrumentation of the likelihood evaluation."""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from astropy.table import Table
+from ..scripts import make_path
+
+__all__ = ["Instrumentation"]
+
+
+class Instrumentation:
+    """Record call counts and wall times of the stages of a fit.
+
+    Set it on a `~gammapy.utils.fitting.Fit` to record the stages of the
+    optimization, the likelihood evaluation of every dataset and the
+    npred computation, PSF convolution and energy dispersion of every model
+    component (see the ``instrumentation`` attributes of
+    `~gammapy.utils.fitting.Fit`, `~gammapy.utils.fitting.Datasets`,
+    `~gammapy.cube.MapDataset` and `~gammapy.cube.MapEvaluator`).
+
+    Calls in worker processes of a `~gammapy.utils.fitting.Datasets` with
+    ``parallel_backend="processes"`` are not recorded.
+
+    The stages are nested, e.g. the "npred" stage of a
+    `~gammapy.cube.MapDataset` is part of its "dataset.likelihood" stage. The recorded times of a
+    stage include the times of the stages nested in it, so the times of
+    different stages must not be summed.
+
+    Parameters
+    ----------
+    trace : bool
+        Record every single call, to export them with `write_trace`.
+
+    Examples
+    --------
+    ::
+
+        from gammapy.utils.fitting import Fit, Instrumentation
+
+        fit = Fit(datasets, instrumentation=Instrumentation(trace=True))
+        result = fit.optimize()
+        print(result.timing)
+        fit.instrumentation.write_trace("trace.json")
+    """
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset the recorded counts, times and events."""
+        self._start = time.perf_counter()
+        self._stats = OrderedDict()
+        self._events = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record(self, stage, component=""):
+        """Context manager recording the call count and wall time of a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage, e.g. "npred".
+        component : str
+            Name of the dataset or model component.
+        """
+        return _Record(self, stage, component)
+
+    def _add(self, stage, component, start, stop):
+        with self._lock:
+            stats = self._stats.setdefault((stage, component), [0, 0.0])
+            stats[0] += 1
+            stats[1] += stop - start
+
+            if self.trace:
+                self._events.append(
+                    (stage, component, start, stop, threading.get_ident())
+                )
+
+    def to_table(self):
+        """Call counts and cumulative wall times per stage and component.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Table with columns "stage", "component", "calls", "time" and
+            "time_per_call", sorted by decreasing time. The times are
+            inclusive, i.e. contain the times of nested stages, so they
+            must not be summed over stages.
+        """
+        with self._lock:
+            rows = [key + tuple(value) for key, value in self._stats.items()]
+
+        table = Table(
+            rows=rows or None,
+            names=["stage", "component", "calls", "time"],
+            dtype=[str, str, int, float],
+        )
+        table["time"].unit = "s"
+        table["time_per_call"] = table["time"] / table["calls"]
+        table.sort("time")
+        table.reverse()
+
+        for name in ["time", "time_per_call"]:
+            table[name].format = ".3e"
+
+        return table
+
+    def to_trace(self):
+        """Recorded calls in the Chrome trace event format.
+
+        The result can be loaded with ``chrome://tracing`` or
+        https://ui.perfetto.dev. Requires ``trace=True``.
+
+        Returns
+        -------
+        trace : dict
+            Trace events.
+        """
+        pid = os.getpid()
+
+        with self._lock:
+            events = list(self._events)
+
+        trace_events = []
+        for stage, component, start, stop, tid in events:
+            trace_events.append(
+                {
+                    "name": stage,
+                    "cat": component or stage,
+                    "ph": "X",
+                    "ts": 1e6 * (start - self._start),
+                    "dur": 1e6 * (stop - start),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"component": component},
+                }
+            )
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, filename):
+        """Write recorded calls to a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        filename : str, `~pathlib.Path`
+            Output filename.
+        """
+        if not self.trace:
+            raise ValueError("No calls recorded, set trace=True.")
+
+        with make_path(filename).open("w") as fh:
+            json.dump(self.to_trace(), fh)
+
+
+class _Record:
+    __slots__ = ["instrumentation", "stage", "component", "start"]
+
+    def __init__(self, instrumentation, stage, component):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.component = component
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        stop = time.perf_counter()
+        self.instrumentation._add(self.stage, self.component, self.start, stop)
+
+
+class _NoRecord:
+    __slots__ = []
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_no_record = _NoRecord()
+
+
+def record(instrumentation, stage, component=""):
+    """Record a stage with ``instrumentation``, if it is not None."""
+    if instrumentation is None:
+        return _no_record
+    return instrumentation.record(stage, component)
@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
 
 __all__ = ["Likelihood"]
 
@@ -21,12 +22,29 @@ class Likelihood:
         Parameters with starting values
     function : callable
         Likelihood function
+    gradient : callable, optional
+        Derivatives of the likelihood function w.r.t. the parameter values,
+        ordered like ``parameters.parameters``.
     """
 
-    def __init__(self, function, parameters):
+    def __init__(self, function, parameters, gradient=None):
         self.function = function
         self.parameters = parameters
+        self.gradient = gradient
 
     def fcn(self, factors):
         self.parameters.set_parameter_factors(factors)
         return self.function(self.parameters)
+
+    def grad(self, factors):
+        self.parameters.set_parameter_factors(factors)
+        gradient = self.gradient(self.parameters)
+
+        # value = factor x scale, so the derivative w.r.t. the factor is scaled
+        return np.array(
+            [
+                value * par.scale
+                for par, value in zip(self.parameters.parameters, gradient)
+                if not par.frozen
+            ]
+        )
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import copy
+import astropy.units as u
 from .parameter import Parameters
 
 __all__ = ["Model"]
@@ -26,6 +27,34 @@ class Model:
         """A deep copy."""
         return copy.deepcopy(self)
 
+    def _numerical_gradient(self, function, *args, eps=1e-4):
+        """Derivatives of ``function(*args)`` w.r.t. the parameter values.
+
+        Computed by central finite differences, with a step size of ``eps``
+        times the parameter value. The derivatives are returned as a list
+        ordered like ``parameters.parameters``, entries of frozen parameters
+        are None.
+        """
+        gradient = []
+        for par in self.parameters.parameters:
+            if par.frozen:
+                gradient.append(None)
+                continue
+
+            value = par.value
+            step = eps * abs(value) if value != 0 else eps
+            try:
+                par.value = value + step
+                upper = function(*args)
+                par.value = value - step
+                lower = function(*args)
+            finally:
+                par.value = value
+
+            gradient.append((upper - lower) / (2 * step * u.Unit(par.unit)))
+
+        return gradient
+
     def __str__(self):
         ss = self.__class__.__name__
         ss += "\n\nParameters: \n\n\t"
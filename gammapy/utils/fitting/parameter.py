@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Model parameter classes."""
 import copy
+import threading
 import numpy as np
 from astropy import units as u
 from astropy.units.core import UnitConversionError
@@ -10,6 +11,117 @@ from ..array import check_type
 __all__ = ["Parameter", "Parameters"]
 
 
+class _ParameterStore:
+    """Contiguous storage of the numerical attributes of all parameters.
+
+    Every `Parameter` is a view on one slot of these arrays. As the storage
+    is shared by all parameters, `Parameters` can read and write the
+    attributes of its members with vectorized operations, no matter how
+    many other `Parameters` share a parameter.
+
+    Slots are allocated when a parameter is created and released when it
+    is garbage collected. Growing the storage replaces the arrays. Writes
+    don't take the lock: `set` checks a generation counter that `_grow`
+    bumps before and after replacing the arrays, and repeats the write under
+    the lock if it may have gone to the old arrays.
+    """
+
+    _fields = ["factor", "scale", "min", "max", "frozen"]
+
+    def __init__(self, size=256):
+        self.factor = np.zeros(size)
+        self.scale = np.ones(size)
+        self.min = np.full(size, np.nan)
+        self.max = np.full(size, np.nan)
+        self.frozen = np.zeros(size, dtype=bool)
+        self._free = list(range(size - 1, -1, -1))
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def allocate(self):
+        with self._lock:
+            if not self._free:
+                self._grow()
+            return self._free.pop()
+
+    def release(self, idx):
+        with self._lock:
+            self._free.append(idx)
+
+    def set(self, name, idx, value):
+        """Set values of the field ``name`` at the slots ``idx``."""
+        generation = self._generation
+        getattr(self, name)[idx] = value
+
+        # the arrays may have been replaced by a concurrent `_grow`
+        if generation % 2 or generation != self._generation:
+            with self._lock:
+                getattr(self, name)[idx] = value
+
+    def _grow(self):
+        # called with the lock held
+        self._generation += 1
+        size = len(self.factor)
+        for name in self._fields:
+            data = getattr(self, name)
+            setattr(self, name, np.concatenate([data, np.zeros_like(data)]))
+        self._free.extend(range(2 * size - 1, size - 1, -1))
+        self._generation += 1
+
+
+_store = _ParameterStore()
+
+
+def _resets_idx(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._idx = None
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class _ParameterList(list):
+    """List of `Parameter` that caches the slot indices of its members.
+
+    The methods that modify the list reset the cache, so `Parameters` can
+    use the cached index array without checking the members on every call.
+    """
+
+    __slots__ = ["_idx"]
+
+    def __init__(self, parameters=()):
+        super().__init__(parameters)
+        self._idx = None
+
+    def __reduce__(self):
+        # copies of the parameters have different slots
+        return self.__class__, (list(self),)
+
+    __setitem__ = _resets_idx("__setitem__")
+    __delitem__ = _resets_idx("__delitem__")
+    __iadd__ = _resets_idx("__iadd__")
+    __imul__ = _resets_idx("__imul__")
+    append = _resets_idx("append")
+    extend = _resets_idx("extend")
+    insert = _resets_idx("insert")
+    pop = _resets_idx("pop")
+    remove = _resets_idx("remove")
+    clear = _resets_idx("clear")
+    sort = _resets_idx("sort")
+    reverse = _resets_idx("reverse")
+
+
+def _as_float(value):
+    # unset limits are returned as the ``np.nan`` object, so ``par.min is np.nan`` works
+    return np.nan if np.isnan(value) else float(value)
+
+
 class Parameter:
     """A model parameter.
 
@@ -45,11 +157,12 @@ class Parameter:
         Frozen? (used in fitting)
     """
 
-    __slots__ = ["_name", "_factor", "_scale", "_unit", "_min", "_max", "_frozen"]
+    __slots__ = ["_name", "_unit", "_idx"]
 
     def __init__(
         self, name, factor, unit="", scale=1, min=np.nan, max=np.nan, frozen=False
     ):
+        self._idx = _store.allocate()
         self.name = name
         self.scale = scale
 
@@ -74,23 +187,42 @@ class Parameter:
     def name(self, val):
         self._name = check_type(val, "str")
 
+    def __del__(self):
+        try:
+            _store.release(self._idx)
+        except (AttributeError, TypeError):
+            # parameter was never initialised, or interpreter shutdown
+            pass
+
+    def __getstate__(self):
+        state = self.to_dict()
+        state.pop("value")
+        state["unit"] = self.unit
+        return state
+
+    def __setstate__(self, state):
+        # copies and unpickled parameters get a slot of their own
+        self._idx = _store.allocate()
+        for name in ["name", "unit", "scale", "factor", "min", "max", "frozen"]:
+            setattr(self, name, state[name])
+
     @property
     def factor(self):
         """Factor (float)."""
-        return self._factor
+        return _store.factor.item(self._idx)
 
     @factor.setter
     def factor(self, val):
-        self._factor = float(val)
+        _store.set("factor", self._idx, float(val))
 
     @property
     def scale(self):
         """Scale (float)."""
-        return self._scale
+        return _store.scale.item(self._idx)
 
     @scale.setter
     def scale(self, val):
-        self._scale = float(val)
+        _store.set("scale", self._idx, float(val))
 
     @property
     def unit(self):
@@ -104,11 +236,11 @@ class Parameter:
     @property
     def min(self):
         """Minimum (float)."""
-        return self._min
+        return _as_float(_store.min.item(self._idx))
 
     @min.setter
     def min(self, val):
-        self._min = float(val)
+        _store.set("min", self._idx, float(val))
 
     @property
     def factor_min(self):
@@ -121,11 +253,11 @@ class Parameter:
     @property
     def max(self):
         """Maximum (float)."""
-        return self._max
+        return _as_float(_store.max.item(self._idx))
 
     @max.setter
     def max(self, val):
-        self._max = float(val)
+        _store.set("max", self._idx, float(val))
 
     @property
     def factor_max(self):
@@ -138,20 +270,22 @@ class Parameter:
     @property
     def frozen(self):
         """Frozen? (used in fitting) (bool)."""
-        return self._frozen
+        return _store.frozen.item(self._idx)
 
     @frozen.setter
     def frozen(self, val):
-        self._frozen = check_type(val, "bool")
+        _store.set("frozen", self._idx, check_type(val, "bool"))
 
     @property
     def value(self):
         """Value = factor x scale (float)."""
-        return self._factor * self._scale
+        idx = self._idx
+        return _store.factor.item(idx) * _store.scale.item(idx)
 
     @value.setter
     def value(self, val):
-        self._factor = float(val) / self._scale
+        idx = self._idx
+        _store.set("factor", idx, float(val) / _store.scale[idx])
 
     @property
     def quantity(self):
@@ -244,10 +378,32 @@ class Parameters:
         if parameters is None:
             parameters = []
 
-        self._parameters = self._filter_unique_parameters(parameters)
+        self.parameters = self._filter_unique_parameters(parameters)
         self.covariance = covariance
         self.apply_autoscale = apply_autoscale
 
+    @property
+    def _idx(self):
+        """Slot indices of the parameters in the parameter storage (`~numpy.ndarray`)."""
+        parameters = self._parameters
+        idx = parameters._idx
+
+        if idx is None:
+            idx = np.array([par._idx for par in parameters], dtype=int)
+            idx.flags.writeable = False
+            parameters._idx = idx
+
+        return idx
+
+    @property
+    def _frozen(self):
+        return _store.frozen[self._idx]
+
+    @property
+    def _free_idx(self):
+        idx = self._idx
+        return idx[~_store.frozen[idx]]
+
     @staticmethod
     def _filter_unique_parameters(parameters):
         """Filter unique parameters from a list of parameters"""
@@ -276,12 +432,13 @@ class Parameters:
     @property
     def free_parameters(self):
         """List of free parameters"""
-        return [par for par in self.parameters if not par.frozen]
+        frozen = self._frozen
+        return [par for par, frozen in zip(self._parameters, frozen) if not frozen]
 
     # TODO: replace this with a better API to update parameters
     @parameters.setter
     def parameters(self, vals):
-        self._parameters = vals
+        self._parameters = _ParameterList(vals)
 
     @property
     def names(self):
@@ -462,28 +619,31 @@ class Parameters:
         return self.covariance / np.outer(err, err)
 
     def set_parameter_factors(self, factors):
-        """Set factor of all parameters.
+        """Set factor of all free parameters.
 
         Used in the optimizer interface.
         """
-        idx = 0
-        for parameter in self.parameters:
-            if not parameter.frozen:
-                parameter.factor = factors[idx]
-                idx += 1
+        idx = self._free_idx
+        factors = np.asarray(factors, dtype=float)
+
+        if factors.shape != idx.shape:
+            raise ValueError(
+                "Got {} factors for {} free parameters".format(factors.size, len(idx))
+            )
+
+        _store.set("factor", idx, factors)
 
     @property
     def _scale_matrix(self):
-        scales = [par.scale for par in self.parameters]
+        scales = _store.scale[self._idx]
         return np.outer(scales, scales)
 
     def _expand_factor_matrix(self, matrix):
         """Expand covariance matrix with zeros for frozen parameters"""
         shape = (len(self.parameters), len(self.parameters))
         matrix_expanded = np.zeros(shape)
-        mask = np.array([par.frozen for par in self.parameters])
-        free_parameters = ~(mask | mask[:, np.newaxis])
-        matrix_expanded[free_parameters] = matrix.ravel()
+        free = np.flatnonzero(~self._frozen)
+        matrix_expanded[np.ix_(free, free)] = np.reshape(matrix, (len(free), len(free)))
         return matrix_expanded
 
     def set_covariance_factors(self, matrix):
@@ -506,8 +666,20 @@ class Parameters:
         method : {'factor1', 'scale10'}
             Method to apply
         """
-        for par in self.parameters:
-            par.autoscale(method)
+        idx = self._idx
+        value = _store.factor[idx] * _store.scale[idx]
+
+        if method == "scale10":
+            nonzero = value != 0
+            idx, value = idx[nonzero], value[nonzero]
+            scale = np.power(10.0, np.floor(np.log10(np.abs(value))))
+            _store.set("factor", idx, value / scale)
+            _store.set("scale", idx, scale)
+        elif method == "factor1":
+            _store.set("factor", idx, 1)
+            _store.set("scale", idx, value)
+        else:
+            raise ValueError("Invalid method: {}".format(method))
 
     @property
     def restore_values(self):
@@ -532,13 +704,14 @@ class Parameters:
 class restore_parameters_values:
     def __init__(self, parameters):
         self.parameters = parameters
-        self.values = [_.value for _ in parameters]
-        self.frozen = [_.frozen for _ in parameters]
+        self.idx = parameters._idx
+        self.values = _store.factor[self.idx] * _store.scale[self.idx]
+        self.frozen = _store.frozen[self.idx]
 
     def __enter__(self):
         pass
 
     def __exit__(self, type, value, traceback):
-        for value, par, frozen in zip(self.values, self.parameters, self.frozen):
-            par.value = value
-            par.frozen = frozen
+        idx = self.idx
+        _store.set("factor", idx, self.values / _store.scale[idx])
+        _store.set("frozen", idx, self.frozen)
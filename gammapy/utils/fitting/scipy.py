@@ -7,7 +7,7 @@ from .likelihood import Likelihood
 __all__ = ["optimize_scipy", "covariance_scipy", "confidence_scipy"]
 
 
-def optimize_scipy(parameters, function, **kwargs):
+def optimize_scipy(parameters, function, gradient=None, **kwargs):
     method = kwargs.pop("method", "Nelder-Mead")
     pars = [par.factor for par in parameters.free_parameters]
 
@@ -17,7 +17,11 @@ def optimize_scipy(parameters, function, **kwargs):
         parmax = par.factor_max if not np.isnan(par.factor_max) else None
         bounds.append((parmin, parmax))
 
-    likelihood = Likelihood(function, parameters)
+    likelihood = Likelihood(function, parameters, gradient)
+
+    if gradient is not None:
+        kwargs.setdefault("jac", likelihood.grad)
+
     result = minimize(likelihood.fcn, pars, bounds=bounds, method=method, **kwargs)
 
     factors = result.x
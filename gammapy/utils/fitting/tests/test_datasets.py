@@ -4,6 +4,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 from .test_fit import MyDataset
 from ..datasets import Datasets
+from ..instrumentation import Instrumentation
 
 
 @pytest.fixture(scope="session")
@@ -24,3 +25,40 @@ class TestDatasets:
     @staticmethod
     def test_str(datasets):
         assert "MyDataset: 2" in str(datasets)
+
+
+@pytest.mark.parametrize("parallel_backend", ["threads", "processes"])
+def test_likelihood_parallel(parallel_backend):
+    datasets = [MyDataset() for _ in range(5)]
+    for idx, dataset in enumerate(datasets):
+        dataset.parameters["x"].value = 1 + 0.1 * idx
+
+    expected = Datasets(datasets).likelihood()
+
+    with Datasets(datasets, n_jobs=2, parallel_backend=parallel_backend) as joint:
+        assert_allclose(joint.likelihood(), expected, rtol=0)
+
+        # parameter values are passed to the workers
+        datasets[3].parameters["y"].value = 301
+        assert_allclose(joint.likelihood(), expected + 1, rtol=1e-12)
+
+    assert joint._pool is None
+
+
+def test_likelihood_processes_instrumentation():
+    instrumentation = Instrumentation()
+    datasets = [MyDataset() for _ in range(3)]
+
+    expected = Datasets(datasets).likelihood()
+
+    with Datasets(
+        datasets, n_jobs=2, parallel_backend="processes", instrumentation=instrumentation
+    ) as joint:
+        assert_allclose(joint.likelihood(), expected, rtol=0)
+        assert_allclose(joint.likelihood(), expected, rtol=0)
+
+    # the dataset evaluations in the worker processes are not recorded
+    table = instrumentation.to_table()
+    assert list(table["stage"]) == ["likelihood"]
+    assert list(table["calls"]) == [2]
+    assert joint.instrumentation is instrumentation
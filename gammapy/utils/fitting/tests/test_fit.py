@@ -1,10 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Unit tests for the Fit class"""
+import json
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 from ..parameter import Parameter, Parameters
 from ..model import Model
+from ..datasets import Dataset
 from ..fit import Fit
+from ..instrumentation import Instrumentation
 from ...testing import requires_dependency
 
 pytest.importorskip("iminuit")
@@ -31,6 +35,11 @@ class MyDataset:
         x_opt, y_opt, z_opt = 2, 3e2, 4e-2
         return (x - x_opt) ** 2 + (y - y_opt) ** 2 + (z - z_opt) ** 2
 
+    def likelihood_gradient(self, parameters, mask=None):
+        x, y, z = [p.value for p in self.model.parameters]
+        x_opt, y_opt, z_opt = 2, 3e2, 4e-2
+        return np.array([2 * (x - x_opt), 2 * (y - y_opt), 2 * (z - z_opt)])
+
 
 @pytest.mark.parametrize("backend", ["minuit"])
 def test_run(backend):
@@ -56,6 +65,72 @@ def test_run(backend):
     assert_allclose(pars.correlation[1, 2], 0, atol=1e-7)
 
 
+@pytest.mark.parametrize("backend", ["minuit", "scipy"])
+def test_optimize_gradient(backend):
+    dataset = MyDataset()
+    fit = Fit(dataset)
+    kwargs = {"method": "L-BFGS-B"} if backend == "scipy" else {}
+    result = fit.optimize(backend=backend, use_gradient=True, **kwargs)
+    pars = dataset.parameters
+
+    assert result.success is True
+
+    assert_allclose(pars["x"].value, 2, rtol=1e-3)
+    assert_allclose(pars["y"].value, 3e2, rtol=1e-3)
+    assert_allclose(pars["z"].value, 4e-2, rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        fit.optimize(backend="sherpa", use_gradient=True)
+
+
+class MyDatasetNoGradient(Dataset):
+    def __init__(self):
+        self.dataset = MyDataset()
+        self.parameters = self.dataset.parameters
+        self.data_shape = (1,)
+
+    def likelihood(self, parameters, mask=None):
+        return self.dataset.likelihood(parameters, mask)
+
+    def likelihood_per_bin(self):
+        pass
+
+
+def test_optimize_gradient_not_supported():
+    dataset = MyDatasetNoGradient()
+    fit = Fit([MyDataset(), dataset])
+
+    with pytest.raises(ValueError, match="MyDatasetNoGradient"):
+        fit.optimize(backend="minuit", use_gradient=True)
+
+    result = fit.optimize(backend="minuit")
+    assert result.success is True
+
+
+def test_instrumentation(tmpdir):
+    dataset = MyDataset()
+    fit = Fit(dataset, instrumentation=Instrumentation(trace=True))
+    result = fit.optimize()
+
+    table = result.timing
+    assert set(table["stage"]) == {"optimize", "likelihood", "dataset.likelihood"}
+
+    row = table[table["stage"] == "dataset.likelihood"][0]
+    assert row["component"] == "MyDataset[0]"
+    assert row["calls"] > result.nfev
+    assert row["time"] > 0
+
+    filename = str(tmpdir / "trace.json")
+    fit.instrumentation.write_trace(filename)
+    with open(filename) as fh:
+        trace = json.load(fh)
+
+    assert len(trace["traceEvents"]) == table["calls"].sum()
+    assert trace["traceEvents"][0]["ph"] == "X"
+
+    assert Fit(dataset).optimize().timing is None
+
+
 @requires_dependency("sherpa")
 @pytest.mark.parametrize("backend", ["minuit", "sherpa", "scipy"])
 def test_optimize(backend):
@@ -149,3 +224,42 @@ def test_minos_contour():
 
     # Check that original value state wasn't changed
     assert_allclose(dataset.parameters["x"].value, 2)
+
+
+def test_fit_parallel_optimize_opts():
+    fit = Fit(MyDataset())
+
+    with pytest.raises(RuntimeError):
+        fit.confidence(parameters=["x", "z"], n_jobs=2)
+
+    fit.optimize(migrad_opts={"ncall": 1000})
+    assert fit._minuit_optimize_opts == {
+        "backend": "minuit", "use_gradient": False, "migrad_opts": {"ncall": 1000}
+    }
+
+    results = fit.confidence(parameters=["x", "z"], n_jobs=2)
+    assert_allclose(results[0]["errp"], 1, rtol=1e-5)
+
+
+def test_fit_parallel():
+    dataset = MyDataset()
+    fit = Fit(dataset)
+    fit.run()
+
+    result = fit.likelihood_profile("x", nvalues=3, reoptimize=True, n_jobs=2)
+    assert_allclose(result["values"], [0, 2, 4], atol=1e-7)
+    assert_allclose(result["likelihood"], [4, 0, 4], atol=1e-7)
+
+    results = fit.confidence(parameters=["x", "z"], n_jobs=2)
+    assert len(results) == 2
+    for result in results:
+        assert result["success"] is True
+        assert_allclose(result["errp"], 1, rtol=1e-5)
+        assert_allclose(result["errn"], 1, rtol=1e-5)
+
+    results = fit.minos_contour(pairs=[("x", "y"), ("y", "z")], n_jobs=2)
+    assert_allclose(results[0]["x"][0], 1, rtol=1e-5)
+    assert_allclose(results[1]["x"][0], 299, rtol=1e-5)
+
+    # Check that original value state wasn't changed
+    assert_allclose(dataset.parameters["x"].value, 2)
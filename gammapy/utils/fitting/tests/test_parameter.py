@@ -1,8 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
+import pickle
+import threading
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 from .. import Parameter, Parameters
+from ..parameter import _ParameterStore
 
 
 def test_parameter_init():
@@ -148,6 +152,31 @@ def test_parameters_set_parameter_factors(pars):
     assert_allclose(pars["ham"].scale, 1)
 
 
+def test_parameters_set_parameter_factors_invalid(pars):
+    with pytest.raises(ValueError):
+        pars.set_parameter_factors([77, 78, 79])
+
+    with pytest.raises(ValueError):
+        pars.set_parameter_factors([77])
+
+
+def test_parameters_replace_parameter(pars):
+    pars.set_parameter_factors([1, 2])
+    par = Parameter("eggs", 3)
+    pars.parameters[0] = par
+
+    pars.set_parameter_factors([77, 78])
+    assert par.factor == 77
+    assert pars["ham"].factor == 78
+
+    # the slot indices are cached until the list is modified
+    assert pars._idx is pars._idx
+    par = Parameter("bacon", 4)
+    pars.parameters.append(par)
+    pars.set_parameter_factors([1, 2, 3])
+    assert par.factor == 3
+
+
 def test_parameters_set_covariance_factors(pars):
     cov_factor = np.array([[3, 4], [7, 8]])
     pars.set_covariance_factors(cov_factor)
@@ -159,3 +188,85 @@ def test_parameters_autoscale():
     pars.autoscale()
     assert_allclose(pars[0].factor, 2)
     assert_allclose(pars[0].scale, 10)
+
+
+@pytest.mark.parametrize("method", ["scale10", "factor1"])
+def test_parameters_autoscale_vectorized(method):
+    values = [2e-10, -3e12, 0, 42.0, 9e35]
+    pars = Parameters([Parameter("", value) for value in values])
+    pars[1].frozen = True
+    pars.autoscale(method)
+
+    for par, value in zip(pars.parameters, values):
+        expected = Parameter("", value)
+        expected.autoscale(method)
+        assert par.factor == expected.factor
+        assert par.scale == expected.scale
+
+
+def test_parameters_frozen_factors():
+    pars = Parameters([Parameter("a", 1), Parameter("b", 2), Parameter("c", 3)])
+    pars["b"].frozen = True
+    assert [par.name for par in pars.free_parameters] == ["a", "c"]
+
+    pars.set_parameter_factors([10, 30])
+    assert_allclose([par.factor for par in pars.parameters], [10, 2, 30])
+
+    matrix = pars._expand_factor_matrix(np.array([[1, 2], [3, 4]]))
+    assert_allclose(matrix, [[1, 0, 2], [0, 0, 0], [3, 0, 4]])
+
+    with pars.restore_values:
+        pars["a"].value = 99
+        pars["c"].frozen = True
+    assert_allclose(pars["a"].value, 10)
+    assert pars["c"].frozen is False
+
+
+def test_parameter_copy_independent():
+    par = Parameter("spam", 42, "deg", scale=10, min=0, frozen=True)
+    pars = Parameters([par])
+
+    for par_copy in [copy.deepcopy(par), pickle.loads(pickle.dumps(par))]:
+        assert par_copy.to_dict() == par.to_dict()
+        par_copy.value = 3
+        assert par.value == 420
+
+    pars_copy = pars.copy()
+    pars_copy.set_parameter_factors([])
+    pars_copy[0].frozen = False
+    pars_copy.set_parameter_factors([5])
+    assert pars_copy[0].value == 50
+    assert par.value == 420
+
+
+def test_parameter_store_write_during_grow(monkeypatch):
+    # a write to the old arrays while `_grow` replaces them must not be lost
+    from .. import parameter
+
+    store = _ParameterStore(size=1)
+    idx = store.allocate()
+    copied, written = threading.Event(), threading.Event()
+
+    class _Numpy:
+        def __getattr__(self, name):
+            return getattr(np, name)
+
+        @staticmethod
+        def concatenate(arrays):
+            result = np.concatenate(arrays)
+            if not copied.is_set():
+                copied.set()
+                # let the main thread write to the old arrays
+                written.wait(timeout=0.1)
+            return result
+
+    monkeypatch.setattr(parameter, "np", _Numpy())
+
+    thread = threading.Thread(target=store.allocate)
+    thread.start()
+    copied.wait()
+    store.set("factor", idx, 42)
+    written.set()
+    thread.join()
+
+    assert store.factor[idx] == 42